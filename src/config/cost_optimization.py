@@ -3,7 +3,9 @@ Cost Optimization Configuration
 비용 친화적인 AI 서비스 설정 (최신 연구 기반)
 """
 
+import bisect
 from typing import Optional
+import numpy as np
 from src.config.env import EnvConfig
 
 
@@ -27,9 +29,19 @@ class CostOptimizationConfig:
 
     # 기본 임베딩 모델 (비용 효율적)
     EMBEDDING_MODEL = "text-embedding-3-small"  # 1536차원, 비용 효율적
-
-    # 배치 처리 설정
-    EMBEDDING_BATCH_SIZE = 100  # OpenAI 최대 배치 크기 (비용 50% 절감)
+    # 실제 사용 모델 (환경 변수 우선, EnvConfig는 import 시점에 고정되므로 한 번만 조회)
+    RESOLVED_EMBEDDING_MODEL = getattr(EnvConfig, "EMBEDDING_MODEL", EMBEDDING_MODEL)
+
+    # 모델별 가격표 (USD / 1M tokens): (일반, 배치)
+    EMBEDDING_PRICES = {
+        "text-embedding-3-small": (0.02, 0.01),
+        "text-embedding-3-large": (0.13, 0.065),
+    }
+    DEFAULT_EMBEDDING_PRICE = (0.02, 0.02)  # 가격표에 없는 모델
+
+    # 배치 처리 설정 (개수 + 토큰 예산으로 묶음, 비용 50% 절감)
+    EMBEDDING_BATCH_SIZE = 2048  # OpenAI 요청당 최대 입력 수
+    EMBEDDING_MAX_BATCH_TOKENS = 280_000  # 요청당 토큰 한도(300k)에 여유를 둔 값
     EMBEDDING_BATCH_DELAY = 0.1  # 배치 간 지연 (초)
 
     # ============================================
@@ -46,6 +58,10 @@ class CostOptimizationConfig:
     MIN_CHUNK_SIZE = 256  # 최소 청크 크기 (토큰)
     MAX_CHUNK_SIZE = 1024  # 최대 청크 크기 (토큰)
 
+    # 텍스트 길이 구간별 청크 크기 (정렬된 경계값, 환경 변수로 변경 가능)
+    CHUNK_SIZE_THRESHOLDS = EnvConfig.CHUNK_SIZE_THRESHOLDS  # (1000, 5000)
+    CHUNK_SIZE_TIERS = EnvConfig.CHUNK_SIZE_TIERS  # (500, 2000, 4000)
+
     # ============================================
     # 캐싱 전략 (비용 절감)
     # ============================================
@@ -80,7 +96,7 @@ class CostOptimizationConfig:
     @classmethod
     def get_embedding_model(cls) -> str:
         """임베딩 모델 반환 (환경 변수 우선)"""
-        return getattr(EnvConfig, "EMBEDDING_MODEL", cls.EMBEDDING_MODEL)
+        return cls.RESOLVED_EMBEDDING_MODEL
 
     @classmethod
     def should_use_batch(cls, count: int) -> bool:
@@ -99,17 +115,32 @@ class CostOptimizationConfig:
         Returns:
             예상 비용 (USD)
         """
-        model = cls.get_embedding_model()
-
-        if model == "text-embedding-3-small":
-            price_per_million = 0.01 if use_batch else 0.02
-        elif model == "text-embedding-3-large":
-            price_per_million = 0.065 if use_batch else 0.13
-        else:
-            price_per_million = 0.02  # 기본값
+        standard_price, batch_price = cls.EMBEDDING_PRICES.get(
+            cls.get_embedding_model(), cls.DEFAULT_EMBEDDING_PRICE
+        )
+        price_per_million = batch_price if use_batch else standard_price
 
         return (tokens / 1_000_000) * price_per_million
 
+    @classmethod
+    def estimate_cost_batch(cls, tokens: np.ndarray, use_batch: bool = True) -> np.ndarray:
+        """
+        문서 여러 개의 비용 일괄 추정 (USD, 벡터 연산)
+
+        Args:
+            tokens: 문서별 토큰 수 배열
+            use_batch: 배치 처리 여부
+
+        Returns:
+            문서별 예상 비용 배열 (USD)
+        """
+        standard_price, batch_price = cls.EMBEDDING_PRICES.get(
+            cls.get_embedding_model(), cls.DEFAULT_EMBEDDING_PRICE
+        )
+        price_per_million = batch_price if use_batch else standard_price
+
+        return np.asarray(tokens, dtype=np.float64) / 1_000_000 * price_per_million
+
     @classmethod
     def get_optimal_chunk_size(cls, text_length: int) -> int:
         """
@@ -121,10 +152,23 @@ class CostOptimizationConfig:
         Returns:
             최적 청크 크기 (문자 수)
         """
-        # 짧은 텍스트는 작은 청크, 긴 텍스트는 큰 청크
-        if text_length < 1000:
-            return 500
-        elif text_length < 5000:
-            return cls.CHUNK_SIZE_CHARS
-        else:
-            return min(cls.CHUNK_SIZE_CHARS * 2, 4000)
+        # 짧은 텍스트는 작은 청크, 긴 텍스트는 큰 청크 (구간 테이블 이진 탐색)
+        return cls.CHUNK_SIZE_TIERS[
+            bisect.bisect_right(cls.CHUNK_SIZE_THRESHOLDS, text_length)
+        ]
+
+    @classmethod
+    def get_optimal_chunk_size_batch(cls, text_lengths: np.ndarray) -> np.ndarray:
+        """
+        텍스트 길이 배열에 대한 최적 청크 크기 일괄 계산 (대량 인덱싱용)
+
+        Args:
+            text_lengths: 텍스트 길이 배열 (문자 수)
+
+        Returns:
+            최적 청크 크기 배열 (문자 수)
+        """
+        tiers = np.asarray(cls.CHUNK_SIZE_TIERS)
+        return tiers[
+            np.searchsorted(cls.CHUNK_SIZE_THRESHOLDS, text_lengths, side="right")
+        ]
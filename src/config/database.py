@@ -8,6 +8,8 @@ AI 서비스는 HTTP API를 통해 메인 백엔드와 통신
 from typing import Optional
 from loguru import logger
 
+from src.config.env import EnvConfig
+
 # 실제 구현은 메인 백엔드와의 통신으로 처리
 # 이 파일은 향후 직접 DB 연결 시 사용할 수 있도록 준비
 
@@ -15,16 +17,15 @@ from loguru import logger
 class DatabaseConfig:
     """데이터베이스 설정"""
 
-    # 메인 백엔드 API URL
-    BACKEND_API_URL: Optional[str] = None
+    # 메인 백엔드 API URL (환경 변수에서 가져오거나 기본값 사용, import 시점에 한 번만 조회)
+    BACKEND_API_URL: Optional[str] = getattr(
+        EnvConfig, "BACKEND_API_URL", "http://localhost:3001"
+    )
 
     @classmethod
     def get_backend_url(cls) -> str:
         """메인 백엔드 API URL 반환"""
-        from src.config.env import EnvConfig
-
-        # 환경 변수에서 가져오거나 기본값 사용
-        return getattr(EnvConfig, "BACKEND_API_URL", "http://localhost:3001")
+        return cls.BACKEND_API_URL
 
     @classmethod
     async def execute_in_transaction(cls, operation):
@@ -5,11 +5,28 @@ Environment Configuration
 
 import os
 from dotenv import load_dotenv
+from loguru import logger
 from pathlib import Path
 
 # .env 파일 로드 (프로젝트 루트에서)
+# 프로세스당 1회만 파싱: reload/멀티 워커 자식 프로세스는 부모의 환경 변수를 상속하므로 재파싱 불필요
+# 컨테이너처럼 .env 없이 환경 변수를 주입하는 경우 파일 IO 생략
+_ENV_LOADED_FLAG = "_INSIGHTSTOCK_ENV_LOADED"
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+if not os.environ.get(_ENV_LOADED_FLAG):
+    if env_path.is_file():
+        load_dotenv(dotenv_path=env_path)
+    os.environ[_ENV_LOADED_FLAG] = "1"
+
+
+def _int_tuple_env(name: str, default: str) -> tuple[int, ...]:
+    """쉼표로 구분된 정수 목록 환경 변수 (형식이 잘못되면 경고 후 기본값 사용)"""
+    value = os.getenv(name, default)
+    try:
+        return tuple(int(v) for v in value.split(","))
+    except ValueError:
+        logger.warning(f"Invalid {name}={value!r}, using default {default!r}")
+        return tuple(int(v) for v in default.split(","))
 
 
 class EnvConfig:
@@ -36,6 +53,16 @@ class EnvConfig:
     REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
     REDIS_DB = int(os.getenv("REDIS_DB", "0"))  # AI 서비스 전용 DB
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))  # 커넥션 풀 크기
+
+    # 프로세스 내 L1 캐시 (Redis 앞단)
+    LOCAL_CACHE_MAX_SIZE = int(os.getenv("LOCAL_CACHE_MAX_SIZE", "10000"))
+    LOCAL_CACHE_TTL = int(os.getenv("LOCAL_CACHE_TTL", "300"))  # 초
+
+    # 챗 저장 워커 (멀티 프로세스 배포 시 웹 워커에서는 끄고 별도 프로세스로 실행 가능)
+    RUN_CHAT_WORKER = os.getenv("RUN_CHAT_WORKER", "true").lower() == "true"
+    WORKER_BATCH_SIZE = int(os.getenv("WORKER_BATCH_SIZE", "10"))
+    WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "8"))  # 동시 저장 작업 수
 
     # Server
     PORT = int(os.getenv("PORT", 3002))
@@ -53,6 +80,11 @@ class EnvConfig:
         "EMBEDDING_MODEL", "text-embedding-3-small"
     )  # 비용 효율적
 
+    # 적응형 청킹 구간 (텍스트 길이 경계 → 청크 크기, 문자 수)
+    # 구간 수 = 경계 수 + 1 (예: <1000 → 500, <5000 → 2000, 그 이상 → 4000)
+    CHUNK_SIZE_THRESHOLDS = _int_tuple_env("CHUNK_SIZE_THRESHOLDS", "1000,5000")
+    CHUNK_SIZE_TIERS = _int_tuple_env("CHUNK_SIZE_TIERS", "500,2000,4000")
+
     @classmethod
     def validate(cls) -> list[str]:
         """필수 환경 변수 검증"""
@@ -74,3 +106,18 @@ class EnvConfig:
             )
 
         return missing
+
+    @classmethod
+    def validate_config(cls) -> list[str]:
+        """설정 값 검증 (누락이 아닌 잘못된 조합/순서)"""
+        errors = []
+
+        # 청킹 구간 설정 검증 (경계는 bisect로 조회하므로 오름차순이어야 함)
+        if len(cls.CHUNK_SIZE_TIERS) != len(cls.CHUNK_SIZE_THRESHOLDS) + 1:
+            errors.append(
+                "CHUNK_SIZE_TIERS must have exactly one more entry than CHUNK_SIZE_THRESHOLDS"
+            )
+        if list(cls.CHUNK_SIZE_THRESHOLDS) != sorted(cls.CHUNK_SIZE_THRESHOLDS):
+            errors.append("CHUNK_SIZE_THRESHOLDS must be in ascending order")
+
+        return errors
@@ -4,42 +4,55 @@ Redis Configuration
 """
 
 import redis
+import redis.asyncio as aioredis
 from loguru import logger
 from src.config.env import EnvConfig
 
 _redis_client: redis.Redis | None = None
+_redis_pool: redis.ConnectionPool | None = None
+_async_redis_client: aioredis.Redis | None = None
+
+
+def _pool_params() -> dict:
+    """Redis 커넥션 풀 파라미터 (동기/비동기 공용)"""
+    # 대여 시마다 ping하지 않고 health_check_interval로만 유휴 연결 검증
+    pool_params = {
+        "host": EnvConfig.REDIS_HOST,
+        "port": EnvConfig.REDIS_PORT,
+        "db": EnvConfig.REDIS_DB,
+        "decode_responses": False,  # 바이너리 데이터 지원
+        "max_connections": EnvConfig.REDIS_MAX_CONNECTIONS,
+        "socket_keepalive": True,
+        "socket_connect_timeout": 5,
+        "socket_timeout": 5,
+        "retry_on_timeout": True,
+        "health_check_interval": 30,
+    }
+
+    # 비밀번호가 설정된 경우에만 추가
+    if EnvConfig.REDIS_PASSWORD:
+        pool_params["password"] = EnvConfig.REDIS_PASSWORD
+
+    return pool_params
 
 
 def get_redis_client() -> redis.Redis:
     """
-    Redis 클라이언트 인스턴스 반환 (싱글톤)
+    Redis 클라이언트 인스턴스 반환 (싱글톤, 커넥션 풀 사용)
     
     Returns:
         Redis 클라이언트 인스턴스
     """
-    global _redis_client
+    global _redis_client, _redis_pool
     
     if _redis_client is not None:
         return _redis_client
     
     try:
-        # Redis 연결 파라미터 구성
-        redis_params = {
-            "host": EnvConfig.REDIS_HOST,
-            "port": EnvConfig.REDIS_PORT,
-            "db": EnvConfig.REDIS_DB,
-            "decode_responses": False,  # 바이너리 데이터 지원
-            "socket_connect_timeout": 5,
-            "socket_timeout": 5,
-            "retry_on_timeout": True,
-            "health_check_interval": 30,
-        }
-        
-        # 비밀번호가 설정된 경우에만 추가
-        if EnvConfig.REDIS_PASSWORD:
-            redis_params["password"] = EnvConfig.REDIS_PASSWORD
+        pool_params = _pool_params()
         
-        _redis_client = redis.Redis(**redis_params)
+        _redis_pool = redis.ConnectionPool(**pool_params)
+        _redis_client = redis.Redis(connection_pool=_redis_pool)
         
         # 연결 테스트
         _redis_client.ping()
@@ -56,14 +69,48 @@ def get_redis_client() -> redis.Redis:
 
 
 def close_redis():
-    """Redis 연결 종료"""
-    global _redis_client
+    """Redis 연결 종료 (커넥션 풀 포함)"""
+    global _redis_client, _redis_pool
     if _redis_client:
         try:
             _redis_client.close()
+            if _redis_pool:
+                _redis_pool.disconnect()
             logger.info("Redis connection closed")
         except Exception as e:
             logger.error(f"Error closing Redis connection: {e}")
         finally:
             _redis_client = None
+            _redis_pool = None
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    비동기 Redis 클라이언트 인스턴스 반환 (싱글톤, 별도 커넥션 풀 사용)
+
+    생성 시 연결하지 않으며, 첫 명령 실행 시 연결된다.
+    이벤트 루프에서 Redis 왕복을 기다리는 동안 다른 요청을 처리할 수 있다.
 
+    Returns:
+        비동기 Redis 클라이언트 인스턴스
+    """
+    global _async_redis_client
+
+    if _async_redis_client is None:
+        pool = aioredis.ConnectionPool(**_pool_params())
+        _async_redis_client = aioredis.Redis(connection_pool=pool)
+
+    return _async_redis_client
+
+
+async def close_async_redis():
+    """비동기 Redis 연결 종료 (커넥션 풀 포함)"""
+    global _async_redis_client
+    if _async_redis_client:
+        try:
+            await _async_redis_client.aclose(close_connection_pool=True)
+            logger.info("Async Redis connection closed")
+        except Exception as e:
+            logger.error(f"Error closing async Redis connection: {e}")
+        finally:
+            _async_redis_client = None
@@ -3,27 +3,374 @@ Chat Controller
 채팅 API 엔드포인트 (스트리밍 및 비스트리밍)
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from typing import AsyncGenerator
-import json
+from fastapi import APIRouter, HTTPException, Header, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import AsyncGenerator, AsyncIterator, Optional
+import asyncio
+import time
+import orjson
 from loguru import logger
 
+try:
+    from sse_starlette.sse import EventSourceResponse  # SSE 전용 응답 (keep-alive ping, 헤더 자동 설정)
+    SSE_STARLETTE_AVAILABLE = True
+except ImportError:
+    SSE_STARLETTE_AVAILABLE = False
+
 from src.dto.chat_request import ChatRequest
 from src.services.model_router import ModelRouterService
+from src.providers import ProviderFactory
+from src.models.model_config import ModelConfigManager
 from src.exceptions import AIServiceError, ProviderError
 from src.utils.concurrency import RateLimiter  # Rate Limiting
 
-router = APIRouter()
+# 구조화 응답 / 챗 저장 큐 (선택 기능: 모듈을 불러올 수 없으면 해당 기능만 비활성화)
+try:
+    from src.services.structured_llm_service import StructuredLLMService
+    from src.dto.llm_responses import SimpleResponse
+    STRUCTURED_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"Structured responses not available: {e}")
+    STRUCTURED_AVAILABLE = False
+
+try:
+    from src.services.chat_storage_queue import get_chat_storage_queue
+    CHAT_STORAGE_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"Chat storage queue not available: {e}")
+    CHAT_STORAGE_AVAILABLE = False
+
+router = APIRouter(default_response_class=ORJSONResponse)  # 응답 직렬화는 orjson으로
 
 # Rate Limiter 인스턴스 (사용자별, 엔드포인트별)
 _chat_rate_limiter = RateLimiter("chat:stream", max_requests=60, window=60)  # 분당 60회
 _chat_user_rate_limiter = RateLimiter("chat:user", max_requests=30, window=60)  # 사용자당 분당 30회
 
 
+async def _enforce_rate_limit(
+    limiter: RateLimiter, user_id: Optional[str], http_request: Request
+) -> None:
+    """
+    사용자별 Rate limit 확인 (초과 시 429)
+
+    Args:
+        limiter: 엔드포인트별 Rate Limiter
+        user_id: 사용자 ID (없으면 클라이언트 IP, IP도 없으면 전역 버킷으로 제한)
+        http_request: 원본 HTTP 요청 (익명 요청의 클라이언트 IP 확인용)
+    """
+    identifier = user_id
+    if not identifier and http_request.client:
+        identifier = f"ip:{http_request.client.host}"
+    if not await limiter.acheck(identifier):
+        raise HTTPException(status_code=429, detail="Too many requests, please retry later")
+
+
+# 모델 목록 (런타임에 변하지 않으므로 import 시점에 한 번만 구성)
+_MODELS_LIST = [
+    {
+        "name": model_name,
+        "display_name": config.display_name,
+        "type": config.type,
+        "provider": config.provider.value,
+        "description": config.description,
+        "use_case": config.use_case,
+    }
+    for model_name, config in ModelConfigManager.MODELS.items()
+]
+
+# /models 응답 본문 캐싱 (Provider 목록 캐시가 초기화될 때만 다시 직렬화)
+_models_body: Optional[bytes] = None
+_models_body_providers: Optional[list[str]] = None
+
+
+def _get_models_body() -> bytes:
+    """직렬화된 /models 응답 본문 반환"""
+    global _models_body, _models_body_providers
+
+    providers = ProviderFactory.get_available_providers()
+    if _models_body is None or providers is not _models_body_providers:
+        _models_body = orjson.dumps(
+            {
+                "success": True,
+                "available_providers": providers,
+                "models": _MODELS_LIST,
+            }
+        )
+        _models_body_providers = providers
+    return _models_body
+
+
+# SSE 프레임 구성 요소
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse_frame(payload: dict) -> bytes:
+    """SSE data 프레임 생성 (orjson은 UTF-8 바이트를 바로 반환)"""
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
+
+
+# 구조화 응답 프레임 앞부분 (data 필드 값만 이어 붙임)
+_STRUCTURED_FRAME_HEAD = _SSE_PREFIX + b'{"content":"","done":false,"structured":true,"data":'
+
+
+def _structured_frame(data_json: bytes) -> bytes:
+    """이미 직렬화된 구조화 응답 JSON으로 SSE 프레임 생성"""
+    return _STRUCTURED_FRAME_HEAD + data_json + b"}" + _SSE_SUFFIX
+
+
+# /chat 구조화 응답 본문 앞부분 (data 필드 값만 이어 붙임)
+_STRUCTURED_BODY_HEAD = b'{"success":true,"data":'
+
+
+# 에러 프레임 메시지 최대 길이 (Provider 에러 메시지가 길어도 직렬화 비용 상한 유지)
+_ERROR_MESSAGE_MAX_LEN = 500
+
+
+def _error_frame(error: Exception, message: str) -> bytes:
+    """에러 SSE 프레임 생성 (예외 타입과 잘라낸 메시지를 별도 필드로 전달)"""
+    return _sse_frame(
+        {
+            "content": "",
+            "done": True,
+            "error": True,
+            "error_type": type(error).__name__,
+            "message": message[:_ERROR_MESSAGE_MAX_LEN],
+        }
+    )
+
+
+# SSE 완료 프레임 (고정값이므로 import 시점에 한 번만 직렬화)
+_DONE_FRAME = _sse_frame({"content": "", "done": True})
+
+# SSE 응답 헤더 (Starlette가 복사해서 사용하므로 요청 간 공유 가능)
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
+}
+
+
+# 모델 라우터 싱글톤 (요청마다 생성/종료하지 않고 프로세스 단위로 재사용)
+_router: Optional[ModelRouterService] = None
+_router_lock = asyncio.Lock()
+
+
+async def get_router() -> ModelRouterService:
+    """
+    ModelRouterService 싱글톤 반환 (지연 초기화)
+
+    Provider 클라이언트의 연결 풀을 요청 간에 재사용하기 위해
+    최초 호출 시 한 번만 생성한다.
+    """
+    global _router
+
+    if _router is None:
+        async with _router_lock:
+            if _router is None:
+                _router = ModelRouterService()
+    return _router
+
+
+async def close_router() -> None:
+    """ModelRouterService 싱글톤 종료 (애플리케이션 종료 시 호출)"""
+    global _router
+
+    if _router is not None:
+        try:
+            await _router.close()
+        finally:
+            _router = None
+
+
+# 응답 이후 실행되는 백그라운드 작업 (GC 방지 및 종료 시 대기용 참조 보관)
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _enqueue_chat_storage(
+    user_id: str,
+    question: str,
+    answer: str,
+    messages: Optional[list[dict[str, str]]],
+) -> None:
+    """챗 저장 작업을 큐에 추가 (실패는 챗 응답에 영향을 주지 않도록 로깅만)"""
+    try:
+        storage_queue = get_chat_storage_queue()
+        await storage_queue.enqueue_chat(
+            userId=user_id,
+            question=question,
+            answer=answer,
+            messages=messages,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to enqueue chat storage: {e}")
+
+
+def _schedule_chat_storage(
+    user_id: str,
+    question: str,
+    answer: str,
+    messages: Optional[list[dict[str, str]]],
+) -> None:
+    """챗 저장을 백그라운드 작업으로 예약 (응답은 Redis 왕복을 기다리지 않음)"""
+    task = asyncio.create_task(_enqueue_chat_storage(user_id, question, answer, messages))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def drain_background_tasks() -> None:
+    """남은 백그라운드 작업 완료 대기 (애플리케이션 종료 시 호출)"""
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
+# 구조화 응답 서비스 (프로세스당 하나, 첫 구조화 요청 시 생성)
+_structured_service = None
+
+
+def _get_structured_service():
+    """구조화 응답 서비스 인스턴스 반환 (싱글톤)"""
+    global _structured_service
+
+    if _structured_service is None:
+        if not STRUCTURED_AVAILABLE:
+            raise AIServiceError("Structured responses are not available")
+        _structured_service = StructuredLLMService()
+    return _structured_service
+
+
+# response_type별 구조화 응답 생성 (simple은 기본값으로 처리)
+_STRUCTURED_DISPATCH = {
+    "stock_analysis": lambda service, request: service.analyze_stock(
+        stock_code=request.stock_code,
+        model=request.force_model,
+    ),
+    "news_summary": lambda service, request: service.summarize_news(
+        news_text=request.news_text,
+        model=request.force_model,
+    ),
+    "market_analysis": lambda service, request: service.analyze_market(
+        query=request.query,
+        model=request.force_model,
+    ),
+    "portfolio_recommendation": lambda service, request: service.recommend_portfolio(
+        query=request.query,
+        model=request.force_model,
+    ),
+}
+
+# response_type별 필수 입력 필드
+_STRUCTURED_REQUIRED_FIELDS = {
+    "stock_analysis": "stock_code",
+    "news_summary": "news_text",
+}
+
+
+def _missing_structured_field(request: ChatRequest) -> Optional[str]:
+    """구조화 응답에 필요한 입력 중 비어 있는 필드 이름 반환 (없으면 None)"""
+    field = _STRUCTURED_REQUIRED_FIELDS.get(request.response_type)
+    if field and not getattr(request, field):
+        return field
+    return None
+
+
+async def _run_structured(request: ChatRequest):
+    """
+    response_type에 맞는 구조화 응답 생성
+
+    Args:
+        request: 채팅 요청 (response_type 지정)
+
+    Returns:
+        구조화된 응답 모델
+    """
+    structured_service = _get_structured_service()
+    handler = _STRUCTURED_DISPATCH.get(request.response_type)
+    if handler is None:  # simple
+        return await structured_service.generate_structured(
+            query=request.query,
+            response_schema=SimpleResponse,
+            model=request.force_model,
+        )
+    return await handler(structured_service, request)
+
+
+_STREAM_END = object()  # 스트림 종료 마커
+_STREAM_QUEUE_MAXSIZE = 64  # 소비 측(SSE 클라이언트)이 느리면 생산자를 대기시키는 청크 수 상한
+
+
+async def _buffered_chunks(
+    source: AsyncIterator[str],
+    buffer_size: int = 10,
+    buffer_timeout: float = 0.05,
+) -> AsyncGenerator[str, None]:
+    """
+    모델 출력 청크를 버퍼링하여 묶음 단위로 반환
+
+    버퍼 크기 도달 시 또는 마지막 전송 후 buffer_timeout이 지나면 전송
+    (업스트림이 멈춰 있어도 쌓인 내용은 타임아웃에 맞춰 전송됨)
+    """
+    # 크기 제한 큐: 느린 클라이언트 때문에 전체 응답이 메모리에 쌓이지 않도록 생산자에 백프레셔
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_QUEUE_MAXSIZE)
+
+    async def produce() -> None:
+        try:
+            async for chunk in source:
+                if chunk:
+                    await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)  # 소비 측에서 다시 발생시킴
+        else:
+            await queue.put(_STREAM_END)
+
+    now = time.monotonic  # 버퍼 타임아웃 계산용 단조 시계 (로컬 바인딩)
+    producer = asyncio.create_task(produce())
+    buffer_parts: list[str] = []
+    buffer_len = 0
+    last_send_time = now()
+
+    try:
+        while True:
+            if buffer_parts:
+                remaining = buffer_timeout - (now() - last_send_time)
+                try:
+                    # wait_for와 달리 Task를 만들지 않고 현재 태스크에서 바로 취소 (토큰마다 할당 없음, 3.11+)
+                    async with asyncio.timeout(max(remaining, 0)):
+                        item = await queue.get()
+                except TimeoutError:
+                    item = None
+            else:
+                item = await queue.get()
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            if item is not None:
+                buffer_parts.append(item)
+                buffer_len += len(item)
+
+            # 버퍼가 충분히 크거나 타임아웃이 지났으면 전송
+            if buffer_parts and (
+                buffer_len >= buffer_size
+                or now() - last_send_time >= buffer_timeout
+            ):
+                yield "".join(buffer_parts)
+                buffer_parts.clear()
+                buffer_len = 0
+                last_send_time = now()
+
+        # 남은 버퍼 전송
+        if buffer_parts:
+            yield "".join(buffer_parts)
+    finally:
+        producer.cancel()
+
+
 @router.post("/chat/stream")
 async def stream_chat(
     request: ChatRequest,
+    http_request: Request,
     authorization: Optional[str] = Header(None, alias="Authorization"),
 ):
     """
@@ -37,303 +384,163 @@ async def stream_chat(
 
     에러 처리는 서비스 단에서 처리됨
     """
+    await _enforce_rate_limit(_chat_rate_limiter, request.userId, http_request)
+
     try:
-        model_router = ModelRouterService()
+        model_router = await get_router()
 
-        async def generate() -> AsyncGenerator[str, None]:
+        async def generate() -> AsyncGenerator[bytes, None]:
             """SSE 스트리밍 생성기 (개선된 버퍼링)"""
-            import asyncio
-            
-            buffer = ""
-            buffer_size = 10  # 버퍼 크기 감소 (더 빠른 스트리밍)
-            buffer_timeout = 0.05  # 50ms 타임아웃 (버퍼가 작아도 일정 시간 후 전송)
-            full_response = ""  # 전체 응답 수집 (백엔드 저장 및 구조화용)
-            last_send_time = asyncio.get_event_loop().time()
+            full_parts: list[str] = []  # 전체 응답 수집 (백엔드 저장 및 구조화용, 완료 후 한 번에 결합)
 
             try:
-                async for chunk in model_router.route_and_stream(
-                    query=request.query,
-                    messages=request.messages,
-                    system=request.system,
-                    force_model=request.force_model,
+                async for content in _buffered_chunks(
+                    model_router.route_and_stream(
+                        query=request.query,
+                        messages=request.messages,
+                        system=request.system,
+                        force_model=request.force_model,
+                    )
                 ):
-                    if chunk:
-                        buffer += chunk
-                        full_response += chunk  # 전체 응답 수집
-                        current_time = asyncio.get_event_loop().time()
-
-                        # 버퍼가 충분히 크거나 타임아웃이 지났으면 전송
-                        should_send = (
-                            len(buffer) >= buffer_size or
-                            (buffer and (current_time - last_send_time) >= buffer_timeout)
-                        )
-
-                        if should_send:
-                            data = json.dumps({"content": buffer, "done": False}, ensure_ascii=False)
-                            yield f"data: {data}\n\n"
-                            buffer = ""
-                            last_send_time = current_time
-
-                # 남은 버퍼 전송
-                if buffer:
-                    data = json.dumps({"content": buffer, "done": False}, ensure_ascii=False)
-                    yield f"data: {data}\n\n"
+                    full_parts.append(content)  # 전체 응답 수집
+                    yield _sse_frame({"content": content, "done": False})
+
+                full_response = "".join(full_parts)
 
                 # 구조화된 응답이 요청된 경우, 스트리밍 완료 후 구조화된 형식으로 변환
                 if request.response_type and full_response:
                     try:
-                        from src.services.structured_llm_service import StructuredLLMService
-                        from src.dto.llm_responses import (
-                            StockAnalysis,
-                            NewsSummary,
-                            MarketAnalysis,
-                            PortfolioRecommendation,
-                            SimpleResponse,
-                        )
-
-                        structured_service = StructuredLLMService()
                         structured_result = None
-
-                        # 응답 타입에 따라 적절한 스키마로 변환
-                        if request.response_type == "stock_analysis":
-                            if request.stock_code:
-                                # 전체 응답을 기반으로 구조화된 분석 생성
-                                query_with_response = f"{request.query}\n\n응답: {full_response}"
-                                structured_result = await structured_service.analyze_stock(
-                                    stock_code=request.stock_code,
-                                    model=request.force_model,
-                                )
-                        elif request.response_type == "news_summary":
-                            if request.news_text:
-                                structured_result = await structured_service.summarize_news(
-                                    news_text=request.news_text,
-                                    model=request.force_model,
-                                )
-                        elif request.response_type == "market_analysis":
-                            structured_result = await structured_service.analyze_market(
-                                query=request.query,
-                                model=request.force_model,
-                            )
-                        elif request.response_type == "portfolio_recommendation":
-                            structured_result = await structured_service.recommend_portfolio(
-                                query=request.query,
-                                model=request.force_model,
-                            )
-                        else:  # simple
-                            structured_result = await structured_service.generate_structured(
-                                query=request.query,
-                                response_schema=SimpleResponse,
-                                model=request.force_model,
-                            )
+                        if not _missing_structured_field(request):
+                            structured_result = await _run_structured(request)
 
                         # 구조화된 응답을 최종 데이터로 전송
                         if structured_result:
-                            structured_data = json.dumps(
-                                {
-                                    "content": "",
-                                    "done": False,
-                                    "structured": True,
-                                    "data": structured_result.model_dump() if hasattr(structured_result, 'model_dump') else structured_result.dict(),
-                                },
-                                ensure_ascii=False,
-                            )
-                            yield f"data: {structured_data}\n\n"
-                            # 구조화된 응답을 백엔드 저장용으로 사용
-                            full_response = structured_result.model_dump_json() if hasattr(structured_result, 'model_dump_json') else str(structured_result)
+                            # 한 번만 직렬화해서 SSE 전송과 백엔드 저장에 함께 사용
+                            full_response = structured_result.model_dump_json()
+                            yield _structured_frame(full_response.encode("utf-8"))
 
                     except Exception as e:
                         logger.warning(f"Failed to generate structured response: {e}")
                         # 구조화 실패 시 일반 텍스트 응답 유지
 
                 # 완료 신호
-                done_data = json.dumps({"content": "", "done": True}, ensure_ascii=False)
-                yield f"data: {done_data}\n\n"
+                yield _DONE_FRAME
 
-                # 스트리밍 완료 후 백엔드에 저장 (비동기 큐 사용)
-                if request.userId and full_response:
-                    try:
-                        from src.services.chat_storage_queue import ChatStorageQueue
-
-                        storage_queue = ChatStorageQueue()
-                        await storage_queue.enqueue_chat(
-                            userId=request.userId,
-                            question=request.query,
-                            answer=full_response,
-                            messages=request.messages,
-                        )
-                        # 큐에 추가만 하고 즉시 반환 (워커가 백그라운드에서 처리)
-                    except Exception as e:
-                        # 저장 실패는 챗 응답에 영향을 주지 않도록 에러만 로깅
-                        logger.warning(f"Failed to enqueue chat storage: {e}")
+                # 스트리밍 완료 후 백엔드에 저장 (스트림 종료를 기다리게 하지 않도록 백그라운드 실행)
+                if request.userId and full_response and CHAT_STORAGE_AVAILABLE:
+                    _schedule_chat_storage(
+                        request.userId, request.query, full_response, request.messages
+                    )
 
             except (AIServiceError, ProviderError) as e:
                 logger.error(f"Stream chat error: {e}")
-                error_data = json.dumps(
-                    {"content": f"[Error: {str(e)}]", "done": True, "error": True},
-                    ensure_ascii=False,
-                )
-                yield f"data: {error_data}\n\n"
+                yield _error_frame(e, str(e))
             except Exception as e:
                 logger.error(f"Unexpected stream chat error: {e}")
-                error_data = json.dumps(
-                    {
-                        "content": f"[Unexpected Error: {str(e)}]",
-                        "done": True,
-                        "error": True,
-                    },
-                    ensure_ascii=False,
-                )
-                yield f"data: {error_data}\n\n"
-            finally:
-                # 리소스 정리
-                await model_router.close()
+                # 내부 예외 메시지는 노출하지 않고 예외 타입만 전달
+                yield _error_frame(e, "Unexpected error")
+
+        if SSE_STARLETTE_AVAILABLE:
+            # 이미 인코딩된 bytes 프레임은 그대로 전송, 15초마다 ping으로 프록시 연결 유지
+            return EventSourceResponse(generate(), ping=15)
 
         return StreamingResponse(
             generate(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
-            },
+            headers=_SSE_HEADERS,
         )
 
-    except Exception as e:
+    except (AIServiceError, ProviderError) as e:
         logger.error(f"Chat controller error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process chat request: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected chat controller error: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to process chat request: {type(e).__name__}"
+        )
 
 
 @router.post("/chat")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     """
     일반 채팅 API (비스트리밍)
     구조화된 응답 지원: response_type이 있으면 구조화된 응답 반환
     """
+    await _enforce_rate_limit(_chat_user_rate_limiter, request.userId, http_request)
+
     try:
         # 구조화된 응답 요청인 경우
         if request.response_type:
             try:
-                from src.services.structured_llm_service import StructuredLLMService
-                from src.dto.llm_responses import (
-                    StockAnalysis,
-                    NewsSummary,
-                    MarketAnalysis,
-                    PortfolioRecommendation,
-                    SimpleResponse,
-                )
-
-                structured_service = StructuredLLMService()
-
-                # 응답 타입에 따라 적절한 스키마 선택
-                if request.response_type == "stock_analysis":
-                    if not request.stock_code:
-                        raise HTTPException(
-                            status_code=400,
-                            detail="stock_code is required for stock_analysis"
-                        )
-                    result = await structured_service.analyze_stock(
-                        stock_code=request.stock_code,
-                        model=request.force_model,
-                    )
-                elif request.response_type == "news_summary":
-                    if not request.news_text:
-                        raise HTTPException(
-                            status_code=400,
-                            detail="news_text is required for news_summary"
-                        )
-                    result = await structured_service.summarize_news(
-                        news_text=request.news_text,
-                        model=request.force_model,
-                    )
-                elif request.response_type == "market_analysis":
-                    result = await structured_service.analyze_market(
-                        query=request.query,
-                        model=request.force_model,
-                    )
-                elif request.response_type == "portfolio_recommendation":
-                    result = await structured_service.recommend_portfolio(
-                        query=request.query,
-                        model=request.force_model,
-                    )
-                else:  # simple
-                    result = await structured_service.generate_structured(
-                        query=request.query,
-                        response_schema=SimpleResponse,
-                        model=request.force_model,
+                missing_field = _missing_structured_field(request)
+                if missing_field:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"{missing_field} is required for {request.response_type}"
                     )
 
-                # 백엔드에 저장 (비동기 큐)
-                if request.userId:
-                    try:
-                        from src.services.chat_storage_queue import ChatStorageQueue
-
-                        storage_queue = ChatStorageQueue()
-                        await storage_queue.enqueue_chat(
-                            userId=request.userId,
-                            question=request.query,
-                            answer=result.model_dump_json() if hasattr(result, 'model_dump_json') else str(result),
-                            messages=request.messages,
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to enqueue chat storage: {e}")
+                result = await _run_structured(request)
+                # 한 번만 직렬화해서 응답 본문과 백엔드 저장에 함께 사용
+                data_json = result.model_dump_json()
 
-                return {
-                    "success": True,
-                    "data": result.model_dump() if hasattr(result, 'model_dump') else result.dict(),
-                }
+                # 백엔드에 저장 (백그라운드 실행)
+                if request.userId and CHAT_STORAGE_AVAILABLE:
+                    _schedule_chat_storage(
+                        request.userId, request.query, data_json, request.messages
+                    )
+
+                return Response(
+                    content=_STRUCTURED_BODY_HEAD + data_json.encode("utf-8") + b"}",
+                    media_type="application/json",
+                )
 
             except HTTPException:
                 raise
-            except Exception as e:
+            except (AIServiceError, ProviderError) as e:
                 logger.error(f"Structured chat error: {e}")
                 raise HTTPException(
                     status_code=500,
                     detail=f"Failed to process structured chat request: {str(e)}"
                 )
+            except Exception as e:
+                logger.error(f"Unexpected structured chat error: {e}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to process structured chat request: {type(e).__name__}"
+                )
 
         # 일반 텍스트 응답
-        model_router = ModelRouterService()
-
-        try:
-            # 채팅 실행
-            response = await model_router.route_and_chat(
-                query=request.query,
-                messages=request.messages,
-                system=request.system,
-                force_model=request.force_model,
-            )
-
-            # 백엔드에 저장 (비동기 큐 사용)
-            if request.userId and response:
-                try:
-                    from src.services.chat_storage_queue import ChatStorageQueue
+        model_router = await get_router()
+
+        # 채팅 실행
+        response = await model_router.route_and_chat(
+            query=request.query,
+            messages=request.messages,
+            system=request.system,
+            force_model=request.force_model,
+        )
 
-                    storage_queue = ChatStorageQueue()
-                    await storage_queue.enqueue_chat(
-                        userId=request.userId,
-                        question=request.query,
-                        answer=response,
-                        messages=request.messages,
-                    )
-                    # 큐에 추가만 하고 즉시 반환 (워커가 백그라운드에서 처리)
-                except Exception as e:
-                    # 저장 실패는 챗 응답에 영향을 주지 않도록 에러만 로깅
-                    logger.warning(f"Failed to enqueue chat storage: {e}")
+        # 백엔드에 저장 (백그라운드 실행)
+        if request.userId and response and CHAT_STORAGE_AVAILABLE:
+            _schedule_chat_storage(request.userId, request.query, response, request.messages)
 
-            # 간단한 챗이므로 content만 반환 (경량 모델 사용 전략)
-            return {
-                "success": True,
-                "content": response,
-            }
-        finally:
-            # 리소스 정리
-            await model_router.close()
+        # 간단한 챗이므로 content만 반환 (경량 모델 사용 전략)
+        return {
+            "success": True,
+            "content": response,
+        }
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Chat controller error: {e}")
+    except (AIServiceError, ProviderError) as e:
+        logger.error(f"Chat error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process chat request: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected chat error: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to process chat request: {type(e).__name__}"
+        )
 
 
 @router.get("/models")
@@ -342,34 +549,11 @@ async def get_models():
     사용 가능한 모델 목록 조회
     """
     try:
-        from src.providers import ProviderFactory
-        from src.models.model_config import ModelConfigManager
-
-        available_providers = ProviderFactory.get_available_providers()
-
-        # 모델 목록 구성
-        models = []
-        for model_name, config in ModelConfigManager.MODELS.items():
-            models.append(
-                {
-                    "name": model_name,
-                    "display_name": config.display_name,
-                    "type": config.type,
-                    "provider": (config.provider.value if hasattr(config.provider, "value") else str(config.provider)),
-                    "description": config.description,
-                    "use_case": config.use_case,
-                }
-            )
-
-        return {
-            "success": True,
-            "available_providers": available_providers,
-            "models": models,
-        }
+        return Response(content=_get_models_body(), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Get models error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get models: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get models: {type(e).__name__}")
 
 
 @router.get("/queue/stats")
@@ -378,11 +562,11 @@ async def get_queue_stats():
     Redis 메시지 큐 통계 조회 (모니터링)
     """
     try:
-        from src.services.redis_message_queue import RedisMessageQueue
         from src.services.dlq_handler import DLQHandler
         from src.config.env import EnvConfig
         
-        queue = RedisMessageQueue()
+        # 챗 저장 큐 싱글톤의 RedisMessageQueue 재사용 (요청마다 생성하지 않음)
+        queue = get_chat_storage_queue().queue
         dlq_handler = DLQHandler(
             use_file_system=EnvConfig.USE_FILE_DLQ,
             dlq_dir=EnvConfig.DLQ_DIR,
@@ -415,12 +599,15 @@ async def get_queue_stats():
             "config": {
                 "compression_enabled": EnvConfig.ENABLE_MESSAGE_COMPRESSION,
                 "batch_size": EnvConfig.WORKER_BATCH_SIZE,
+                "worker_concurrency": EnvConfig.WORKER_CONCURRENCY,
             },
         }
         
     except Exception as e:
         logger.error(f"Get queue stats error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get queue stats: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get queue stats: {type(e).__name__}"
+        )
 
 
 @router.get("/chat/history")
@@ -461,17 +648,10 @@ async def get_chat_history(
     
     try:
         from src.services.chat_storage_service import ChatStorageService
-        from src.utils.cache import cache
-        import hashlib
+        from src.utils.cache import cache, hash_key
         
-        # 캐시 키 생성
-        cache_key_parts = [userId, str(page), str(limit)]
-        if concept:
-            cache_key_parts.append(f"concept:{concept}")
-        if stockCode:
-            cache_key_parts.append(f"stock:{stockCode}")
-        
-        cache_key = f"chat_history:{hashlib.md5(':'.join(cache_key_parts).encode()).hexdigest()}"
+        # 캐시 키 생성 (JSON 배열로 인코딩해 ':'가 들어간 파라미터도 다른 요청의 키와 겹치지 않음)
+        cache_key = f"chat_history:{hash_key(orjson.dumps([userId, page, limit, concept, stockCode]).decode())}"
         
         # 캐시 확인
         cached = cache.get(cache_key)
@@ -537,4 +717,6 @@ async def get_chat_history(
         raise
     except Exception as e:
         logger.error(f"Get chat history error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get chat history: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get chat history: {type(e).__name__}"
+        )
@@ -4,6 +4,7 @@ Search Controller
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from src.dto.search_request import VectorSearchRequest
@@ -11,7 +12,7 @@ from src.services.vector_search_service import VectorSearchService
 from src.exceptions import VectorSearchError, EmbeddingError
 from src.utils.concurrency import RateLimiter  # Rate Limiting
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)  # 응답 직렬화는 orjson으로
 
 # Rate Limiter 인스턴스
 _search_rate_limiter = RateLimiter(
@@ -48,7 +49,7 @@ async def vector_search(request: VectorSearchRequest):
     except Exception as e:
         logger.error(f"Unexpected vector search error: {e}")
         raise HTTPException(
-            status_code=500, detail=f"Failed to process search request: {str(e)}"
+            status_code=500, detail=f"Failed to process search request: {type(e).__name__}"
         )
 
 
@@ -73,5 +74,5 @@ async def get_index_stats():
     except Exception as e:
         logger.error(f"Unexpected get index stats error: {e}")
         raise HTTPException(
-            status_code=500, detail=f"Failed to get index stats: {str(e)}"
+            status_code=500, detail=f"Failed to get index stats: {type(e).__name__}"
         )
@@ -4,7 +4,7 @@ Chat Request DTO
 """
 
 from typing import List, Dict, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChatRequest(BaseModel):
@@ -22,8 +22,8 @@ class ChatRequest(BaseModel):
     stock_code: Optional[str] = Field(default=None, description="종목 코드 (stock_analysis일 때 필요)")
     news_text: Optional[str] = Field(default=None, description="뉴스 텍스트 (news_summary일 때 필요)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "삼성전자 주가 분석해줘",
                 "messages": [
@@ -35,4 +35,5 @@ class ChatRequest(BaseModel):
                 "response_type": "stock_analysis",
                 "stock_code": "005930",
             }
-        }
+        },
+    )
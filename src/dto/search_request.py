@@ -4,7 +4,7 @@ Search Request DTO
 """
 
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VectorSearchRequest(BaseModel):
@@ -22,8 +22,8 @@ class VectorSearchRequest(BaseModel):
         description="메타데이터 필터 (선택적)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "삼성전자 주가 상승",
                 "top_k": 5,
@@ -31,4 +31,5 @@ class VectorSearchRequest(BaseModel):
                     "type": "news"
                 }
             }
-        }
+        },
+    )
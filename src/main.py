@@ -6,6 +6,7 @@ InsightStock AI Service - LLM/SLM integration with multiple providers (Python)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 from loguru import logger
 
@@ -14,34 +15,104 @@ from src.config.env import EnvConfig
 from src.config.managers import get_redis_manager
 
 # Import controllers
-from src.controllers.chat_controller import router as chat_router
+from src.controllers.chat_controller import (
+    router as chat_router,
+    get_router,
+    close_router,
+    drain_background_tasks,
+)
 from src.controllers.search_controller import router as search_router
+from src.models.ollama_client import close_client as close_ollama_client
+from src.services.chat_storage_queue import get_chat_storage_queue
+from src.services.chat_storage_service import close_client as close_chat_storage_client
+from src.config.redis import close_async_redis
+from src.providers import ProviderFactory
+
+
+# 워밍업 완료 여부 (/health의 ready 필드)
+_ready = False
+
+
+async def _init_provider(name: str) -> None:
+    """Provider 인스턴스 생성 및 캐싱 (SDK 클라이언트 생성은 스레드에서 수행)"""
+    try:
+        await asyncio.to_thread(ProviderFactory.get_provider, name, False)
+        logger.info(f"✅ Provider initialized: {name}")
+    except Exception as e:
+        logger.warning(f"⚠️  Failed to initialize provider {name}: {e}")
+
+
+async def _warmup(providers: list[str], max_attempts: int = 3) -> None:
+    """
+    Provider 초기화, 기본 Provider 확인 및 모델 라우터 싱글톤 생성 (실패 시 지수 백오프 재시도)
+
+    Args:
+        providers: 초기화할 Provider 이름 목록 (동시에 초기화)
+        max_attempts: 최대 시도 횟수
+    """
+    global _ready
+
+    # Provider별 클라이언트 생성을 동시에 진행 (시작 시간 = 가장 느린 Provider 기준)
+    # 한 Provider가 실패해도 다른 Provider의 초기화는 취소되지 않음
+    await asyncio.gather(*(_init_provider(name) for name in providers), return_exceptions=True)
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            if providers:
+                default_provider = ProviderFactory.get_default_provider()
+                logger.info(f"✅ Default provider: {default_provider.name}")
+
+            # 모델 라우터 싱글톤 미리 생성 (Provider HTTP 클라이언트 초기화)
+            await get_router()
+            logger.info("✅ Model router initialized")
+            _ready = True
+            return
+        except Exception as e:
+            logger.warning(f"⚠️  Warm-up failed (attempt {attempt}/{max_attempts}): {e}")
+            if attempt < max_attempts:
+                await asyncio.sleep(2 ** attempt)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
-    import asyncio
     from src.workers.chat_storage_worker import ChatStorageWorker
 
     # Startup
-    logger.info("🚀 AI Service starting up...")
+    loop = asyncio.get_running_loop()
+    logger.info(f"🚀 AI Service starting up... (event loop: {type(loop).__module__})")
 
-    # 사용 가능한 Provider 확인
-    from src.providers import ProviderFactory
+    # 환경 변수 검증 (워커마다 부팅 시 1회)
+    missing = EnvConfig.validate()
+    if missing:
+        logger.warning(f"⚠️  Missing environment variables: {', '.join(missing)}")
+        logger.warning("Service will start but may not function correctly.")
+
+    config_errors = EnvConfig.validate_config()
+    if config_errors:
+        logger.error(f"❌ Invalid configuration: {'; '.join(config_errors)}")
+
+    # Redis 워밍업: 첫 요청이 TCP 연결 + PING 비용을 치르지 않도록 미리 연결
+    from src.config.redis import get_redis_client
+
+    try:
+        await asyncio.to_thread(get_redis_client)
+    except Exception as e:
+        logger.warning(f"⚠️  Redis warm-up failed (in-memory fallback): {e}")
 
+    # 사용 가능한 Provider 확인
     available_providers = ProviderFactory.get_available_providers()
     logger.info(f"Available LLM providers: {available_providers}")
 
     if not available_providers:
         logger.warning("⚠️  No LLM providers available! Please set at least one API key.")
-    else:
-        # 기본 Provider 확인
-        try:
-            default_provider = ProviderFactory.get_default_provider()
-            logger.info(f"✅ Default provider: {default_provider.name}")
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize default provider: {e}")
+
+    # Provider/모델 라우터 워밍업은 백그라운드에서 수행 (헬스 체크가 바로 응답하도록)
+    warmup_task = asyncio.create_task(_warmup(available_providers))
+
+    # 챗 저장 버퍼 플러셔 시작 (요청 경로에서 Redis 왕복 제거)
+    chat_storage_queue = get_chat_storage_queue()
+    chat_storage_queue.start_flusher()
 
     # 워커 시작 (백그라운드 태스크, 배치 처리 지원)
     from src.config.env import EnvConfig
@@ -49,32 +120,61 @@ async def lifespan(app: FastAPI):
     worker = ChatStorageWorker()
     worker_task = None
     
-    try:
-        batch_size = EnvConfig.WORKER_BATCH_SIZE
-        worker_task = asyncio.create_task(worker.run(batch_size=batch_size))
-        logger.info(f"✅ Chat storage worker started (batch_size={batch_size})")
-    except Exception as e:
-        logger.warning(f"⚠️  Failed to start chat storage worker: {e}")
+    if EnvConfig.RUN_CHAT_WORKER:
+        try:
+            batch_size = EnvConfig.WORKER_BATCH_SIZE
+            concurrency = EnvConfig.WORKER_CONCURRENCY
+            worker_task = asyncio.create_task(
+                worker.run(batch_size=batch_size, concurrency=concurrency)
+            )
+            logger.info(
+                f"✅ Chat storage worker started (batch_size={batch_size}, concurrency={concurrency})"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to start chat storage worker: {e}")
+    else:
+        logger.info("ℹ️  Chat storage worker disabled (RUN_CHAT_WORKER=false)")
 
     yield
 
     # Shutdown
     logger.info("🛑 AI Service shutting down...")
+
+    # 아직 진행 중인 워밍업 중단
+    if not warmup_task.done():
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+
+    # 응답 후 예약된 챗 저장 작업 완료 대기
+    await drain_background_tasks()
+    await chat_storage_queue.stop_flusher()
     
     # 워커 중지
     if worker_task:
         try:
             worker.stop()
-            worker_task.cancel()
+            # 스레드에서 BRPOP으로 꺼낸 메시지가 유실되지 않도록 취소하지 않고 종료를 기다림
             try:
-                await worker_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("✅ Chat storage worker stopped")
+                await asyncio.wait_for(worker_task, timeout=worker.SHUTDOWN_TIMEOUT)
+                logger.info("✅ Chat storage worker stopped")
+            except asyncio.TimeoutError:
+                logger.warning("⚠️  Chat storage worker did not stop in time, cancelled")
         except Exception as e:
             logger.warning(f"⚠️  Error stopping worker: {e}")
+
+    # 모델 라우터 싱글톤 종료
+    try:
+        await close_router()
+    except Exception as e:
+        logger.warning(f"⚠️  Error closing model router: {e}")
     
     ProviderFactory.clear_cache()
+    await close_ollama_client()
+    await close_chat_storage_client()
+    await close_async_redis()
     redis_manager = get_redis_manager()
     redis_manager.close()  # Redis 연결 종료
 
@@ -104,8 +204,6 @@ app.include_router(search_router, prefix="/api", tags=["search"])
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    from src.providers import ProviderFactory
-
     available_providers = ProviderFactory.get_available_providers()
 
     return {
@@ -113,16 +211,12 @@ async def health_check():
         "service": "ai-service",
         "version": "1.0.0",
         "available_providers": available_providers,
+        "ready": _ready,
     }
 
 
 if __name__ == "__main__":
-    # 환경 변수 검증
-    missing = EnvConfig.validate()
-    if missing:
-        logger.warning(f"⚠️  Missing environment variables: {', '.join(missing)}")
-        logger.warning("Service will start but may not function correctly.")
-
+    # 환경 변수 검증은 lifespan에서 수행
     logger.info(f"🚀 Starting server on {EnvConfig.HOST}:{EnvConfig.PORT}")
     logger.info(f"📖 API Documentation: http://{EnvConfig.HOST}:{EnvConfig.PORT}/docs")
 
@@ -130,6 +224,8 @@ if __name__ == "__main__":
         "src.main:app",
         host=EnvConfig.HOST,
         port=EnvConfig.PORT,
-        reload=True,
+        reload=EnvConfig.NODE_ENV != "production",  # 파일 감시는 개발 환경에서만
+        loop="uvloop",  # uvicorn[standard]에 포함, 청크 단위 await 오버헤드 감소
+        http="httptools",
         log_level=EnvConfig.LOG_LEVEL.lower(),
     )
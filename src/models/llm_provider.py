@@ -5,13 +5,15 @@ LLM Provider Abstraction
 
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, List, Dict, Optional
-from enum import Enum
+from enum import StrEnum
 import os
 from loguru import logger
 
+from src.models.messages import to_claude_messages
 
-class LLMProvider(str, Enum):
-    """지원하는 LLM 제공자"""
+
+class LLMProvider(StrEnum):
+    """지원하는 LLM 제공자 (StrEnum: 문자열과 직접 비교/해시)"""
     OPENAI = "openai"
     ANTHROPIC = "anthropic"  # Claude
     GOOGLE = "google"  # Gemini
@@ -76,9 +78,10 @@ class OpenAIProvider(BaseLLMProvider):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
     ) -> AsyncGenerator[str, None]:
-        openai_messages = messages.copy()
-        if system:
-            openai_messages.insert(0, {"role": "system", "content": system})
+        # 시스템 메시지가 없으면 호출자 리스트를 그대로 전달 (수정하지 않음)
+        openai_messages = (
+            [{"role": "system", "content": system}, *messages] if system else messages
+        )
         
         stream = await self.client.chat.completions.create(
             model=model or self.default_model,
@@ -99,9 +102,10 @@ class OpenAIProvider(BaseLLMProvider):
         system: Optional[str] = None,
         temperature: float = 0.7,
     ) -> str:
-        openai_messages = messages.copy()
-        if system:
-            openai_messages.insert(0, {"role": "system", "content": system})
+        # 시스템 메시지가 없으면 호출자 리스트를 그대로 전달 (수정하지 않음)
+        openai_messages = (
+            [{"role": "system", "content": system}, *messages] if system else messages
+        )
         
         response = await self.client.chat.completions.create(
             model=model or self.default_model,
@@ -139,12 +143,7 @@ class AnthropicProvider(BaseLLMProvider):
         max_tokens: Optional[int] = None,
     ) -> AsyncGenerator[str, None]:
         # Claude 메시지 형식 변환
-        claude_messages = []
-        for msg in messages:
-            if msg["role"] == "user":
-                claude_messages.append({"role": "user", "content": msg["content"]})
-            elif msg["role"] == "assistant":
-                claude_messages.append({"role": "assistant", "content": msg["content"]})
+        claude_messages = to_claude_messages(messages)
         
         async with self.client.messages.stream(
             model=model or self.default_model,
@@ -163,12 +162,7 @@ class AnthropicProvider(BaseLLMProvider):
         system: Optional[str] = None,
         temperature: float = 0.7,
     ) -> str:
-        claude_messages = []
-        for msg in messages:
-            if msg["role"] == "user":
-                claude_messages.append({"role": "user", "content": msg["content"]})
-            elif msg["role"] == "assistant":
-                claude_messages.append({"role": "assistant", "content": msg["content"]})
+        claude_messages = to_claude_messages(messages)
         
         response = await self.client.messages.create(
             model=model or self.default_model,
@@ -216,10 +210,7 @@ class GoogleProvider(BaseLLMProvider):
             }
         )
         
-        # Gemini 메시지 형식 변환
-        chat = model_instance.start_chat(history=[])
-        
-        # 시스템 메시지가 있으면 첫 메시지에 포함
+        # 시스템 메시지가 있으면 첫 메시지에 포함 (마지막 메시지만 단발 요청으로 전송)
         if system:
             prompt = f"{system}\n\n{messages[-1]['content']}"
         else:
@@ -310,10 +301,21 @@ class OllamaProvider(BaseLLMProvider):
 class LLMProviderFactory:
     """LLM 제공자 팩토리"""
     
-    @staticmethod
-    def create_provider(provider: Optional[LLMProvider] = None) -> BaseLLMProvider:
+    # 제공자 타입 → 구현 클래스 (새 제공자는 여기에 등록)
+    _REGISTRY: Dict[LLMProvider, type[BaseLLMProvider]] = {
+        LLMProvider.OPENAI: OpenAIProvider,
+        LLMProvider.ANTHROPIC: AnthropicProvider,
+        LLMProvider.GOOGLE: GoogleProvider,
+        LLMProvider.OLLAMA: OllamaProvider,
+    }
+    
+    # 생성된 제공자 인스턴스 (API 클라이언트 재사용)
+    _instances: Dict[LLMProvider, BaseLLMProvider] = {}
+    
+    @classmethod
+    def create_provider(cls, provider: Optional[LLMProvider] = None) -> BaseLLMProvider:
         """
-        제공자 생성
+        제공자 생성 (타입별로 한 번만 생성 후 재사용)
         
         Args:
             provider: 제공자 타입 (None이면 자동 선택)
@@ -322,23 +324,33 @@ class LLMProviderFactory:
             LLM 제공자 인스턴스
         """
         if provider is None or provider == LLMProvider.AUTO:
-            provider = LLMProviderFactory._auto_select_provider()
+            provider = cls._auto_select_provider()
         
-        if provider == LLMProvider.OPENAI:
-            return OpenAIProvider()
-        elif provider == LLMProvider.ANTHROPIC:
-            return AnthropicProvider()
-        elif provider == LLMProvider.GOOGLE:
-            return GoogleProvider()
-        elif provider == LLMProvider.OLLAMA:
-            return OllamaProvider()
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
+        instance = cls._instances.get(provider)
+        if instance is not None:
+            return instance
+        
+        try:
+            provider_class = cls._REGISTRY[provider]
+        except KeyError:
+            raise ValueError(f"Unknown provider: {provider}") from None
+        instance = provider_class()
+        cls._instances[provider] = instance
+        return instance
     
-    @staticmethod
-    def _auto_select_provider() -> LLMProvider:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """인스턴스 및 자동 선택 캐시 초기화"""
+        cls._instances.clear()
+        cls._auto_selected = None
+    
+    # 자동 선택 결과 (환경 변수는 프로세스 시작 후 변하지 않으므로 한 번만 계산)
+    _auto_selected: Optional[LLMProvider] = None
+    
+    @classmethod
+    def _auto_select_provider(cls) -> LLMProvider:
         """
-        환경 변수를 기반으로 자동 제공자 선택
+        환경 변수를 기반으로 자동 제공자 선택 (최초 1회 계산 후 캐싱)
         
         우선순위:
         1. ANTHROPIC_API_KEY (Claude)
@@ -346,18 +358,24 @@ class LLMProviderFactory:
         3. GOOGLE_API_KEY (Gemini)
         4. Ollama (기본값)
         """
+        if cls._auto_selected is not None:
+            return cls._auto_selected
+        
         if os.getenv("ANTHROPIC_API_KEY"):
             logger.info("Auto-selected provider: Anthropic (Claude)")
-            return LLMProvider.ANTHROPIC
+            selected = LLMProvider.ANTHROPIC
         elif os.getenv("OPENAI_API_KEY"):
             logger.info("Auto-selected provider: OpenAI")
-            return LLMProvider.OPENAI
+            selected = LLMProvider.OPENAI
         elif os.getenv("GOOGLE_API_KEY"):
             logger.info("Auto-selected provider: Google (Gemini)")
-            return LLMProvider.GOOGLE
+            selected = LLMProvider.GOOGLE
         else:
             logger.info("Auto-selected provider: Ollama (default)")
-            return LLMProvider.OLLAMA
+            selected = LLMProvider.OLLAMA
+        
+        cls._auto_selected = selected
+        return selected
     
     @staticmethod
     def get_available_providers() -> List[LLMProvider]:
@@ -0,0 +1,19 @@
+"""
+Message Conversion
+제공자별 메시지 형식 변환 (SDK 의존성 없음)
+"""
+
+from typing import Dict, List
+
+
+# Claude messages API가 허용하는 역할 (system은 별도 인자로 전달)
+CLAUDE_ROLES = frozenset({"user", "assistant"})
+
+
+def to_claude_messages(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Claude 메시지 형식으로 변환 (지원하지 않는 역할은 한 번의 순회로 제거)"""
+    return [
+        {"role": msg["role"], "content": msg["content"]}
+        for msg in messages
+        if msg["role"] in CLAUDE_ROLES
+    ]
@@ -3,19 +3,87 @@ Ollama Client
 Ollama API를 통한 LLM/SLM 모델 통합
 """
 
-from typing import AsyncGenerator, List, Dict, Optional
+from typing import AsyncGenerator, AsyncIterator, List, Dict, Optional
+import asyncio
 import httpx
+import orjson
 from loguru import logger
 from src.config.env import EnvConfig
 
 
+# 스트리밍 중 이벤트 루프에 양보하는 주기 (파싱한 줄 수 기준)
+_YIELD_EVERY_LINES = 32
+
+# 공유 HTTP 클라이언트 (OllamaClient 인스턴스 간 연결 풀 재사용)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """공유 httpx.AsyncClient 반환 (지연 초기화)"""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _client
+
+    if _client is not None:
+        try:
+            await _client.aclose()
+        finally:
+            _client = None
+
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncGenerator[Dict, None]:
+    """
+    바이트 스트림을 NDJSON 객체로 파싱 (문자열 디코딩/줄 분리 없이 bytes 그대로 orjson에 전달)
+
+    Args:
+        chunks: 응답 바이트 청크 (줄 경계와 무관하게 잘려 올 수 있음)
+
+    Yields:
+        파싱된 JSON 객체 (잘못된 줄은 건너뜀)
+    """
+    buf = bytearray()
+    async for chunk in chunks:
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line = buf[start:end]
+            start = end + 1
+            if line.strip():
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+        del buf[:start]
+
+    # 마지막 줄에 개행이 없는 경우
+    if buf.strip():
+        try:
+            yield orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+
+
 class OllamaClient:
     """Ollama API 클라이언트"""
 
     def __init__(self, host: Optional[str] = None):
         self.host = host or EnvConfig.OLLAMA_HOST
         self.base_url = f"{self.host}/api"
-        self.client = httpx.AsyncClient(timeout=300.0)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 (close_client() 이후에도 다시 생성)"""
+        return get_client()
 
     async def check_connection(self) -> bool:
         """Ollama 서버 연결 확인"""
@@ -62,21 +130,15 @@ class OllamaClient:
     ) -> AsyncGenerator[str, None]:
         """스트리밍 채팅"""
         try:
-            payload = {
-                "model": model,
-                "messages": messages,
-                "stream": True,
-                "options": {
-                    "temperature": temperature,
-                },
-            }
-
+            options = (
+                {"temperature": temperature, "num_predict": max_tokens}
+                if max_tokens
+                else {"temperature": temperature}
+            )
+            payload = {"model": model, "messages": messages, "stream": True, "options": options}
             if system:
                 payload["system"] = system
 
-            if max_tokens:
-                payload["options"]["num_predict"] = max_tokens
-
             async with self.client.stream(
                 "POST",
                 f"{self.base_url}/chat",
@@ -88,20 +150,18 @@ class OllamaClient:
                     yield f"[Error: {response.status_code}]"
                     return
 
-                async for line in response.aiter_lines():
-                    if line:
-                        try:
-                            import json
-
-                            data = json.loads(line)
-                            if "message" in data and "content" in data["message"]:
-                                content = data["message"]["content"]
-                                if content:
-                                    yield content
-                            if data.get("done", False):
-                                break
-                        except json.JSONDecodeError:
-                            continue
+                # 한 번의 read에 많은 줄이 들어오면 await 없이 계속 처리하게 되므로
+                # 일정 줄마다 이벤트 루프에 양보해 동시 요청(검색, 헬스 체크)의 지연을 막음
+                parsed = 0
+                async for data in _iter_ndjson(response.aiter_bytes()):
+                    parsed += 1
+                    if parsed % _YIELD_EVERY_LINES == 0:
+                        await asyncio.sleep(0)
+                    content = data.get("message", {}).get("content")
+                    if content:
+                        yield content
+                    if data.get("done", False):
+                        break
         except Exception as e:
             logger.error(f"Stream chat error: {e}")
             yield f"[Error: {str(e)}]"
@@ -133,7 +193,7 @@ class OllamaClient:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return data.get("message", {}).get("content", "")
             else:
                 logger.error(f"Ollama API error: {response.status_code}")
@@ -143,5 +203,4 @@ class OllamaClient:
             return f"[Error: {str(e)}]"
 
     async def close(self):
-        """클라이언트 종료"""
-        await self.client.aclose()
+        """클라이언트 종료 (공유 클라이언트는 close_client()에서 종료하므로 여기서는 유지)"""
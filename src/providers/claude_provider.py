@@ -9,6 +9,7 @@ from loguru import logger
 from src.config.env import EnvConfig
 from .base_provider import BaseLLMProvider, LLMResponse
 from src.exceptions import ProviderError
+from src.models.messages import to_claude_messages
 from src.utils.retry import retry
 
 
@@ -42,12 +43,7 @@ class ClaudeProvider(BaseLLMProvider):
         """
         try:
             # Claude 메시지 형식 변환
-            claude_messages = []
-            for msg in messages:
-                if msg["role"] == "user":
-                    claude_messages.append({"role": "user", "content": msg["content"]})
-                elif msg["role"] == "assistant":
-                    claude_messages.append({"role": "assistant", "content": msg["content"]})
+            claude_messages = to_claude_messages(messages)
             
             # 최신 SDK: messages.stream() 사용
             async with self.client.messages.stream(
@@ -79,10 +75,7 @@ class ClaudeProvider(BaseLLMProvider):
     ) -> LLMResponse:
         """일반 채팅 (비스트리밍, 재시도 로직 포함)"""
         try:
-            claude_messages = []
-            for msg in messages:
-                if msg["role"] in ["user", "assistant"]:
-                    claude_messages.append({"role": msg["role"], "content": msg["content"]})
+            claude_messages = to_claude_messages(messages)
             
             response = await self.client.messages.create(
                 model=model or self.default_model,
@@ -47,9 +47,10 @@ class OpenAIProvider(BaseLLMProvider):
         temperature 기본값: 0.0 (사용자 요청)
         """
         try:
-            openai_messages = messages.copy()
-            if system:
-                openai_messages.insert(0, {"role": "system", "content": system})
+            # 시스템 메시지가 있을 때만 새 리스트 생성 (copy + insert(0) 이중 복사 회피)
+            openai_messages = (
+                [{"role": "system", "content": system}, *messages] if system else messages
+            )
 
             # 최신 SDK: AsyncOpenAI.chat.completions.create 사용
             # 모델별 파라미터 지원 여부 확인
@@ -192,9 +193,10 @@ class OpenAIProvider(BaseLLMProvider):
         temperature 기본값: 0.0 (사용자 요청)
         """
         try:
-            openai_messages = messages.copy()
-            if system:
-                openai_messages.insert(0, {"role": "system", "content": system})
+            # 시스템 메시지가 있을 때만 새 리스트 생성 (copy + insert(0) 이중 복사 회피)
+            openai_messages = (
+                [{"role": "system", "content": system}, *messages] if system else messages
+            )
 
             # 최신 SDK: AsyncOpenAI.chat.completions.create 사용
             # 모델별 파라미터 지원 여부 확인
@@ -26,15 +26,20 @@ class ProviderFactory:
     ]
     
     _instances: dict[str, BaseLLMProvider] = {}
+    _default_name: Optional[str] = None  # 자동 선택된 제공자 이름 (인스턴스 재사용용)
+    _available_providers: Optional[List[str]] = None  # EnvConfig는 import 시점에 고정되므로 한 번만 계산
     
     @classmethod
     def get_available_providers(cls) -> List[str]:
         """
-        사용 가능한 제공자 목록 조회
+        사용 가능한 제공자 목록 조회 (캐싱, clear_cache로 초기화)
         
         Returns:
-            제공자 이름 리스트
+            제공자 이름 리스트 (공유 객체이므로 수정하지 말 것)
         """
+        if cls._available_providers is not None:
+            return cls._available_providers
+        
         available = []
         
         for name, provider_class, env_key in cls.PROVIDER_PRIORITY:
@@ -52,6 +57,7 @@ class ProviderFactory:
             except Exception as e:
                 logger.debug(f"Provider {name} not available: {e}")
         
+        cls._available_providers = available
         return available
     
     @classmethod
@@ -73,14 +79,19 @@ class ProviderFactory:
         Raises:
             ValueError: 사용 가능한 제공자가 없을 때
         """
-        # 캐시된 인스턴스 반환
-        if provider_name and provider_name in cls._instances:
-            return cls._instances[provider_name]
+        # 캐시된 인스턴스 반환 (자동 선택은 이전에 선택된 제공자 재사용)
+        cached_name = provider_name or cls._default_name
+        if cached_name and cached_name in cls._instances:
+            return cls._instances[cached_name]
         
         # 제공자 선택
         if provider_name:
             # 지정된 제공자 사용
-            providers_to_try = [(provider_name, None, None)]
+            providers_to_try = [
+                entry for entry in cls.PROVIDER_PRIORITY if entry[0] == provider_name
+            ]
+            if not providers_to_try:
+                raise ValueError(f"Unknown LLM provider: {provider_name}")
         else:
             # 자동 선택 (환경 변수 기반)
             providers_to_try = cls.PROVIDER_PRIORITY
@@ -120,6 +131,8 @@ class ProviderFactory:
                 if provider.is_available():
                     logger.info(f"Using LLM provider: {name}")
                     cls._instances[name] = provider
+                    if not provider_name:
+                        cls._default_name = name
                     return provider
                 else:
                     logger.debug(f"Provider {name} is not available")
@@ -140,14 +153,16 @@ class ProviderFactory:
         if last_error and "ollama" in str(last_error).lower():
             # Ollama가 없어도 다른 provider가 있을 수 있으므로 에러를 던지지 않음
             # 대신 사용 가능한 provider를 다시 확인
-            for name in cls._provider_classes.keys():
+            for name, provider_class, _ in cls.PROVIDER_PRIORITY:
                 if name == "ollama":
                     continue
                 try:
-                    provider = cls._provider_classes[name]({})
+                    provider = provider_class({})
                     if provider.is_available():
                         logger.info(f"Using LLM provider: {name}")
                         cls._instances[name] = provider
+                        if not provider_name:
+                            cls._default_name = name
                         return provider
                 except Exception as e:
                     logger.debug(f"Provider {name} not available: {e}")
@@ -175,4 +190,6 @@ class ProviderFactory:
                     pass
         
         cls._instances.clear()
+        cls._default_name = None
+        cls._available_providers = None
 
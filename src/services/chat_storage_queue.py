@@ -3,18 +3,29 @@ Chat Storage Queue
 챗 저장을 위한 Redis 메시지 큐 래퍼
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from loguru import logger
 from src.services.redis_message_queue import RedisMessageQueue
 
 
 class ChatStorageQueue:
-    """챗 저장 큐"""
+    """
+    챗 저장 큐
+    
+    플러셔가 실행 중이면 enqueue_chat은 프로세스 로컬 버퍼에 넣고 바로 반환하며,
+    플러셔가 최대 FLUSH_BATCH_SIZE개 또는 FLUSH_INTERVAL초 단위로 모아 한 번의 LPUSH로 전송
+    """
     
     QUEUE_NAME = "chat:storage"
+    BUFFER_MAX_SIZE = 1000  # 로컬 버퍼 상한 (초과 시 직접 enqueue로 백프레셔)
+    FLUSH_BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.05  # 초
     
     def __init__(self):
         self.queue = RedisMessageQueue()
+        self._buffer: asyncio.Queue = asyncio.Queue(maxsize=self.BUFFER_MAX_SIZE)
+        self._flusher_task: Optional[asyncio.Task] = None
     
     async def enqueue_chat(
         self,
@@ -35,7 +46,7 @@ class ChatStorageQueue:
             related_stocks: 관련 종목 코드 (선택)
             
         Returns:
-            성공 여부
+            성공 여부 (버퍼에 넣은 경우 True)
         """
         if not userId:
             logger.warning("Cannot enqueue chat: userId is missing")
@@ -50,6 +61,14 @@ class ChatStorageQueue:
             "timestamp": None,  # Worker에서 설정
         }
         
+        if self._flusher_task is not None and not self._flusher_task.done():
+            try:
+                self._buffer.put_nowait(chat_data)
+                return True
+            except asyncio.QueueFull:
+                # 백프레셔: 버퍼가 가득 차면 호출 측이 Redis 왕복을 직접 기다림
+                logger.warning("Chat storage buffer is full, enqueueing directly")
+        
         success = await self.queue.enqueue(self.QUEUE_NAME, chat_data)
         if success:
             logger.debug(f"Chat storage queued for user: {userId}")
@@ -58,7 +77,80 @@ class ChatStorageQueue:
         
         return success
     
+    def start_flusher(self) -> None:
+        """버퍼 플러셔 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+    
+    async def stop_flusher(self) -> None:
+        """플러셔 중지 후 버퍼에 남은 챗을 모두 전송"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        
+        while not self._buffer.empty():
+            await self._flush(self._drain_buffer())
+    
+    def _drain_buffer(self) -> List[Dict[str, Any]]:
+        """버퍼에서 대기 없이 최대 FLUSH_BATCH_SIZE개 꺼내기"""
+        batch = []
+        while len(batch) < self.FLUSH_BATCH_SIZE and not self._buffer.empty():
+            batch.append(self._buffer.get_nowait())
+        return batch
+    
+    async def _flush_loop(self) -> None:
+        """첫 챗이 들어오면 FLUSH_INTERVAL 동안 더 모아서 전송"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._buffer.get()]
+            deadline = loop.time() + self.FLUSH_INTERVAL
+            try:
+                while len(batch) < self.FLUSH_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._buffer.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # 취소되더라도 이미 꺼낸 챗은 전송 (유실 방지)
+                await asyncio.shield(self._flush(batch))
+    
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """모은 챗을 한 번의 LPUSH로 전송"""
+        if not batch:
+            return
+        try:
+            queued = await self.queue.enqueue_batch(self.QUEUE_NAME, batch)
+        except Exception as e:
+            logger.error(f"Failed to flush chat storage buffer: {e}")
+            return
+        if queued < len(batch):
+            logger.warning(f"Chat storage flush dropped {len(batch) - queued}/{len(batch)} chats")
+    
     def get_queue_length(self) -> int:
         """대기 중인 챗 저장 작업 수"""
         return self.queue.get_queue_length(self.QUEUE_NAME)
 
+
+# 프로세스 전역 인스턴스 (요청마다 큐/연결을 새로 만들지 않도록 재사용)
+_chat_storage_queue: Optional[ChatStorageQueue] = None
+
+
+def get_chat_storage_queue() -> ChatStorageQueue:
+    """
+    챗 저장 큐 인스턴스 반환 (싱글톤)
+
+    Returns:
+        ChatStorageQueue 인스턴스
+    """
+    global _chat_storage_queue
+
+    if _chat_storage_queue is None:
+        _chat_storage_queue = ChatStorageQueue()
+    return _chat_storage_queue
@@ -3,12 +3,93 @@ Chat Storage Service
 챗 히스토리 백엔드 저장 서비스
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import re
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+import httpx
+import orjson
 from loguru import logger
 
 from src.config.env import EnvConfig
-from src.config.managers import get_http_client_manager
 from src.interfaces.services.sync_service import ISyncService
+from src.utils.cache import LocalLRUCache, hash_key
+
+# 6자리 숫자 패턴 (한국 주식 코드)
+_STOCK_CODE_RE = re.compile(r"\b[0-9]{6}\b")
+
+# 개념별 키워드 (앞에 있는 개념이 우선)
+_CONCEPT_KEYWORDS = (
+    ("stock_price", ("주가", "가격", "시세", "종가")),
+    ("analysis", ("분석", "전망", "예측")),
+    ("news", ("뉴스", "기사", "공시")),
+)
+_CONCEPT_BY_KEYWORD = {keyword: concept for concept, keywords in _CONCEPT_KEYWORDS for keyword in keywords}
+# 종목 코드와 모든 개념 키워드를 하나의 alternation으로 묶어 질문을 한 번만 스캔
+_CODE_OR_CONCEPT_RE = re.compile(
+    rf"(?P<code>{_STOCK_CODE_RE.pattern})|(?P<keyword>{'|'.join(map(re.escape, _CONCEPT_BY_KEYWORD))})"
+)
+
+# 공유 HTTP 클라이언트 (배치 청크/폴백 동시 요청이 풀 대기에 막히지 않도록 한도 확장)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """공유 httpx.AsyncClient 반환 (지연 초기화)"""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _client
+
+    if _client is not None:
+        try:
+            await _client.aclose()
+        finally:
+            _client = None
+
+# 요청 본문은 orjson으로 미리 직렬화해 content로 전달 (한글을 이스케이프하지 않아 본문도 작음)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 최근 저장한 챗의 응답 해시 (같은 사용자/개념/종목/질문에 같은 응답이면 백엔드 재전송 생략)
+# 응답 원문 대신 해시만 보관해 10,000개 항목의 메모리 사용량을 제한
+_recent_saves = LocalLRUCache(maxsize=10_000, ttl=3600)
+
+
+def _dedup_key(userId: str, concept: str, related_stocks: List[str], question: str) -> str:
+    """중복 저장 판별 키 (종목 코드는 순서 무관)"""
+    return f"{userId}:{concept}:{','.join(sorted(related_stocks))}:{hash_key(question)}"
+
+
+def _pick_concept(found: set) -> str:
+    """찾은 개념 중 우선순위가 가장 높은 개념 (없으면 "chat")"""
+    for concept, _ in _CONCEPT_KEYWORDS:
+        if concept in found:
+            return concept
+    return "chat"
+
+
+# 질문 기준 추출 결과 메모이제이션 (템플릿 질문 등 같은 질문이 반복되는 배치용, 결과는 불변 tuple)
+# 응답은 매번 달라 캐시 적중이 거의 없고 긴 문자열만 붙잡으므로 메모이제이션하지 않음
+@lru_cache(maxsize=4096)
+def _question_codes_and_concept(question: str) -> Tuple[Tuple[str, ...], str]:
+    """질문의 종목 코드(중복 제거, 등장 순서 유지)와 개념 (코드+키워드 결합 패턴으로 한 번만 스캔)"""
+    codes = {}  # 등장 순서를 유지하는 중복 제거
+    found = set()
+    for match in _CODE_OR_CONCEPT_RE.finditer(question):
+        if match.lastgroup == "code":
+            codes[match.group()] = None
+        else:
+            found.add(_CONCEPT_BY_KEYWORD[match.group()])
+    return tuple(codes), _pick_concept(found)
 
 
 class ChatStorageService:
@@ -20,50 +101,36 @@ class ChatStorageService:
     - POST /api/learning 엔드포인트 사용
     """
 
+    BATCH_CHUNK_CONCURRENCY = 5  # 큰 배치를 나눌 때 동시에 보내는 청크 수 (백엔드 보호)
+    FALLBACK_CONCURRENCY = 20  # 개별 저장 폴백의 동시 요청 수
+
     def __init__(self):
         self.backend_url = EnvConfig.BACKEND_API_URL
-        http_client_manager = get_http_client_manager()
         # HTTP 클라이언트 재사용 (연결 풀링)
-        self.client = http_client_manager.get_async_client(timeout=30.0)
-
-    def _extract_stock_codes(self, text: str) -> List[str]:
-        """
-        텍스트에서 종목 코드 추출 (6자리 숫자)
+        self.client = get_client()
 
-        Args:
-            text: 분석할 텍스트
-
-        Returns:
-            추출된 종목 코드 리스트
-        """
-        import re
-
-        # 6자리 숫자 패턴 (한국 주식 코드)
-        pattern = r"\b\d{6}\b"
-        codes = re.findall(pattern, text)
-        return list(set(codes))  # 중복 제거
-
-    def _extract_concept(self, question: str) -> str:
+    def _fill_metadata(
+        self,
+        question: str,
+        answer: str,
+        related_stocks: Optional[List[str]],
+        concept: Optional[str],
+    ) -> Tuple[List[str], str]:
         """
-        질문에서 개념 추출 (간단한 키워드 기반)
+        제공되지 않은 관련 종목 코드/개념 자동 추출
 
-        Args:
-            question: 사용자 질문
-
-        Returns:
-            추출된 개념 (기본값: "chat")
+        질문은 메모이제이션된 결합 스캔 한 번, 응답은 코드 패턴으로만 매번 스캔 (개념은 질문 기준)
         """
-        question_lower = question.lower()
-
-        # 키워드 기반 개념 추출
-        if any(keyword in question_lower for keyword in ["주가", "가격", "시세", "종가"]):
-            return "stock_price"
-        elif any(keyword in question_lower for keyword in ["분석", "전망", "예측"]):
-            return "analysis"
-        elif any(keyword in question_lower for keyword in ["뉴스", "기사", "공시"]):
-            return "news"
-        else:
-            return "chat"
+        if related_stocks is not None and concept is not None:
+            return related_stocks, concept
+        question_codes, question_concept = _question_codes_and_concept(question)
+        if related_stocks is None:
+            codes = dict.fromkeys(question_codes)
+            codes.update(dict.fromkeys(_STOCK_CODE_RE.findall(answer)))
+            related_stocks = list(codes)
+        if concept is None:
+            concept = question_concept
+        return related_stocks, concept
 
     async def save_chat(
         self,
@@ -106,29 +173,32 @@ class ChatStorageService:
             question = question.strip()
             answer = answer.strip()
             
-            # 관련 종목 코드 자동 추출 (제공되지 않은 경우)
-            if related_stocks is None:
-                related_stocks = self._extract_stock_codes(question + " " + answer)
+            # 관련 종목 코드/개념 자동 추출 (제공되지 않은 경우)
+            related_stocks, concept = self._fill_metadata(question, answer, related_stocks, concept)
 
-            # 개념 자동 추출 (제공되지 않은 경우)
-            if concept is None:
-                concept = self._extract_concept(question)
+            # 같은 질문/응답을 최근에 저장했다면 백엔드 호출 생략
+            dedup_key = _dedup_key(userId, concept, related_stocks, question)
+            answer_hash = hash_key(answer)
+            if _recent_saves.get(dedup_key) == answer_hash:
+                logger.debug(f"Duplicate chat skipped (user: {userId})")
+                return True
 
             # 백엔드 API 호출
             response = await self.client.post(
                 f"{self.backend_url}/api/learning",
-                json={
+                content=orjson.dumps({
                     "userId": userId,
                     "concept": concept,
                     "question": question,
                     "answer": answer,
                     "relatedStocks": related_stocks,  # 백엔드 API는 camelCase 사용
-                },
-                headers={"Content-Type": "application/json"},
+                }),
+                headers=_JSON_HEADERS,
             )
 
             # 201 (동기 처리) 또는 202 (비동기 큐 처리) 모두 성공으로 처리
             if response.status_code in (201, 202):
+                _recent_saves.set(dedup_key, answer_hash)
                 try:
                     data = response.json()
                     if response.status_code == 201:
@@ -190,17 +260,13 @@ class ChatStorageService:
                     logger.warning("Skipping chat without userId")
                     continue
                 
-                # 관련 종목 코드 자동 추출
-                related_stocks = chat.get("related_stocks")
-                if related_stocks is None:
-                    related_stocks = self._extract_stock_codes(
-                        chat.get("question", "") + " " + chat.get("answer", "")
-                    )
-                
-                # 개념 자동 추출
-                concept = chat.get("concept")
-                if concept is None:
-                    concept = self._extract_concept(chat.get("question", ""))
+                # 관련 종목 코드/개념 자동 추출
+                related_stocks, concept = self._fill_metadata(
+                    chat.get("question", ""),
+                    chat.get("answer", ""),
+                    chat.get("related_stocks"),
+                    chat.get("concept"),
+                )
                 
                 batch_data.append({
                     "userId": chat["userId"],
@@ -220,13 +286,27 @@ class ChatStorageService:
                     f"Batch size {len(batch_data)} exceeds maximum {MAX_BATCH_SIZE}, "
                     "splitting into smaller batches"
                 )
-                # 배치를 나눠서 처리
-                total_saved = 0
-                for i in range(0, len(batch_data), MAX_BATCH_SIZE):
-                    chunk = batch_data[i:i + MAX_BATCH_SIZE]
-                    saved = await self._save_batch_chunk(chunk)
-                    total_saved += saved
-                return total_saved
+                # 배치를 나눠서 동시에 처리 (세마포어로 동시 요청 수 제한)
+                semaphore = asyncio.Semaphore(self.BATCH_CHUNK_CONCURRENCY)
+
+                async def save_chunk(chunk: List[Dict[str, Any]]) -> int:
+                    async with semaphore:
+                        return await self._save_batch_chunk(chunk)
+
+                results = await asyncio.gather(
+                    *(
+                        save_chunk(batch_data[i:i + MAX_BATCH_SIZE])
+                        for i in range(0, len(batch_data), MAX_BATCH_SIZE)
+                    ),
+                    return_exceptions=True,
+                )
+                saved_count = 0
+                for result in results:
+                    if isinstance(result, BaseException):
+                        logger.warning(f"Batch chunk storage failed: {type(result).__name__}: {result}")
+                    else:
+                        saved_count += result
+                return saved_count
             
             # 배치 저장 API 호출
             return await self._save_batch_chunk(batch_data)
@@ -240,8 +320,8 @@ class ChatStorageService:
         try:
             response = await self.client.post(
                 f"{self.backend_url}/api/learning/batch",
-                json=batch_data,
-                headers={"Content-Type": "application/json"},
+                content=orjson.dumps(batch_data),
+                headers=_JSON_HEADERS,
             )
             
             # 201 (동기 처리) 또는 202 (비동기 큐 처리) 모두 성공으로 처리
@@ -275,25 +355,28 @@ class ChatStorageService:
             return await self._fallback_individual_saves(batch_data)
     
     async def _fallback_individual_saves(self, batch_data: List[Dict[str, Any]]) -> int:
-        """폴백: 개별 저장 (내부 헬퍼 메서드)"""
-        success_count = 0
-        for chat_data in batch_data:
-            try:
-                response = await self.client.post(
-                    f"{self.backend_url}/api/learning",
-                    json=chat_data,
-                    headers={"Content-Type": "application/json"},
-                )
-                if response.status_code in (201, 202):
-                    success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to save chat in batch fallback: {e}")
-        
-        return success_count
+        """폴백: 개별 저장 (내부 헬퍼 메서드, 세마포어로 제한한 동시 요청)"""
+        semaphore = asyncio.Semaphore(self.FALLBACK_CONCURRENCY)
+
+        async def save_one(chat_data: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    response = await self.client.post(
+                        f"{self.backend_url}/api/learning",
+                        content=orjson.dumps(chat_data),
+                        headers=_JSON_HEADERS,
+                    )
+                    return response.status_code in (201, 202)
+                except Exception as e:
+                    logger.error(f"Failed to save chat in batch fallback: {e}")
+                    return False
+
+        results = await asyncio.gather(*(save_one(chat_data) for chat_data in batch_data))
+        return sum(results)
 
     async def close(self):
         """리소스 정리"""
-        # HTTP 클라이언트는 싱글톤이므로 여기서 닫지 않음
-        # 실제로는 HTTPClientManager에서 관리
+        # HTTP 클라이언트는 모듈 공유 인스턴스이므로 여기서 닫지 않음
+        # 애플리케이션 종료 시 close_client()로 정리
         pass
 
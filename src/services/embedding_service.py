@@ -3,17 +3,53 @@ Embedding Service
 OpenAI Embeddings를 사용한 텍스트 임베딩 생성
 """
 
-from typing import List
-from openai import OpenAI
+import asyncio
+import functools
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
 from loguru import logger
-import hashlib
 
 from src.config.env import EnvConfig
 from src.config.cost_optimization import CostOptimizationConfig  # 비용 최적화
 from src.exceptions import EmbeddingError
 from src.utils.retry import retry
-from src.utils.cache import cache  # Redis 캐시 (폴백: 인메모리)
-from src.utils.concurrency import distributed_lock, semaphore  # 동시성 제어
+from src.utils.cache import embedding_cache, hash_key  # Redis 캐시 + L1 (폴백: 인메모리)
+from src.utils.concurrency import DistributedLock, semaphore  # 동시성 제어
+from src.utils.parsers import count_tokens  # 배치 토큰 예산 계산
+
+
+def pack_batches(
+    texts: List[str],
+    token_counts: List[int],
+    max_tokens: int,
+    max_items: int,
+) -> Iterator[List[str]]:
+    """
+    토큰 예산 기반 배치 구성 (순서 유지, 그리디)
+
+    누적 토큰이 max_tokens를 넘거나 개수가 max_items에 도달하면 새 배치 시작
+    (단일 텍스트가 max_tokens를 넘으면 단독 배치)
+
+    Args:
+        texts: 텍스트 리스트
+        token_counts: 텍스트별 토큰 수
+        max_tokens: 배치당 최대 토큰 수
+        max_items: 배치당 최대 텍스트 수
+
+    Yields:
+        텍스트 배치
+    """
+    batch: List[str] = []
+    batch_tokens = 0
+    for text, count in zip(texts, token_counts):
+        if batch and (batch_tokens + count > max_tokens or len(batch) >= max_items):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += count
+    if batch:
+        yield batch
 
 
 class EmbeddingService:
@@ -26,21 +62,82 @@ class EmbeddingService:
             raise ValueError("OPENAI_API_KEY is required for EmbeddingService")
 
         self.client = OpenAI(api_key=api_key)
+        self.aclient = AsyncOpenAI(api_key=api_key)  # 비동기 경로용 (이벤트 루프 블로킹 방지)
         # 비용 최적화: text-embedding-3-small 사용
         # - 비용: $0.01/1M tokens (배치), $0.02/1M tokens (일반)
         # - text-embedding-3-large 대비 6.5배 저렴, 성능 차이 미미
         self.default_model = CostOptimizationConfig.get_embedding_model()
-        self.cache = cache  # Redis 캐시 (폴백: 인메모리)
+        self.cache = embedding_cache  # Redis 캐시 + 프로세스 내 L1 (폴백: 인메모리)
         self.cache_ttl = CostOptimizationConfig.EMBEDDING_CACHE_TTL
         
         # 비용 최적화 설정
         self.batch_size = CostOptimizationConfig.EMBEDDING_BATCH_SIZE  # 배치 처리로 비용 50% 절감
         self.max_retries = 3  # 재시도 횟수
+        self.batch_concurrency = 3  # 비동기 배치 동시 요청 수 (embedding_batch 세마포어 한도와 동일)
+        self.lock_wait_seconds = 5.0  # 다른 프로세스가 생성 중일 때 캐시 폴링 시간
+
+    def _get_content_hash(self, text: str, model: str) -> str:
+        """(텍스트, 모델) 해시 - 캐시 키와 락 키가 공유"""
+        return hash_key(f"{text}:{model or self.default_model}")
 
     def _get_cache_key(self, text: str, model: str) -> str:
         """캐시 키 생성"""
-        content = f"{text}:{model or self.default_model}"
-        return f"embedding:{hashlib.md5(content.encode()).hexdigest()}"
+        return f"embedding:{self._get_content_hash(text, model)}"
+
+    def _group_texts(self, texts: List[str], model: str) -> Tuple[Dict[str, List[int]], List[str]]:
+        """중복 텍스트를 묶음 → (텍스트 → 입력 위치 리스트, 고유 텍스트 순서의 캐시 키)"""
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(text, []).append(i)
+        return positions, [self._get_cache_key(text, model) for text in positions]
+
+    @staticmethod
+    def _split_cached(
+        size: int, positions: Dict[str, List[int]], cached: List[Optional[List[float]]]
+    ) -> Tuple[List[Optional[List[float]]], Dict[str, List[int]]]:
+        """
+        일괄 캐시 조회 결과를 결과 슬롯과 캐시 미스로 분리
+
+        Returns:
+            (입력 순서의 결과 슬롯 - 캐시 히트만 채워짐, 캐시 미스 텍스트 → 입력 위치 리스트)
+        """
+        results: List[Optional[List[float]]] = [None] * size
+        misses: Dict[str, List[int]] = {}
+        for (text, indices), embedding in zip(positions.items(), cached):
+            if embedding is None:
+                misses[text] = indices
+            else:
+                for i in indices:
+                    results[i] = embedding
+        return results, misses
+
+    def _lookup_cached(
+        self, texts: List[str], model: str
+    ) -> Tuple[List[Optional[List[float]]], Dict[str, List[int]]]:
+        """중복 텍스트를 묶고 캐시를 일괄 조회 (배치 임베딩 전처리, Redis 왕복 1회)"""
+        positions, keys = self._group_texts(texts, model)
+        return self._split_cached(len(texts), positions, self.cache.get_many(keys))
+
+    async def _lookup_cached_async(
+        self, texts: List[str], model: str
+    ) -> Tuple[List[Optional[List[float]]], Dict[str, List[int]]]:
+        """_lookup_cached의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        positions, keys = self._group_texts(texts, model)
+        return self._split_cached(len(texts), positions, await self.cache.aget_many(keys))
+
+    def _store_created(
+        self,
+        results: List[Optional[List[float]]],
+        misses: Dict[str, List[int]],
+        embeddings: List[List[float]],
+        model: str,
+    ) -> List[List[float]]:
+        """새로 만든 임베딩을 캐시에 저장하고 중복 위치까지 결과 슬롯에 채움"""
+        for (text, indices), embedding in zip(misses.items(), embeddings):
+            self.cache.set(self._get_cache_key(text, model), embedding, self.cache_ttl)
+            for i in indices:
+                results[i] = embedding
+        return results
 
     @retry(max_attempts=3, exceptions=(Exception,))
     def create_embedding(
@@ -60,21 +157,34 @@ class EmbeddingService:
         Raises:
             EmbeddingError: 임베딩 생성 실패 시
         """
+        # 해시는 한 번만 계산해 캐시 키와 락 키에 재사용
+        content_hash = self._get_content_hash(text, model)
+        cache_key = f"embedding:{content_hash}"
+
         # 캐시 확인
         if use_cache:
-            cache_key = self._get_cache_key(text, model)
             cached = self.cache.get(cache_key)
             if cached is not None:
                 logger.debug(f"Embedding cache hit: {cache_key[:16]}...")
                 return cached
 
         # 동일 텍스트 동시 생성 방지 (분산 락)
-        lock_key = f"embedding_lock:{hashlib.md5((text + (model or self.default_model)).encode()).hexdigest()}"
-        
-        with distributed_lock(lock_key, timeout=60, blocking=True):
+        lock = DistributedLock(f"embedding_lock:{content_hash}", timeout=60)
+        acquired = lock.acquire(blocking=False)
+
+        # 다른 프로세스가 생성 중이면 락 대기열에 줄서지 않고 캐시가 채워지길 잠깐 폴링
+        if not acquired and use_cache and lock.client is not None:
+            cached = self._wait_for_cached(cache_key, self.lock_wait_seconds)
+            if cached is not None:
+                logger.debug(f"Embedding cache hit (while locked): {cache_key[:16]}...")
+                return cached
+
+        if not acquired and not lock.acquire(blocking=True, timeout=60):
+            raise RuntimeError(f"Failed to acquire lock: {lock.key}")
+
+        try:
             # 락 획득 후 다시 캐시 확인 (다른 프로세스가 생성했을 수 있음)
             if use_cache:
-                cache_key = self._get_cache_key(text, model)
                 cached = self.cache.get(cache_key)
                 if cached is not None:
                     logger.debug(f"Embedding cache hit (after lock): {cache_key[:16]}...")
@@ -88,7 +198,6 @@ class EmbeddingService:
 
                 # 캐시 저장
                 if use_cache:
-                    cache_key = self._get_cache_key(text, model)
                     self.cache.set(cache_key, embedding, self.cache_ttl)
                     logger.debug(f"Embedding cached: {cache_key[:16]}...")
 
@@ -96,6 +205,40 @@ class EmbeddingService:
             except Exception as e:
                 logger.error(f"Create embedding error: {e}")
                 raise EmbeddingError(f"Failed to create embedding: {str(e)}") from e
+        finally:
+            lock.release()
+
+    def _wait_for_cached(self, cache_key: str, wait_seconds: float) -> Optional[List[float]]:
+        """다른 프로세스가 캐시를 채울 때까지 100ms 간격으로 짧게 폴링 (없으면 None)"""
+        deadline = time.monotonic() + wait_seconds
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        return None
+
+    async def create_embedding_async(
+        self, text: str, model: str = None, use_cache: bool = True
+    ) -> List[float]:
+        """
+        단일 텍스트 임베딩 생성 (비동기)
+
+        캐시/분산 락/동기 OpenAI 호출이 얽힌 create_embedding을 기본 스레드 풀에서 실행해
+        이벤트 루프를 막지 않음
+
+        Args:
+            text: 임베딩할 텍스트
+            model: 사용할 모델 (기본값: text-embedding-3-small)
+            use_cache: 캐시 사용 여부 (기본값: True)
+
+        Returns:
+            임베딩 벡터
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.create_embedding, text, model, use_cache)
+        )
 
     @retry(max_attempts=3, exceptions=(Exception,))
     def create_embeddings_batch(
@@ -117,15 +260,31 @@ class EmbeddingService:
         if not texts:
             return []
 
+        # 중복 텍스트/캐시 히트는 API로 보내지 않음
+        results, misses = self._lookup_cached(texts, model)
+        if not misses:
+            logger.debug(f"All {len(texts)} embeddings served from cache")
+            return results
+        texts = list(misses)
+
         embeddings = []
         # 비용 최적화: 배치 처리로 비용 50% 절감 ($0.02 → $0.01 per 1M tokens)
-        batch_size = self.batch_size
+        # 고정 개수 대신 토큰 예산으로 묶어 요청 수 최소화
+        token_counts = [count_tokens(text) for text in texts]
+        batches = pack_batches(
+            texts,
+            token_counts,
+            max_tokens=CostOptimizationConfig.EMBEDDING_MAX_BATCH_TOKENS,
+            max_items=self.batch_size,
+        )
 
         # 배치 처리 시 동시 실행 수 제한 (세마포어)
         with semaphore("embedding_batch", limit=3, timeout=300):
             try:
-                for i in range(0, len(texts), batch_size):
-                    batch = texts[i : i + batch_size]
+                for i, batch in enumerate(batches):
+                    # 비용 최적화: 배치 간 짧은 지연 (API 제한 고려)
+                    if i > 0:
+                        time.sleep(CostOptimizationConfig.EMBEDDING_BATCH_DELAY)
 
                     # 배치 임베딩 생성 (비용 50% 절감)
                     response = self.client.embeddings.create(
@@ -134,14 +293,68 @@ class EmbeddingService:
 
                     for embedding in response.data:
                         embeddings.append(embedding.embedding)
-                    
-                    # 비용 최적화: 배치 간 짧은 지연 (API 제한 고려)
-                    import time
-                    if i + batch_size < len(texts):
-                        time.sleep(CostOptimizationConfig.EMBEDDING_BATCH_DELAY)
 
                 logger.info(f"Created {len(embeddings)} embeddings in batch (cost optimized)")
-                return embeddings
+                return self._store_created(results, misses, embeddings, model)
             except Exception as e:
                 logger.error(f"Create embeddings batch error: {e}")
                 raise EmbeddingError(f"Failed to create embeddings batch: {str(e)}") from e
+
+    @retry(max_attempts=3, exceptions=(Exception,))
+    async def create_embeddings_batch_async(
+        self, texts: List[str], model: str = None
+    ) -> List[List[float]]:
+        """
+        배치 임베딩 생성 (비동기, 이벤트 루프를 막지 않음)
+
+        create_embeddings_batch와 같은 방식으로 배치를 구성하되,
+        배치들을 batch_concurrency개까지 동시에 요청
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            model: 사용할 모델 (기본값: text-embedding-3-small)
+
+        Returns:
+            임베딩 벡터 리스트 (입력 순서 유지)
+
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 시
+        """
+        if not texts:
+            return []
+
+        # 중복 텍스트/캐시 히트는 API로 보내지 않음
+        results, misses = await self._lookup_cached_async(texts, model)
+        if not misses:
+            logger.debug(f"All {len(texts)} embeddings served from cache")
+            return results
+        texts = list(misses)
+
+        token_counts = [count_tokens(text) for text in texts]
+        batches = pack_batches(
+            texts,
+            token_counts,
+            max_tokens=CostOptimizationConfig.EMBEDDING_MAX_BATCH_TOKENS,
+            max_items=self.batch_size,
+        )
+        slots = asyncio.Semaphore(self.batch_concurrency)
+
+        async def embed(i: int, batch: List[str]) -> List[List[float]]:
+            async with slots:
+                # 첫 동시 요청 이후에는 슬롯마다 지연 (API 제한 고려)
+                if i >= self.batch_concurrency:
+                    await asyncio.sleep(CostOptimizationConfig.EMBEDDING_BATCH_DELAY)
+                response = await self.aclient.embeddings.create(
+                    model=model or self.default_model, input=batch
+                )
+                return [embedding.embedding for embedding in response.data]
+
+        try:
+            created = await asyncio.gather(*(embed(i, batch) for i, batch in enumerate(batches)))
+        except Exception as e:
+            logger.error(f"Create embeddings batch error: {e}")
+            raise EmbeddingError(f"Failed to create embeddings batch: {str(e)}") from e
+
+        embeddings = [embedding for batch in created for embedding in batch]
+        logger.info(f"Created {len(embeddings)} embeddings in batch (async, cost optimized)")
+        return await asyncio.to_thread(self._store_created, results, misses, embeddings, model)
@@ -4,7 +4,9 @@ Indexing Service
 트랜잭션 기반 정합성 보장
 """
 
+import asyncio
 from typing import List, Dict, Optional
+import numpy as np
 from loguru import logger
 
 from src.services.embedding_service import EmbeddingService
@@ -13,13 +15,19 @@ from src.utils.parsers import (
     parse_news_for_indexing,
     parse_stock_for_indexing,
     parse_learning_for_indexing,
-    chunk_text,
+    chunk_text_by_tokens,
 )
 from src.utils.transaction import transactional, SagaTransaction, create_saga
 from src.exceptions import VectorSearchError, EmbeddingError
 from src.config.cost_optimization import CostOptimizationConfig  # 비용 최적화
 
 
+def _join_sentences(sentences: List[str]) -> str:
+    """문장들을 ". "로 연결 (이미 마침표로 끝나면 마침표를 덧붙이지 않음)"""
+    chunk = ". ".join(sentences)
+    return chunk if chunk.endswith(".") else chunk + "."
+
+
 class IndexingService:
     """
     인덱싱 서비스 (최신 RAG 패턴 적용)
@@ -42,6 +50,8 @@ class IndexingService:
         self.chunk_size = CostOptimizationConfig.CHUNK_SIZE_CHARS  # 2000자 (512 토큰)
         self.chunk_overlap = CostOptimizationConfig.CHUNK_OVERLAP_RATIO  # 15% 오버랩
         self.batch_size = CostOptimizationConfig.INDEXING_BATCH_SIZE  # 100개 배치
+        # 배치 인덱싱 동시 실행 수 제한 (임베딩 API/벡터 DB 보호)
+        self._index_sem = asyncio.Semaphore(10)
 
     def _adaptive_chunk(
         self,
@@ -69,8 +79,10 @@ class IndexingService:
         if max_chunk_size is None:
             max_chunk_size = CostOptimizationConfig.get_optimal_chunk_size(len(text))
 
-        # 문장 단위로 분할
+        # 문장 단위로 분할 (C 수준 split이 정규식/커서 스캔보다 빠름)
         sentences = text.split(". ")
+        if len(sentences) > 1 and not sentences[-1].strip():
+            sentences.pop()  # ". "로 끝나는 텍스트의 빈 꼬리 제거
         chunks = []
         current_chunk = []
         current_size = 0
@@ -80,7 +92,7 @@ class IndexingService:
 
             if current_size + sentence_size > max_chunk_size and current_chunk:
                 # 현재 청크 저장
-                chunks.append(". ".join(current_chunk) + ".")
+                chunks.append(_join_sentences(current_chunk))
                 # 오버랩을 위해 마지막 문장 유지
                 overlap_sentences = current_chunk[-1:] if len(current_chunk) > 1 else []
                 current_chunk = overlap_sentences + [sentence]
@@ -91,7 +103,7 @@ class IndexingService:
 
         # 마지막 청크 추가
         if current_chunk:
-            chunks.append(". ".join(current_chunk) + ".")
+            chunks.append(_join_sentences(current_chunk))
 
         # 최소 크기 미만 청크는 이전 청크와 병합 (청크 수 최소화 = 비용 절감)
         filtered_chunks = []
@@ -166,10 +178,10 @@ class IndexingService:
             if use_adaptive_chunking:
                 chunks = self._adaptive_chunk(parsed["text"])
             else:
-                chunks = chunk_text(
+                chunks = chunk_text_by_tokens(
                     parsed["text"],
-                    chunk_size=self.chunk_size * 4,
-                    overlap=int(self.chunk_size * 4 * self.chunk_overlap),
+                    max_tokens=CostOptimizationConfig.CHUNK_SIZE_TOKENS,
+                    overlap=self.chunk_overlap,
                 )
 
             # 벡터 생성 및 인덱싱 (비용 최적화: 배치 처리)
@@ -179,16 +191,18 @@ class IndexingService:
             # 비용 최적화: 청크가 많으면 배치 임베딩 생성
             if len(chunks) >= 2:
                 # 배치 임베딩 생성 (비용 50% 절감)
-                chunk_texts = [chunk for chunk in chunks]
-                embeddings = self.embedding_service.create_embeddings_batch(chunk_texts)
+                embeddings = await self.embedding_service.create_embeddings_batch_async(chunks)
             else:
                 # 단일 임베딩 생성
                 embeddings = (
-                    [self.embedding_service.create_embedding(chunks[0])]
+                    [await self.embedding_service.create_embedding_async(chunks[0])]
                     if chunks
                     else []
                 )
 
+            # float32 연속 버퍼로 보관 (float 객체 리스트 대비 메모리 약 1/8, 업로드 시 리스트로 변환)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+
             for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
 
                 # 메타데이터 강화
@@ -213,14 +227,15 @@ class IndexingService:
             # Saga 패턴으로 벡터 DB 업로드 (보상 트랜잭션 지원)
             saga = create_saga()
 
+            vector_ids = [v["id"] for v in vectors]
+
             async def upsert_vectors():
                 """벡터 업로드 작업"""
                 self.vector_search_service.upsert(vectors, batch_size=self.batch_size)
-                return vectors
+                return vector_ids
 
             async def rollback_vectors():
-                """보상 작업: 벡터 삭제"""
-                vector_ids = [v["id"] for v in vectors]
+                """보상 작업: 벡터 삭제 (ID만 참조해 트랜잭션 동안 임베딩을 붙잡지 않음)"""
                 self.vector_search_service.delete(vector_ids)
                 logger.info(f"Compensated: deleted {len(vector_ids)} vectors")
 
@@ -245,7 +260,7 @@ class IndexingService:
             await saga.execute()
 
             logger.info(f"Indexed news: {parent_id} ({len(vectors)} chunks)")
-            return [v["id"] for v in vectors]
+            return list(vector_ids)
 
         except Exception as e:
             logger.error(f"Failed to index news: {e}")
@@ -268,7 +283,7 @@ class IndexingService:
             parsed = parse_stock_for_indexing(stock_data)
 
             # 임베딩 생성
-            embedding = self.embedding_service.create_embedding(parsed["text"])
+            embedding = await self.embedding_service.create_embedding_async(parsed["text"])
 
             # 메타데이터 강화
             metadata = self._enrich_metadata(parsed["metadata"], content_type="stock")
@@ -330,15 +345,19 @@ class IndexingService:
         Returns:
             {news_id: [vector_ids]} 딕셔너리
         """
-        results = {}
-
-        for news_data in news_list:
-            try:
-                vector_ids = await self.index_news(news_data, _tx=_tx)
-                results[news_data["id"]] = vector_ids
-            except Exception as e:
-                logger.error(f"Failed to index news {news_data.get('id')}: {e}")
-                # 개별 실패는 기록만 하고 계속 진행
+        async def index_one(news_data: Dict):
+            async with self._index_sem:
+                try:
+                    # 현재 트랜잭션은 @transactional이 전파 (_tx를 직접 넘기면 중복 인자)
+                    return news_data["id"], await self.index_news(news_data)
+                except Exception as e:
+                    logger.error(f"Failed to index news {news_data.get('id')}: {e}")
+                    # 개별 실패는 기록만 하고 계속 진행
+                    return news_data.get("id"), None
+
+        # 뉴스별 인덱싱을 동시에 실행 (세마포어로 동시 실행 수 제한)
+        pairs = await asyncio.gather(*(index_one(news_data) for news_data in news_list))
+        results = {news_id: vector_ids for news_id, vector_ids in pairs if vector_ids is not None}
 
         logger.info(f"Batch indexed {len(results)} news items")
         return results
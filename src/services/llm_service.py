@@ -6,8 +6,20 @@ Large Language Model 서비스 (Provider 추상화 사용)
 from typing import AsyncGenerator, List, Dict, Optional
 from src.providers import ProviderFactory, BaseLLMProvider
 from src.models.model_config import ModelConfigManager
+from src.models.llm_provider import LLMProvider
 from loguru import logger
 
+# 모델 provider → ProviderFactory 제공자 이름
+_PROVIDER_NAME = {
+    LLMProvider.OPENAI: "openai",
+    LLMProvider.ANTHROPIC: "claude",
+    LLMProvider.GOOGLE: "gemini",
+    LLMProvider.OLLAMA: "ollama",
+}
+
+# ProviderFactory 제공자 이름 → 클래스 (현재 provider 재사용 여부 판단용)
+_PROVIDER_CLASS = {name: cls for name, cls, _ in ProviderFactory.PROVIDER_PRIORITY}
+
 
 class LLMService:
     """LLM 서비스 (Provider 추상화 사용)"""
@@ -20,9 +32,10 @@ class LLMService:
             provider: LLM 제공자 (None이면 자동 선택)
         """
         self.provider = provider or ProviderFactory.get_default_provider()
+        self._provider_cache: Dict[LLMProvider, BaseLLMProvider] = {}
         logger.info(f"LLMService initialized with provider: {self.provider.name}")
 
-    async def stream_chat(
+    def stream_chat(
         self,
         model: str,
         messages: List[Dict[str, str]],
@@ -38,8 +51,8 @@ class LLMService:
             system: 시스템 메시지
             temperature: 온도
 
-        Yields:
-            응답 청크
+        Returns:
+            응답 청크 비동기 제너레이터 (provider 스트림을 감싸지 않고 그대로 반환)
         """
         # 모델 설정 조회
         config = ModelConfigManager.get_model_config(model)
@@ -53,14 +66,13 @@ class LLMService:
         provider = self._get_provider_for_model(config.provider)
         
         # Provider를 통한 스트리밍 (에러는 Provider 내부에서 처리)
-        async for chunk in provider.stream_chat(
+        return provider.stream_chat(
             messages=messages,
             model=model,
             system=system,
             temperature=temp,
             max_tokens=config.max_tokens,
-        ):
-            yield chunk
+        )
 
     async def chat(
         self,
@@ -126,39 +138,28 @@ class LLMService:
             return {}
 
     def _get_provider_for_model(self, model_provider):
-        """모델에 맞는 provider 반환"""
-        from src.models.llm_provider import LLMProvider
-        
-        # 모델의 provider와 현재 provider가 같으면 현재 provider 사용
-        if model_provider == LLMProvider.OPENAI and self.provider.name == "openai":
-            return self.provider
-        elif model_provider == LLMProvider.ANTHROPIC and self.provider.name == "claude":
-            return self.provider
-        elif model_provider == LLMProvider.GOOGLE and self.provider.name == "gemini":
-            return self.provider
-        elif model_provider == LLMProvider.OLLAMA and self.provider.name == "ollama":
-            return self.provider
-        
-        # 다른 provider가 필요하면 동적으로 가져오기
-        try:
-            if model_provider == LLMProvider.OPENAI:
-                return ProviderFactory.get_provider("openai")
-            elif model_provider == LLMProvider.ANTHROPIC:
-                return ProviderFactory.get_provider("claude")
-            elif model_provider == LLMProvider.GOOGLE:
-                return ProviderFactory.get_provider("gemini")
-            elif model_provider == LLMProvider.OLLAMA:
-                # Ollama는 선택적이므로 실패해도 조용히 처리
-                try:
-                    return ProviderFactory.get_provider("ollama")
-                except:
-                    logger.debug(f"Ollama provider not available, using default")
-                    return self.provider
-        except Exception as e:
-            logger.debug(f"Failed to get provider for {model_provider}, using default: {e}")
+        """모델에 맞는 provider 반환 (한 번 찾은 provider는 재사용)"""
+        provider = self._provider_cache.get(model_provider)
+        if provider is not None:
+            return provider
+
+        name = _PROVIDER_NAME.get(model_provider)
+        if name is None:
             return self.provider
-        
-        return self.provider
+
+        # 모델의 provider와 현재 provider가 같으면 현재 provider 사용
+        if isinstance(self.provider, _PROVIDER_CLASS[name]):
+            provider = self.provider
+        else:
+            # 다른 provider가 필요하면 동적으로 가져오기 (Ollama 등 실패 시 기본 provider)
+            try:
+                provider = ProviderFactory.get_provider(name)
+            except Exception as e:
+                logger.debug(f"Failed to get provider for {model_provider}, using default: {e}")
+                return self.provider
+
+        self._provider_cache[model_provider] = provider
+        return provider
 
     async def close(self):
         """리소스 정리"""
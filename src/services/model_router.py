@@ -3,18 +3,67 @@ Model Router Service
 쿼리 복잡도에 따른 모델 라우팅
 """
 
-from typing import AsyncGenerator, List, Dict, Optional
+import asyncio
+import functools
+import re
+import time
+import unicodedata
+from typing import AsyncGenerator, List, Dict, Optional, Tuple
 from loguru import logger
-import hashlib
 
 from src.utils.query_classifier import QueryClassifier
 from src.services.llm_service import LLMService
 from src.services.slm_service import SLMService
 from src.models.model_config import ModelConfigManager
+from src.models.llm_provider import LLMProvider
 from src.exceptions import AIServiceError, ModelNotFoundError
-from src.utils.cache import cache  # Redis 캐시 (폴백: 인메모리)
+from src.utils.cache import cache, hash_key, LocalLRUCache  # Redis 캐시 (폴백: 인메모리)
 from src.config.cost_optimization import CostOptimizationConfig  # 비용 최적화
 
+# 분류 캐시 키 접두사 (키 스키마 변경 시 버전을 올려 기존 항목을 일괄 무효화)
+_CLASSIFICATION_KEY_PREFIX = "v2:cls:"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_query(query: str) -> str:
+    """
+    캐시 키용 쿼리 정규화 (NFKC, 앞뒤 공백 제거, 소문자, 연속 공백 축약)
+
+    분류기는 소문자/단어 단위로 판단하므로 정규화해도 분류 결과는 같고,
+    공백·대소문자만 다른 쿼리가 같은 캐시 항목을 공유한다.
+    """
+    normalized = unicodedata.normalize("NFKC", query).strip().lower()
+    return _WHITESPACE_RE.sub(" ", normalized)
+
+
+def _classification_key(query: str) -> str:
+    """분류 캐시 키"""
+    return f"{_CLASSIFICATION_KEY_PREFIX}{hash_key(_normalize_query(query))}"
+
+
+# 경량 모델 키워드 (앞쪽일수록 우선)
+_LIGHTWEIGHT_KEYWORDS = ("mini", "haiku", "flash", "phi", "lite")
+
+
+@functools.lru_cache(maxsize=1)
+def _lightweight_by_provider() -> Dict[LLMProvider, Tuple[int, str]]:
+    """
+    provider별 첫 경량 모델 (키워드 우선순위 → MODELS 순서로 한 번만 스캔)
+
+    값의 순위는 전체 스캔 순서이므로, 여러 provider 중 순위가 가장 낮은 모델을
+    고르면 키워드×모델 이중 루프와 같은 결과가 된다.
+    MODELS를 런타임에 변경하면 _lightweight_by_provider.cache_clear() 호출 필요.
+    """
+    table: Dict[LLMProvider, Tuple[int, str]] = {}
+    rank = 0
+    for keyword in _LIGHTWEIGHT_KEYWORDS:
+        for model_name, config in ModelConfigManager.MODELS.items():
+            if keyword in model_name.lower():
+                table.setdefault(config.provider, (rank, model_name))
+                rank += 1
+    return table
+
 
 class ModelRouterService:
     """모델 라우팅 서비스"""
@@ -26,6 +75,19 @@ class ModelRouterService:
         self.classifier = QueryClassifier()
         self.classification_cache = cache  # Redis 캐시 (폴백: 인메모리)
         self.classification_cache_ttl = 3600  # 1시간
+        # Redis 왕복 없이 바로 응답하는 프로세스 내 분류 캐시 (분류 자체는 수 us)
+        self._local_classifications = LocalLRUCache(
+            maxsize=4096, ttl=self.classification_cache_ttl
+        )
+        # 진행 중인 분류 (캐시 키 → Task, 동일 쿼리 동시 요청은 한 번만 분류)
+        self._inflight_classify: Dict[str, asyncio.Task] = {}
+
+        # 경량 모델 캐싱 (성능 최적화)
+        self._lightweight_model_cache = None
+        self._lightweight_model_cache_time = None
+        self._lightweight_model_cache_ttl = 3600  # 1시간
+        # 캐시 미스 시 list_models 호출을 한 번으로 제한 (동시 요청은 대기 후 캐시 사용)
+        self._lightweight_model_lock = asyncio.Lock()
 
     async def route_and_stream(
         self,
@@ -52,15 +114,8 @@ class ModelRouterService:
                 model = force_model
                 service = self._get_service_for_model(model)
             else:
-                # 쿼리 분류 (캐싱)
-                cache_key = f"classification:{hashlib.md5(query.encode()).hexdigest()}"
-                classification = self.classification_cache.get(cache_key)
-
-                if classification is None:
-                    classification = self.classifier.classify(query)
-                    self.classification_cache.set(
-                        cache_key, classification, self.classification_cache_ttl
-                    )
+                # 쿼리 분류 (프로세스 내 캐시 → 미스 시 Redis 비동기 조회/분류)
+                classification = await self._classify(query)
 
                 complexity = classification["complexity"]
 
@@ -113,15 +168,8 @@ class ModelRouterService:
                 model = force_model
                 service = self._get_service_for_model(model)
             else:
-                # 쿼리 분류 (캐싱)
-                cache_key = f"classification:{hashlib.md5(query.encode()).hexdigest()}"
-                classification = self.classification_cache.get(cache_key)
-
-                if classification is None:
-                    classification = self.classifier.classify(query)
-                    self.classification_cache.set(
-                        cache_key, classification, self.classification_cache_ttl
-                    )
+                # 쿼리 분류 (프로세스 내 캐시 → 미스 시 Redis 비동기 조회/분류)
+                classification = await self._classify(query)
 
                 complexity = classification["complexity"]
 
@@ -149,6 +197,65 @@ class ModelRouterService:
             logger.error(f"Model router error: {e}")
             raise AIServiceError(f"Model routing failed: {str(e)}") from e
 
+    async def _classify(self, query: str) -> dict:
+        """
+        쿼리 분류 (프로세스 내 캐시 히트 시 Redis 왕복 없이 반환)
+
+        Args:
+            query: 사용자 쿼리
+
+        Returns:
+            분류 결과
+        """
+        cache_key = _classification_key(query)
+        classification = self._local_classifications.get(cache_key)
+        if classification is not None:
+            return classification
+
+        # 분류는 분리된 태스크로 실행하고 모든 요청이 shield로 기다림
+        # (첫 요청이 취소되어도 같은 쿼리를 기다리는 다른 요청은 결과를 받음)
+        task = self._inflight_classify.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._classify_query(query, cache_key))
+            self._inflight_classify[cache_key] = task
+            task.add_done_callback(functools.partial(self._on_classified, cache_key))
+
+        return await asyncio.shield(task)
+
+    def _on_classified(self, cache_key: str, task: asyncio.Task) -> None:
+        """분류 태스크 완료 시 진행 중 목록에서 제거하고 결과를 프로세스 내 캐시에 저장"""
+        self._inflight_classify.pop(cache_key, None)
+        if task.cancelled():
+            return
+        # exception()으로 결과를 회수해 대기자가 없어도 "never retrieved" 경고가 나지 않도록 함
+        if task.exception() is None:
+            self._local_classifications.set(cache_key, task.result())
+
+    async def _classify_query(
+        self, query: str, cache_key: Optional[str] = None
+    ) -> dict:
+        """
+        쿼리 분류 (공유 캐시 비동기 조회 → 미스 시 분류 후 저장)
+
+        Args:
+            query: 사용자 쿼리
+            cache_key: 미리 계산한 캐시 키 (None이면 계산)
+
+        Returns:
+            분류 결과
+        """
+        cache_key = cache_key or _classification_key(query)
+        classification = await self.classification_cache.aget(cache_key)
+
+        if classification is None:
+            # 분류는 수 us의 키워드 검사이므로 이벤트 루프에서 바로 실행
+            classification = self.classifier.classify(query)
+            await self.classification_cache.aset(
+                cache_key, classification, self.classification_cache_ttl
+            )
+
+        return classification
+
     async def _select_model(
         self, complexity: str, classification: dict
     ) -> tuple[str, object]:
@@ -268,18 +375,16 @@ class ModelRouterService:
         else:
             return "phi3.5"  # Ollama 기본
 
-    def __init__(self):
-        """초기화"""
-        self.llm_service = LLMService()
-        self.slm_service = SLMService()
-        self.classifier = QueryClassifier()
-        self.classification_cache = cache  # Redis 캐시 (폴백: 인메모리)
-        self.classification_cache_ttl = 3600  # 1시간
-
-        # 경량 모델 캐싱 (성능 최적화)
-        self._lightweight_model_cache = None
-        self._lightweight_model_cache_time = None
-        self._lightweight_model_cache_ttl = 3600  # 1시간
+    def _cached_lightweight_model(self) -> Optional[str]:
+        """TTL 내의 캐시된 경량 모델 (없거나 만료 시 None)"""
+        if (
+            self._lightweight_model_cache is not None
+            and self._lightweight_model_cache_time is not None
+            and (time.time() - self._lightweight_model_cache_time)
+            < self._lightweight_model_cache_ttl
+        ):
+            return self._lightweight_model_cache
+        return None
 
     async def _find_mini_model(self) -> Optional[str]:
         """
@@ -289,24 +394,14 @@ class ModelRouterService:
         Returns:
             모델 이름 또는 None
         """
-        import time
         from src.config.env import EnvConfig
-        from src.models.model_config import ModelConfigManager
-        from src.models.llm_provider import LLMProvider
         from src.providers import ProviderFactory
 
         # 캐시 확인
-        current_time = time.time()
-        if (
-            self._lightweight_model_cache is not None
-            and self._lightweight_model_cache_time is not None
-            and (current_time - self._lightweight_model_cache_time)
-            < self._lightweight_model_cache_ttl
-        ):
-            logger.debug(
-                f"Using cached lightweight model: {self._lightweight_model_cache}"
-            )
-            return self._lightweight_model_cache
+        cached = self._cached_lightweight_model()
+        if cached is not None:
+            logger.debug(f"Using cached lightweight model: {cached}")
+            return cached
 
         # 사용 가능한 provider 확인
         available_providers = []
@@ -320,51 +415,41 @@ class ModelRouterService:
 
         # OpenAI: API에서 실제 모델 목록 가져와서 경량 모델 찾기
         if LLMProvider.OPENAI in available_providers:
-            try:
-                openai_provider = ProviderFactory.get_provider("openai")
-                available_models = await openai_provider.list_models()
-
-                # OpenAI provider의 find_lightweight_model 메서드 사용
-                if hasattr(openai_provider, "find_lightweight_model"):
-                    lightweight_model = openai_provider.find_lightweight_model(
-                        available_models
-                    )
-                    if lightweight_model:
-                        # 캐시 저장
-                        self._lightweight_model_cache = lightweight_model
-                        self._lightweight_model_cache_time = current_time
-
-                        logger.info(
-                            f"Found OpenAI lightweight model from API: {lightweight_model}"
+            async with self._lightweight_model_lock:
+                # 락 대기 중 다른 요청이 캐시를 채웠으면 API 호출 생략
+                cached = self._cached_lightweight_model()
+                if cached is not None:
+                    return cached
+
+                try:
+                    openai_provider = ProviderFactory.get_provider("openai")
+                    available_models = await openai_provider.list_models()
+
+                    # OpenAI provider의 find_lightweight_model 메서드 사용
+                    if hasattr(openai_provider, "find_lightweight_model"):
+                        lightweight_model = openai_provider.find_lightweight_model(
+                            available_models
                         )
-                        return lightweight_model
-            except Exception as e:
-                logger.debug(f"Failed to get OpenAI models from API: {e}")
+                        if lightweight_model:
+                            # 캐시 저장
+                            self._lightweight_model_cache = lightweight_model
+                            self._lightweight_model_cache_time = time.time()
+
+                            logger.info(
+                                f"Found OpenAI lightweight model from API: {lightweight_model}"
+                            )
+                            return lightweight_model
+                except Exception as e:
+                    logger.debug(f"Failed to get OpenAI models from API: {e}")
 
         # 다른 provider: 하드코딩된 모델 목록에서 경량 모델 찾기
-        # 1단계: "mini", "haiku", "flash" 등 명확한 경량 키워드 찾기
-        for keyword in ["mini", "haiku", "flash"]:
-            for model_name, config in ModelConfigManager.MODELS.items():
-                if (
-                    keyword in model_name.lower()
-                    and config.provider in available_providers
-                ):
-                    logger.info(
-                        f"Found lightweight model: {model_name} (provider: {config.provider}, keyword: {keyword})"
-                    )
-                    return model_name
-
-        # 2단계: "phi", "lite" 등 다른 경량 키워드 찾기
-        for keyword in ["phi", "lite"]:
-            for model_name, config in ModelConfigManager.MODELS.items():
-                if (
-                    keyword in model_name.lower()
-                    and config.provider in available_providers
-                ):
-                    logger.info(
-                        f"Found lightweight model: {model_name} (provider: {config.provider}, keyword: {keyword})"
-                    )
-                    return model_name
+        # 1~2단계: 미리 계산한 provider별 경량 모델 중 우선순위가 가장 높은 모델
+        table = _lightweight_by_provider()
+        candidates = [table[p] for p in available_providers if p in table]
+        if candidates:
+            _, model_name = min(candidates)
+            logger.info(f"Found lightweight model: {model_name}")
+            return model_name
 
         # 3단계: provider별 기본 경량 모델 (모델 목록에 없을 경우)
         if LLMProvider.OPENAI in available_providers:
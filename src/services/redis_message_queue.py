@@ -5,8 +5,10 @@ Redis 기반 메시지 큐 (비동기 작업 처리)
 """
 
 from typing import Dict, Optional, Any, List
-import json
+import asyncio
+import functools
 import gzip
+import orjson
 import base64
 from loguru import logger
 from src.config.managers import get_redis_manager
@@ -14,6 +16,33 @@ from src.config.env import EnvConfig
 from src.interfaces.message_queue import IMessageQueue
 
 
+# 큐 오른쪽(가장 오래된 쪽)에서 최대 N개를 원자적으로 꺼내는 Lua 스크립트
+# 반환 순서는 리스트 순서(최신 → 오래된)이므로 호출 측에서 뒤집어 FIFO로 사용
+_BATCH_POP_SCRIPT = """
+local queue_key = KEYS[1]
+local batch_size = tonumber(ARGV[1])
+local queue_len = redis.call('llen', queue_key)
+local actual_size = math.min(batch_size, queue_len)
+if actual_size == 0 then
+    return {}
+end
+local messages = redis.call('lrange', queue_key, -actual_size, -1)
+redis.call('ltrim', queue_key, 0, -(actual_size + 1))
+return messages
+"""
+
+
+def _blocking_brpop(client, queue_key: str, timeout: int):
+    """
+    BRPOP을 기본 스레드 풀에서 실행 (이벤트 루프를 막지 않도록)
+    
+    asyncio.to_thread와 달리 컨텍스트 복사(copy_context)를 하지 않음 -
+    BRPOP 호출은 contextvars를 사용하지 않으므로 워커의 dequeue마다 드는 비용만 제거
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, functools.partial(client.brpop, queue_key, timeout=timeout))
+
+
 class RedisMessageQueue(IMessageQueue):
     """Redis 기반 메시지 큐 (대규모 처리 최적화)"""
     
@@ -34,6 +63,13 @@ class RedisMessageQueue(IMessageQueue):
         self.max_queue_length = max_queue_length if max_queue_length is not None else EnvConfig.MAX_QUEUE_LENGTH
         self.enable_compression = enable_compression if enable_compression is not None else EnvConfig.ENABLE_MESSAGE_COMPRESSION
         self.compression_threshold = compression_threshold if compression_threshold is not None else EnvConfig.MESSAGE_COMPRESSION_THRESHOLD
+        self._batch_pop_script = None
+
+    def _get_batch_pop_script(self, client):
+        """배치 pop 스크립트 (EVALSHA로 실행되도록 한 번만 등록)"""
+        if self._batch_pop_script is None:
+            self._batch_pop_script = client.register_script(_BATCH_POP_SCRIPT)
+        return self._batch_pop_script
     
     def _get_queue_key(self, queue_name: str) -> str:
         """큐 키 생성"""
@@ -95,7 +131,7 @@ class RedisMessageQueue(IMessageQueue):
                     )
                     return False
                 
-                message = json.dumps(data, ensure_ascii=False)
+                message = orjson.dumps(data).decode("utf-8")
                 compressed_message = self._compress_message(message)
                 client.lpush(queue_key, compressed_message)
                 
@@ -142,16 +178,13 @@ class RedisMessageQueue(IMessageQueue):
                 messages = []
                 
                 for data in data_list[:batch_size]:
-                    message = json.dumps(data, ensure_ascii=False)
+                    message = orjson.dumps(data).decode("utf-8")
                     compressed_message = self._compress_message(message)
                     messages.append(compressed_message)
                 
                 if messages:
-                    # 파이프라인으로 배치 추가 (성능 최적화)
-                    pipe = client.pipeline()
-                    for msg in messages:
-                        pipe.lpush(queue_key, msg)
-                    pipe.execute()
+                    # 다중 값 LPUSH 한 번으로 배치 추가 (순서 유지, 단일 명령)
+                    client.lpush(queue_key, *messages)
                     
                     logger.info(
                         f"Batch enqueued: {queue_name} "
@@ -182,12 +215,13 @@ class RedisMessageQueue(IMessageQueue):
             client = self.redis_manager.get_client()
             if client:
                 queue_key = self._get_queue_key(queue_name)
-                result = client.brpop(queue_key, timeout=timeout)
+                # 블로킹 대기는 스레드에서 수행 (이벤트 루프를 막지 않도록)
+                result = await _blocking_brpop(client, queue_key, timeout)
                 if result:
                     _, message = result
                     # 압축 해제
                     decompressed = self._decompress_message(message)
-                    data = json.loads(decompressed)
+                    data = orjson.loads(decompressed)
                     logger.debug(f"Message dequeued: {queue_name}")
                     return data
         except Exception as e:
@@ -199,15 +233,17 @@ class RedisMessageQueue(IMessageQueue):
         """
         배치로 메시지 가져오기 (대규모 처리 최적화)
         
-        주의: FIFO 순서 보장을 위해 lrange + ltrim 사용 (원자성 보장)
+        쌓인 메시지는 Lua 스크립트로 한 번의 왕복에 최대 batch_size개를 가져오고,
+        큐가 비어 있으면 첫 메시지가 올 때까지 BRPOP으로 대기한 뒤 나머지를 함께 가져옴
+        (빈 큐에서 바쁜 루프 방지, 배치 크기는 큐 적재량에 맞춰 자연스럽게 조절)
         
         Args:
             queue_name: 큐 이름
             batch_size: 배치 크기
-            timeout: 대기 시간 (초, 현재는 사용하지 않음)
+            timeout: 큐가 비어 있을 때 대기 시간 (초)
             
         Returns:
-            메시지 데이터 리스트
+            메시지 데이터 리스트 (FIFO 순서)
         """
         if not self.redis_manager.is_available():
             return []
@@ -216,38 +252,34 @@ class RedisMessageQueue(IMessageQueue):
             client = self.redis_manager.get_client()
             if client:
                 queue_key = self._get_queue_key(queue_name)
+                script = self._get_batch_pop_script(client)
                 
-                # Lua 스크립트로 원자적으로 배치 가져오기 (FIFO 보장)
-                # 실무에서 많이 사용하는 패턴: 원자성 보장을 위한 Lua 스크립트
-                lua_script = """
-                local queue_key = KEYS[1]
-                local batch_size = tonumber(ARGV[1])
-                local queue_len = redis.call('llen', queue_key)
-                local actual_size = math.min(batch_size, queue_len)
-                if actual_size == 0 then
-                    return {}
-                end
-                local messages = redis.call('lrange', queue_key, -actual_size, -1)
-                redis.call('ltrim', queue_key, 0, -(actual_size + 1))
-                return messages
-                """
-                
-                # Lua 스크립트 실행 (원자성 보장)
                 try:
-                    messages_raw = client.eval(lua_script, 1, queue_key, batch_size)
+                    messages_raw = script(keys=[queue_key], args=[batch_size])
+                    if not messages_raw:
+                        # 빈 큐: 첫 메시지를 블로킹 대기 (스레드에서 수행)
+                        result = await _blocking_brpop(client, queue_key, timeout)
+                        if not result:
+                            return []
+                        _, first_message = result
+                        messages_raw = [first_message]
+                        if batch_size > 1:
+                            # 가장 오래된 메시지가 마지막에 오도록 이어 붙임 (뒤집으면 FIFO)
+                            try:
+                                messages_raw = script(keys=[queue_key], args=[batch_size - 1]) + messages_raw
+                            except Exception as lua_error:
+                                # 이미 꺼낸 첫 메시지는 유실되지 않도록 단독으로 반환
+                                logger.warning(f"Lua script failed after BRPOP: {lua_error}")
                 except Exception as lua_error:
                     logger.warning(f"Lua script failed, using fallback: {lua_error}")
                     return await self._fallback_dequeue_batch(queue_name, batch_size, timeout)
                 
-                if not messages_raw:
-                    return []
-                
                 # 메시지 파싱 및 압축 해제
                 messages = []
                 for message in messages_raw:
                     if message:
                         decompressed = self._decompress_message(message)
-                        data = json.loads(decompressed)
+                        data = orjson.loads(decompressed)
                         messages.append(data)
                 
                 # 역순으로 반환 (FIFO 순서 유지)
@@ -267,14 +299,24 @@ class RedisMessageQueue(IMessageQueue):
     async def _fallback_dequeue_batch(
         self, queue_name: str, batch_size: int, timeout: int
     ) -> List[Dict[str, Any]]:
-        """폴백: 단일 dequeue를 여러 번 호출"""
-        messages = []
-        for _ in range(batch_size):
-            message = await self.dequeue(queue_name, timeout=1)
-            if message:
-                messages.append(message)
-            else:
-                break
+        """폴백: 첫 메시지는 BRPOP으로 대기, 나머지는 파이프라인 RPOP으로 한 번에 가져옴"""
+        first = await self.dequeue(queue_name, timeout=timeout)
+        if not first:
+            return []
+        
+        messages = [first]
+        if batch_size > 1:
+            try:
+                client = self.redis_manager.get_client()
+                pipe = client.pipeline(transaction=False)
+                for _ in range(batch_size - 1):
+                    pipe.rpop(self._get_queue_key(queue_name))
+                for message in pipe.execute():
+                    if message is None:
+                        break
+                    messages.append(orjson.loads(self._decompress_message(message)))
+            except Exception as e:
+                logger.warning(f"Fallback batch pop failed after first message: {e}")
         return messages
     
     def get_queue_length(self, queue_name: str) -> int:
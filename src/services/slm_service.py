@@ -29,7 +29,7 @@ class SLMService:
             self.provider = provider or ProviderFactory.get_default_provider()
             logger.info(f"SLMService initialized with provider: {self.provider.name}")
     
-    async def stream_chat(
+    def stream_chat(
         self,
         model: str,
         messages: List[Dict[str, str]],
@@ -45,8 +45,8 @@ class SLMService:
             system: 시스템 메시지
             temperature: 온도
         
-        Yields:
-            응답 청크
+        Returns:
+            응답 청크 비동기 제너레이터 (provider 스트림을 감싸지 않고 그대로 반환)
         """
         # SLM 모델 기본값
         if not model:
@@ -64,14 +64,13 @@ class SLMService:
         provider = self._get_provider_for_model(config.provider)
         
         # Provider를 통한 스트리밍
-        async for chunk in provider.stream_chat(
+        return provider.stream_chat(
             messages=messages,
             model=model,
             system=system,
             temperature=temp,
             max_tokens=config.max_tokens,
-        ):
-            yield chunk
+        )
     
     async def chat(
         self,
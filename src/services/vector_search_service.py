@@ -4,19 +4,27 @@ Pinecone을 사용한 벡터 검색 및 인덱싱
 """
 
 from typing import List, Dict, Optional
+import numpy as np
 from pinecone import Pinecone, Index
 from loguru import logger
-import hashlib
 
 from src.config.env import EnvConfig
 from src.config.cost_optimization import CostOptimizationConfig  # 비용 최적화
 from src.services.embedding_service import EmbeddingService
 from src.exceptions import VectorSearchError
 from src.utils.retry import retry
-from src.utils.cache import cache  # Redis 캐시 (폴백: 인메모리)
+from src.utils.cache import cache, hash_key  # Redis 캐시 (폴백: 인메모리)
 from src.utils.concurrency import distributed_lock, redis_transaction, semaphore  # 동시성 제어
 
 
+def _with_list_values(vector: Dict) -> Dict:
+    """numpy 임베딩을 Pinecone이 받는 float 리스트로 변환 (업로드 직전 배치 단위)"""
+    values = vector["values"]
+    if isinstance(values, np.ndarray):
+        return {**vector, "values": values.tolist()}
+    return vector
+
+
 class VectorSearchService:
     """벡터 검색 서비스"""
 
@@ -51,7 +59,7 @@ class VectorSearchService:
         """검색 결과 캐시 키 생성"""
         filter_str = str(sorted(filter.items())) if filter else "no_filter"
         content = f"{query}:{top_k}:{filter_str}"
-        return f"vector_search:{hashlib.md5(content.encode()).hexdigest()}"
+        return f"vector_search:{hash_key(content)}"
 
     @retry(max_attempts=3, exceptions=(Exception,))
     def search(
@@ -87,7 +95,7 @@ class VectorSearchService:
                 return cached
 
         # 동일 검색 동시 실행 방지 (분산 락)
-        lock_key = f"search_lock:{hashlib.md5((query + str(top_k) + str(filter)).encode()).hexdigest()}"
+        lock_key = f"search_lock:{hash_key(query + str(top_k) + str(filter))}"
         
         with distributed_lock(lock_key, timeout=30, blocking=True):
             # 락 획득 후 다시 캐시 확인
@@ -143,17 +151,17 @@ class VectorSearchService:
 
         Args:
             vectors: 업로드할 벡터 리스트
-                각 벡터는 {"id": str, "values": List[float], "metadata": Dict} 형식
+                각 벡터는 {"id": str, "values": List[float] | np.ndarray, "metadata": Dict} 형식
             batch_size: 배치 크기
         """
         # 동시 업로드 수 제한 (세마포어)
         with semaphore("vector_upsert", limit=2, timeout=600):
             try:
                 for i in range(0, len(vectors), batch_size):
-                    batch = vectors[i : i + batch_size]
+                    batch = [_with_list_values(v) for v in vectors[i : i + batch_size]]
                     
                     # 배치 업로드 락 (동일 배치 중복 업로드 방지)
-                    batch_key = f"upsert_batch:{hashlib.md5(str(batch[0]['id']).encode()).hexdigest()}"
+                    batch_key = f"upsert_batch:{hash_key(str(batch[0]['id']))}"
                     with distributed_lock(batch_key, timeout=300, blocking=True):
                         self.index.upsert(vectors=batch)
                         logger.info(
@@ -4,21 +4,49 @@ Redis 기반 캐싱 (프로덕션 권장)
 Redis 연결 실패 시 인메모리 캐시로 폴백
 """
 
+import hashlib
 import json
 import pickle
-from typing import Dict, Any, Optional, Callable
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from functools import wraps
 from loguru import logger
 
+from src.config.env import EnvConfig
+
+try:
+    import xxhash  # 캐시 키 해싱 (비보안 용도, md5 대비 수 배 빠름)
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 try:
-    from src.config.redis import get_redis_client
+    from src.config.redis import get_async_redis_client, get_redis_client
     REDIS_AVAILABLE = True
 except Exception as e:
     logger.warning(f"Redis not available, using in-memory cache: {e}")
     REDIS_AVAILABLE = False
 
 
+def hash_key(content: str) -> str:
+    """
+    캐시/락 키용 콘텐츠 해시 (xxh3 64bit, 미설치 시 md5)
+
+    Args:
+        content: 해싱할 문자열
+
+    Returns:
+        16진수 해시 문자열
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(content.encode("utf-8"))
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
 class SimpleCache:
     """간단한 인메모리 캐시 (Redis 폴백용)"""
 
@@ -54,6 +82,22 @@ class SimpleCache:
             "expires_at": expires_at,
         }
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키를 한 번에 조회 (키 순서대로, 없으면 None)"""
+        return [self.get(key) for key in keys]
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회 (RedisCache와 같은 비동기 인터페이스)"""
+        return self.get(key)
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키를 한 번에 조회 (RedisCache와 같은 비동기 인터페이스)"""
+        return self.get_many(keys)
+
+    async def aset(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """캐시에 값 저장 (RedisCache와 같은 비동기 인터페이스)"""
+        self.set(key, value, ttl)
+
     def delete(self, key: str) -> None:
         """캐시에서 값 삭제"""
         if key in self._cache:
@@ -68,12 +112,183 @@ class SimpleCache:
         return len(self._cache)
 
 
+class LocalLRUCache:
+    """
+    프로세스 내 TTL + LRU 캐시 (Redis 앞단 L1)
+
+    자주 조회되는 키는 Redis 왕복 없이 dict 조회로 응답
+    (to_thread/executor 워커에서도 호출되므로 락으로 보호)
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: int = 300):
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회 (만료 시 제거)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        캐시에 값 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: Time to Live (초, 로컬 TTL보다 길면 로컬 TTL 적용)
+        """
+        local_ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        with self._lock:
+            self._data[key] = (time.time() + local_ttl, value)
+            self._data.move_to_end(key)
+
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """캐시에서 값 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 캐시 초기화"""
+        with self._lock:
+            self._data.clear()
+
+    def size(self) -> int:
+        """캐시 크기 반환"""
+        return len(self._data)
+
+
+def _pack_local(value: Any) -> Any:
+    """
+    L1 저장 형식으로 변환
+
+    float 리스트(임베딩)는 double array로 손실 없이 압축 (1536차원 약 12KB, float 객체 리스트는 약 50KB),
+    그 외 값은 pickle 바이트로 저장해 호출자 간 가변 객체를 공유하지 않음
+    """
+    if isinstance(value, list) and value and type(value[0]) is float:
+        try:
+            return array("d", value)
+        except TypeError:
+            pass
+    return pickle.dumps(value)
+
+
+def _unpack_local(packed: Any) -> Optional[Any]:
+    """L1 저장 형식에서 복원 (조회마다 새 객체 반환)"""
+    if packed is None:
+        return None
+    if isinstance(packed, array):
+        return packed.tolist()
+    return pickle.loads(packed)
+
+
 class RedisCache:
-    """Redis 기반 캐시"""
+    """Redis 기반 캐시 (local=True면 프로세스 내 LRU를 L1으로 사용)"""
 
-    def __init__(self):
+    def __init__(self, local: bool = False):
+        """
+        Args:
+            local: 프로세스 내 L1 사용 여부. 프로세스 간 무효화가 없으므로
+                임베딩처럼 키(내용 해시)가 같으면 값이 바뀌지 않는 항목에만 사용
+        """
         self._client = None
+        self._async_client = None
         self._fallback = SimpleCache()
+        self._local = (
+            LocalLRUCache(
+                maxsize=EnvConfig.LOCAL_CACHE_MAX_SIZE,
+                ttl=EnvConfig.LOCAL_CACHE_TTL,
+            )
+            if local
+            else None
+        )
+
+    def _local_get(self, key: str) -> Optional[Any]:
+        """L1 조회 (L1 미사용 또는 오류 시 None → Redis 조회로 진행)"""
+        if self._local is None:
+            return None
+        try:
+            return _unpack_local(self._local.get(key))
+        except Exception as e:
+            logger.warning(f"Local cache get error, using Redis: {e}")
+            return None
+
+    def _local_set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """L1 저장 (Redis 키의 남은 TTL을 넘지 않도록 ttl 전달, 오류는 무시하고 Redis만 사용)"""
+        if self._local is None:
+            return
+        try:
+            self._local.set(key, _pack_local(value), ttl)
+        except Exception as e:
+            logger.warning(f"Local cache set error, using Redis: {e}")
+
+    @staticmethod
+    def _remaining_ttl(ttl: Optional[int]) -> Optional[int]:
+        """Redis TTL 응답 → L1 TTL (-1: 만료 없음이면 L1 기본 TTL)"""
+        return ttl if ttl is not None and ttl > 0 else None
+
+    def _local_get_many(self, keys: List[str]) -> Tuple[List[Optional[Any]], List[int]]:
+        """L1 일괄 조회 → (키 순서의 값, L1 미스 위치)"""
+        values = [self._local_get(key) for key in keys]
+        return values, [i for i, value in enumerate(values) if value is None]
+
+    def _queue_many(self, client, keys: List[str]):
+        """
+        L1 미스 키 일괄 조회 (한 번의 왕복, 비동기 클라이언트면 awaitable 반환)
+
+        L1 미사용이면 MGET, 사용 시 남은 TTL도 필요하므로 GET+TTL 파이프라인
+        """
+        if self._local is None:
+            return client.mget(keys)
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+            pipe.ttl(key)
+        return pipe.execute()
+
+    def _fill_many(
+        self,
+        values: List[Optional[Any]],
+        keys: List[str],
+        missing: List[int],
+        replies: List[Any],
+    ) -> List[Optional[Any]]:
+        """Redis 응답을 역직렬화해 결과 슬롯과 L1에 채움"""
+        if self._local is None:
+            pairs = zip(replies, [None] * len(replies))
+        else:
+            pairs = zip(replies[::2], replies[1::2])
+        for i, (data, ttl) in zip(missing, pairs):
+            if data is None:
+                continue
+            values[i] = pickle.loads(data)
+            if self._local is not None:
+                self._local_set(keys[i], values[i], self._remaining_ttl(ttl))
+        return values
+
+    def _fallback_many(
+        self, values: List[Optional[Any]], missing: List[int], missing_keys: List[str]
+    ) -> List[Optional[Any]]:
+        """L1 미스 위치를 인메모리 폴백 캐시로 채움"""
+        for i, value in zip(missing, self._fallback.get_many(missing_keys)):
+            values[i] = value
+        return values
 
     @property
     def client(self):
@@ -86,6 +301,15 @@ class RedisCache:
                 return None
         return self._client
 
+    @property
+    def async_client(self):
+        """비동기 Redis 클라이언트 (동기 클라이언트 연결에 성공한 경우에만 사용)"""
+        if self._async_client is None:
+            if not self.client:
+                return None
+            self._async_client = get_async_redis_client()
+        return self._async_client
+
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값 조회
@@ -96,20 +320,60 @@ class RedisCache:
         Returns:
             캐시된 값 또는 None
         """
+        # L1: 프로세스 내 캐시 (네트워크 왕복 없음)
+        value = self._local_get(key)
+        if value is not None:
+            return value
+
         if not self.client:
             return self._fallback.get(key)
 
         try:
-            data = self.client.get(key)
+            if self._local is None:
+                data = self.client.get(key)
+            else:
+                # L1에 채울 때 Redis 키의 남은 TTL을 함께 조회 (한 번의 왕복)
+                pipe = self.client.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.ttl(key)
+                data, ttl = pipe.execute()
             if data is None:
                 return None
 
-            # Pickle로 역직렬화
-            return pickle.loads(data)
+            # Pickle로 역직렬화 후 L1에 채움
+            value = pickle.loads(data)
+            if self._local is not None:
+                self._local_set(key, value, self._remaining_ttl(ttl))
+            return value
         except Exception as e:
             logger.warning(f"Redis get error, using fallback: {e}")
             return self._fallback.get(key)
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키를 한 번에 조회 (L1 확인 후 미스만 한 번의 Redis 왕복으로 조회)
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            키 순서의 캐시된 값 (없으면 None)
+        """
+        values, missing = self._local_get_many(keys)
+        if not missing:
+            return values
+
+        missing_keys = [keys[i] for i in missing]
+        if not self.client:
+            return self._fallback_many(values, missing, missing_keys)
+
+        try:
+            replies = self._queue_many(self.client, missing_keys)
+            return self._fill_many(values, keys, missing, replies)
+        except Exception as e:
+            logger.warning(f"Redis get error, using fallback: {e}")
+            return self._fallback_many(values, missing, missing_keys)
+
     def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         """
         캐시에 값 저장
@@ -119,6 +383,8 @@ class RedisCache:
             value: 저장할 값
             ttl: Time to Live (초)
         """
+        self._local_set(key, value, ttl)
+
         if not self.client:
             self._fallback.set(key, value, ttl)
             return
@@ -131,8 +397,96 @@ class RedisCache:
             logger.warning(f"Redis set error, using fallback: {e}")
             self._fallback.set(key, value, ttl)
 
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        캐시에서 값 조회 (비동기, Redis 왕복 동안 이벤트 루프를 막지 않음)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 None
+        """
+        value = self._local_get(key)
+        if value is not None:
+            return value
+
+        client = self.async_client
+        if client is None:
+            return self._fallback.get(key)
+
+        try:
+            if self._local is None:
+                data = await client.get(key)
+            else:
+                pipe = client.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.ttl(key)
+                data, ttl = await pipe.execute()
+            if data is None:
+                return None
+
+            value = pickle.loads(data)
+            if self._local is not None:
+                self._local_set(key, value, self._remaining_ttl(ttl))
+            return value
+        except Exception as e:
+            logger.warning(f"Redis get error, using fallback: {e}")
+            return self._fallback.get(key)
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키를 한 번에 조회 (비동기, get_many와 동일하게 한 번의 Redis 왕복)
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            키 순서의 캐시된 값 (없으면 None)
+        """
+        values, missing = self._local_get_many(keys)
+        if not missing:
+            return values
+
+        missing_keys = [keys[i] for i in missing]
+        client = self.async_client
+        if client is None:
+            return self._fallback_many(values, missing, missing_keys)
+
+        try:
+            replies = await self._queue_many(client, missing_keys)
+            return self._fill_many(values, keys, missing, replies)
+        except Exception as e:
+            logger.warning(f"Redis get error, using fallback: {e}")
+            return self._fallback_many(values, missing, missing_keys)
+
+    async def aset(self, key: str, value: Any, ttl: int = 3600) -> None:
+        """
+        캐시에 값 저장 (비동기)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: Time to Live (초)
+        """
+        self._local_set(key, value, ttl)
+
+        client = self.async_client
+        if client is None:
+            self._fallback.set(key, value, ttl)
+            return
+
+        try:
+            await client.setex(key, ttl, pickle.dumps(value))
+        except Exception as e:
+            logger.warning(f"Redis set error, using fallback: {e}")
+            self._fallback.set(key, value, ttl)
+
     def delete(self, key: str) -> None:
         """캐시에서 값 삭제"""
+        if self._local is not None:
+            self._local.delete(key)
+
         if not self.client:
             self._fallback.delete(key)
             return
@@ -145,6 +499,9 @@ class RedisCache:
 
     def clear(self) -> None:
         """전체 캐시 초기화 (현재 DB만)"""
+        if self._local is not None:
+            self._local.clear()
+
         if not self.client:
             self._fallback.clear()
             return
@@ -168,15 +525,19 @@ class RedisCache:
 
 
 # 전역 캐시 인스턴스 (Redis 우선, 실패 시 인메모리)
+# embedding_cache: 내용 해시 키라 값이 바뀌지 않는 임베딩 전용 (프로세스 내 L1 사용)
 if REDIS_AVAILABLE:
     try:
         cache = RedisCache()
+        embedding_cache = RedisCache(local=True)
         logger.info("Using Redis cache")
     except Exception as e:
         logger.warning(f"Redis initialization failed, using in-memory cache: {e}")
         cache = SimpleCache()
+        embedding_cache = cache
 else:
     cache = SimpleCache()
+    embedding_cache = cache
     logger.info("Using in-memory cache (Redis not available)")
 
 
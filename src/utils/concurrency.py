@@ -4,6 +4,7 @@ Redis 기반 동시성 제어 (분산 락, Rate Limiting, 트랜잭션)
 AI 서비스 특성에 맞게 최적화
 """
 
+import asyncio
 import time
 import uuid
 from typing import Optional, Callable, Any, List, Dict
@@ -11,7 +12,7 @@ from contextlib import contextmanager
 from loguru import logger
 
 try:
-    from src.config.redis import get_redis_client
+    from src.config.redis import get_async_redis_client, get_redis_client
 
     REDIS_AVAILABLE = True
 except Exception as e:
@@ -146,6 +147,38 @@ def distributed_lock(key: str, timeout: int = 30, blocking: bool = True):
         lock.release()
 
 
+# 토큰 버킷 Lua 스크립트 (조회 → 보충 → 차감 → 저장을 한 번의 왕복으로 원자적 처리)
+_TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+
+local bucket = redis.call("HMGET", key, "tokens", "ts")
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+-- 경과 시간만큼 토큰 보충 (최대 capacity)
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call("HSET", key, "tokens", tokens, "ts", now)
+redis.call("EXPIRE", key, ttl)
+
+return {allowed, math.floor(tokens)}
+"""
+
+
 class RateLimiter:
     """Redis 기반 Rate Limiter (토큰 버킷 알고리즘)"""
 
@@ -155,13 +188,17 @@ class RateLimiter:
 
         Args:
             key: Rate limit 키
-            max_requests: 최대 요청 수
-            window: 시간 윈도우 (초)
+            max_requests: 최대 요청 수 (버킷 용량)
+            window: 시간 윈도우 (초, 이 시간 동안 max_requests개 토큰 보충)
         """
         self.key = f"ratelimit:{key}"
         self.max_requests = max_requests
         self.window = window
+        self.refill_rate = max_requests / window  # 초당 보충 토큰 수
         self._client = None
+        self._script = None
+        self._async_client = None
+        self._async_script = None
 
     @property
     def client(self):
@@ -173,10 +210,40 @@ class RateLimiter:
                 logger.warning(f"Redis unavailable for rate limiting: {e}")
         return self._client
 
-    def is_allowed(self) -> tuple[bool, Optional[int]]:
+    @property
+    def script(self):
+        """토큰 버킷 스크립트 (한 번 등록 후 EVALSHA로 호출)"""
+        if self._script is None and self.client:
+            self._script = self.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def _aget_script(self):
+        """
+        비동기 클라이언트용 토큰 버킷 스크립트 (동기 클라이언트 연결에 성공한 경우에만 사용)
+
+        동기 클라이언트 확인(연결 + PING)은 스레드에서 수행해 이벤트 루프를 막지 않음
+        """
+        if self._async_script is None and await asyncio.to_thread(lambda: self.client):
+            if self._async_client is None:
+                self._async_client = get_async_redis_client()
+            self._async_script = self._async_client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._async_script
+
+    def _bucket_call(self, identifier: Optional[str]) -> dict:
+        """토큰 버킷 스크립트 호출 인자 (keys/args)"""
+        key = f"{self.key}:{identifier}" if identifier else self.key
+        return {
+            "keys": [key],
+            "args": [self.max_requests, self.refill_rate, time.time(), self.window],
+        }
+
+    def is_allowed(self, identifier: Optional[str] = None) -> tuple[bool, Optional[int]]:
         """
         요청 허용 여부 확인
 
+        Args:
+            identifier: 제한 대상 식별자 (예: 사용자 ID, None이면 전역 버킷)
+
         Returns:
             (허용 여부, 남은 요청 수)
         """
@@ -185,37 +252,7 @@ class RateLimiter:
             return True, None
 
         try:
-            # Lua 스크립트로 원자적 연산
-            lua_script = """
-            local key = KEYS[1]
-            local window = tonumber(ARGV[1])
-            local max_requests = tonumber(ARGV[2])
-            local current_time = tonumber(ARGV[3])
-            
-            -- 현재 윈도우의 시작 시간
-            local window_start = current_time - (current_time % window)
-            local window_key = key .. ":" .. window_start
-            
-            -- 현재 요청 수 확인
-            local count = redis.call("INCR", window_key)
-            redis.call("EXPIRE", window_key, window)
-            
-            if count <= max_requests then
-                return {1, max_requests - count}
-            else
-                return {0, 0}
-            end
-            """
-
-            current_time = int(time.time())
-            result = self.client.eval(
-                lua_script,
-                1,
-                self.key,
-                str(self.window),
-                str(self.max_requests),
-                str(current_time),
-            )
+            result = self.script(**self._bucket_call(identifier))
 
             is_allowed = bool(result[0])
             remaining = result[1] if len(result) > 1 else None
@@ -226,14 +263,59 @@ class RateLimiter:
             # 에러 시 허용 (fail-open)
             return True, None
 
-    def check(self) -> bool:
+    def check(self, identifier: Optional[str] = None) -> bool:
         """
         요청 허용 여부만 확인 (간단 버전)
 
+        Args:
+            identifier: 제한 대상 식별자 (None이면 전역 버킷)
+
+        Returns:
+            허용 여부
+        """
+        allowed, _ = self.is_allowed(identifier)
+        return allowed
+
+    async def ais_allowed(
+        self, identifier: Optional[str] = None
+    ) -> tuple[bool, Optional[int]]:
+        """
+        요청 허용 여부 확인 (비동기, Redis 왕복 동안 이벤트 루프를 막지 않음)
+
+        Args:
+            identifier: 제한 대상 식별자 (예: 사용자 ID, None이면 전역 버킷)
+
+        Returns:
+            (허용 여부, 남은 요청 수)
+        """
+        script = await self._aget_script()
+        if not script:
+            # Redis 없으면 항상 허용
+            return True, None
+
+        try:
+            result = await script(**self._bucket_call(identifier))
+
+            is_allowed = bool(result[0])
+            remaining = result[1] if len(result) > 1 else None
+
+            return is_allowed, remaining
+        except Exception as e:
+            logger.error(f"Rate limit check error: {e}")
+            # 에러 시 허용 (fail-open)
+            return True, None
+
+    async def acheck(self, identifier: Optional[str] = None) -> bool:
+        """
+        요청 허용 여부만 확인 (비동기 간단 버전)
+
+        Args:
+            identifier: 제한 대상 식별자 (None이면 전역 버킷)
+
         Returns:
             허용 여부
         """
-        allowed, _ = self.is_allowed()
+        allowed, _ = await self.ais_allowed(identifier)
         return allowed
 
 
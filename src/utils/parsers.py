@@ -3,7 +3,25 @@ Data Parsers
 뉴스, 주식, 학습 콘텐츠를 벡터 DB 인덱싱용으로 파싱
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+try:
+    from rs_bpe.bpe import openai as rs_bpe_openai  # 정확한 토큰 경계 (cl100k_base)
+    _TOKENIZER = rs_bpe_openai.cl100k_base()
+except ImportError:
+    _TOKENIZER = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 (cl100k_base, 최소 1)
+
+    토크나이저 미설치 시 1문자 = 1토큰으로 보수적으로 계산
+    (한글은 cl100k에서 1~1.5문자당 1토큰이라 4문자 근사는 과소 추정)
+    """
+    if _TOKENIZER is None:
+        return max(1, len(text))
+    return max(1, _TOKENIZER.count(text))
 
 
 def parse_news_for_indexing(news_data: Dict) -> Dict:
@@ -188,3 +206,69 @@ def chunk_text(
         start = end - overlap_chars
 
     return chunks
+
+
+def _decode_tokens(tokens: List[int], start: int, end: int) -> Optional[Tuple[str, int]]:
+    """
+    토큰 구간 디코딩 (멀티바이트 문자가 잘린 경우 경계를 최대 3토큰까지 조정)
+
+    Returns:
+        (디코딩된 텍스트, 실제로 디코딩한 구간의 끝 위치) 또는 None
+    """
+    for trim_end in range(4):
+        for trim_start in range(4):
+            if start + trim_start >= end - trim_end:
+                break
+            decoded = _TOKENIZER.decode(tokens[start + trim_start : end - trim_end])
+            if decoded is not None:
+                return decoded, end - trim_end
+    return None
+
+
+def chunk_text_by_tokens(
+    text: str,
+    max_tokens: int = 512,
+    overlap: float = 0.15,
+) -> List[str]:
+    """
+    텍스트를 토큰 경계 기준 청크로 분할
+
+    한 번만 인코딩한 토큰 배열 위에서 윈도우를 이동하므로
+    청크를 늘려가며 다시 인코딩하는 비용이 없음
+    (rs-bpe 미설치 시 count_tokens와 같이 1문자 = 1토큰으로 보고 chunk_text 사용)
+
+    Args:
+        text: 원본 텍스트
+        max_tokens: 청크당 최대 토큰 수 (기본값: 512)
+        overlap: 겹치는 비율 (0.0-1.0, 기본값: 0.15)
+
+    Returns:
+        청크 리스트
+    """
+    if not text:
+        return []
+
+    if _TOKENIZER is None:
+        return chunk_text(text, chunk_size=max_tokens, overlap=overlap)
+
+    tokens = _TOKENIZER.encode(text)
+    step = max(1, max_tokens - int(max_tokens * overlap))
+
+    chunks = []
+    start = 0
+    while start < len(tokens):
+        end = min(start + max_tokens, len(tokens))
+        decoded = _decode_tokens(tokens, start, end)
+        if decoded is None:
+            start += step
+            continue
+
+        chunk, decoded_end = decoded
+        if chunk.strip():
+            chunks.append(chunk.strip())
+        if decoded_end == len(tokens):
+            break
+        # 끝에서 잘라낸 토큰은 다음 윈도우에 포함 (오버랩이 없어도 경계 문자가 빠지지 않음)
+        start = min(start + step, decoded_end)
+
+    return chunks
@@ -14,6 +14,9 @@ class ChatStorageWorker:
     """챗 저장 워커"""
     
     QUEUE_NAME = "chat:storage"
+    DEQUEUE_TIMEOUT = 5
+    # 종료 시 마지막 BRPOP과 저장이 끝나기를 기다리는 최대 시간(초)
+    SHUTDOWN_TIMEOUT = DEQUEUE_TIMEOUT + 10
     
     def __init__(self):
         self.queue = RedisMessageQueue()
@@ -31,21 +34,27 @@ class ChatStorageWorker:
             max_retries: 최대 재시도 횟수
             batch_size: 배치 크기 (1이면 단일 처리)
         """
+        chat_data_list = await self._dequeue_chats(batch_size)
+        if not chat_data_list:
+            return False
+        
+        return await self._store_chats(chat_data_list, batch_size, max_retries)
+    
+    async def _dequeue_chats(self, batch_size: int) -> List[Dict]:
+        """큐에서 챗 저장 작업 가져오기 (batch_size가 1이면 단일 dequeue)"""
         # 배치 처리 (대규모 처리 최적화)
         if batch_size > 1:
-            chat_data_list = await self.queue.dequeue_batch(self.QUEUE_NAME, batch_size=batch_size, timeout=5)
-            if not chat_data_list:
-                return False
-            
-            # 배치 저장으로 최적화
-            return await self._process_batch_chat(chat_data_list, max_retries)
+            return await self.queue.dequeue_batch(self.QUEUE_NAME, batch_size=batch_size, timeout=self.DEQUEUE_TIMEOUT)
         
         # 단일 처리
-        chat_data = await self.queue.dequeue(self.QUEUE_NAME, timeout=5)
-        if not chat_data:
-            return False
-        
-        return await self._process_single_chat(chat_data, max_retries)
+        chat_data = await self.queue.dequeue(self.QUEUE_NAME, timeout=self.DEQUEUE_TIMEOUT)
+        return [chat_data] if chat_data else []
+    
+    async def _store_chats(self, chat_data_list: List[Dict], batch_size: int, max_retries: int = 3) -> bool:
+        """가져온 챗 저장 (배치 모드면 배치 저장으로 최적화)"""
+        if batch_size > 1:
+            return await self._process_batch_chat(chat_data_list, max_retries)
+        return await self._process_single_chat(chat_data_list[0], max_retries)
     
     async def _process_batch_chat(self, chat_data_list: List[Dict], max_retries: int) -> bool:
         """배치 챗 저장 처리 (성능 최적화)"""
@@ -175,6 +184,7 @@ class ChatStorageWorker:
         self,
         max_iterations: Optional[int] = None,
         batch_size: int = 1,
+        concurrency: int = 1,
     ):
         """
         워커 실행 (무한 루프 또는 최대 반복 횟수, 배치 처리 지원)
@@ -182,42 +192,75 @@ class ChatStorageWorker:
         Args:
             max_iterations: 최대 반복 횟수 (None이면 무한)
             batch_size: 배치 크기 (대규모 처리 최적화)
+            concurrency: 동시에 진행할 저장 작업 수 (dequeue는 순차, 저장 I/O만 겹침)
         """
         self.running = True
         iteration = 0
         consecutive_errors = 0
         max_errors = 10
         
-        logger.info(f"Chat storage worker started (batch_size={batch_size})")
+        # 저장 슬롯: 빈 슬롯이 있을 때만 다음 배치를 꺼내 백프레셔 유지
+        slots = asyncio.Semaphore(concurrency)
+        in_flight: set[asyncio.Task] = set()
         
-        while self.running:
-            try:
-                success = await self.process_chat_storage(batch_size=batch_size)
-                
-                if success:
-                    consecutive_errors = 0
-                else:
-                    # 타임아웃은 정상 (큐가 비어있음)
+        logger.info(f"Chat storage worker started (batch_size={batch_size}, concurrency={concurrency})")
+        
+        try:
+            while self.running:
+                try:
+                    if concurrency > 1:
+                        await slots.acquire()
+                        try:
+                            chat_data_list = await self._dequeue_chats(batch_size)
+                        except BaseException:
+                            slots.release()
+                            raise
+                        if chat_data_list:
+                            task = asyncio.create_task(
+                                self._store_in_slot(slots, chat_data_list, batch_size)
+                            )
+                            in_flight.add(task)
+                            task.add_done_callback(in_flight.discard)
+                        else:
+                            slots.release()
+                    else:
+                        await self.process_chat_storage(batch_size=batch_size)
+                    
+                    # 타임아웃(빈 큐)도 정상 처리로 간주
                     consecutive_errors = 0
-                
-                iteration += 1
-                if max_iterations and iteration >= max_iterations:
-                    logger.info(f"Worker reached max iterations: {max_iterations}")
-                    break
                     
-            except Exception as e:
-                consecutive_errors += 1
-                logger.error(f"Worker error (consecutive: {consecutive_errors}): {e}")
-                
-                if consecutive_errors >= max_errors:
-                    logger.error(f"Too many consecutive errors ({max_errors}), stopping worker")
-                    break
-                
-                # 에러 시 잠시 대기
-                await asyncio.sleep(1)
-        
-        self.running = False
-        logger.info("Chat storage worker stopped")
+                    iteration += 1
+                    if max_iterations and iteration >= max_iterations:
+                        logger.info(f"Worker reached max iterations: {max_iterations}")
+                        break
+                        
+                except Exception as e:
+                    consecutive_errors += 1
+                    logger.error(f"Worker error (consecutive: {consecutive_errors}): {e}")
+                    
+                    if consecutive_errors >= max_errors:
+                        logger.error(f"Too many consecutive errors ({max_errors}), stopping worker")
+                        break
+                    
+                    # 에러 시 잠시 대기
+                    await asyncio.sleep(1)
+        finally:
+            # 이미 꺼낸 챗이 유실되지 않도록 진행 중인 저장 완료 대기
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            self.running = False
+            logger.info("Chat storage worker stopped")
+    
+    async def _store_in_slot(
+        self, slots: asyncio.Semaphore, chat_data_list: List[Dict], batch_size: int
+    ) -> None:
+        """저장 슬롯을 점유한 채로 챗 저장 (완료 시 슬롯 반환)"""
+        try:
+            await self._store_chats(chat_data_list, batch_size)
+        except Exception as e:
+            logger.error(f"Chat storage task failed: {e}")
+        finally:
+            slots.release()
     
     def stop(self):
         """워커 중지"""
@@ -37,6 +37,7 @@ class TestChatStorage:
         # 챗 저장 기능이 구현되어 있는지 확인
         # ✅ ChatStorageService가 구현되어 있고 chat_controller에 통합됨
 
+    @patch("src.controllers.chat_controller._router", None)
     @patch("src.controllers.chat_controller.ModelRouterService")
     def test_chat_response_format(self, mock_router_class, client):
         """챗 응답 형식이 프론트엔드와 호환되는지 확인"""
@@ -64,6 +65,7 @@ class TestChatStorage:
         assert "content" in data
         assert isinstance(data["content"], str)
 
+    @patch("src.controllers.chat_controller._router", None)
     @patch("src.controllers.chat_controller.ModelRouterService")
     @pytest.mark.asyncio
     async def test_stream_chat_response_format(self, mock_router_class, client):
@@ -131,3 +133,146 @@ class TestBackendIntegration:
         finally:
             await backend_client.aclose()
 
+
+
+class TestChatStorageQueue:
+    """ChatStorageQueue 로컬 버퍼 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_buffered_chats_flush_in_one_batch(self):
+        """플러셔 실행 중에는 버퍼에 모았다가 한 번의 배치로 전송"""
+        from src.services.chat_storage_queue import ChatStorageQueue
+
+        with patch("src.services.chat_storage_queue.RedisMessageQueue") as mock_queue_cls:
+            mock_queue_cls.return_value.enqueue = AsyncMock(return_value=True)
+            mock_queue_cls.return_value.enqueue_batch = AsyncMock(return_value=2)
+            queue = ChatStorageQueue()
+
+        queue.start_flusher()
+        assert await queue.enqueue_chat(userId="user-1", question="q1", answer="a1")
+        assert await queue.enqueue_chat(userId="user-1", question="q2", answer="a2")
+        await queue.stop_flusher()
+
+        queue.queue.enqueue.assert_not_awaited()
+        queue.queue.enqueue_batch.assert_awaited_once()
+        _, batch = queue.queue.enqueue_batch.await_args.args
+        assert [chat["question"] for chat in batch] == ["q1", "q2"]
+
+
+class TestExtractStockCodes:
+    """종목 코드 추출 테스트"""
+
+    def test_extracts_delimited_codes_only(self):
+        """괄호/공백으로 구분된 6자리 코드만 추출하고 더 긴 숫자는 제외"""
+        from src.services.chat_storage_service import _STOCK_CODE_RE
+
+        text = "삼성전자(005930)와 SK하이닉스 000660 주가, 거래량 1234567"
+        assert sorted(set(_STOCK_CODE_RE.findall(text))) == ["000660", "005930"]
+
+    @pytest.mark.parametrize("text", ["SK하이닉스 종가 178000원", "거래량 250000주", "000660의 주가"])
+    def test_ignores_numbers_followed_by_korean(self, text):
+        """한글이 바로 붙은 6자리 숫자(가격/수량 등)는 종목 코드로 보지 않음"""
+        from src.services.chat_storage_service import _STOCK_CODE_RE
+
+        assert _STOCK_CODE_RE.findall(text) == []
+
+
+class TestExtractConcept:
+    """개념 추출 테스트"""
+
+    @pytest.mark.parametrize(
+        "question, expected",
+        [
+            ("삼성전자 뉴스와 주가 알려줘", "stock_price"),  # 먼저 정의된 개념 우선
+            ("반도체 업황 전망 기사", "analysis"),
+            ("오늘 공시 있어?", "news"),
+            ("안녕하세요", "chat"),
+        ],
+    )
+    def test_concept_priority(self, question, expected):
+        """여러 개념 키워드가 있으면 정의 순서가 앞선 개념 반환"""
+        from src.services.chat_storage_service import _question_codes_and_concept
+
+        assert _question_codes_and_concept(question)[1] == expected
+
+    def test_codes_from_both_concept_from_question_only(self):
+        """종목 코드는 질문/응답에서 모두 추출하고, 개념은 질문 구간의 키워드만 사용"""
+        from src.services.chat_storage_service import ChatStorageService
+
+        question = "005930 어때?"
+        answer = "삼성전자(005930) 주가는 000660 대비 강세입니다"
+        codes, concept = ChatStorageService._fill_metadata(None, question, answer, None, None)
+
+        assert codes == ["005930", "000660"]  # 등장 순서 유지
+        assert concept == "chat"
+
+    def test_only_question_scan_is_memoized(self):
+        """질문 스캔만 캐시하고 응답은 매번 스캔 (응답 문자열을 캐시에 보관하지 않음)"""
+        from src.services.chat_storage_service import (
+            ChatStorageService,
+            _question_codes_and_concept,
+        )
+
+        _question_codes_and_concept.cache_clear()
+        question = "005930 주가 알려줘"
+        first, _ = ChatStorageService._fill_metadata(None, question, "000660 참고", None, None)
+        second, _ = ChatStorageService._fill_metadata(None, question, "035420 참고", None, None)
+
+        assert first == ["005930", "000660"]
+        assert second == ["005930", "035420"]
+        info = _question_codes_and_concept.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
+
+    def test_fill_metadata_merges_question_and_answer_codes(self):
+        """개념만 주어지면 질문/응답 종목 코드를 등장 순서대로 병합"""
+        from src.services.chat_storage_service import ChatStorageService
+
+        codes, concept = ChatStorageService._fill_metadata(
+            None,
+            "005930 어때?",
+            "005930, 000660 비교",
+            None,
+            "analysis",
+        )
+
+        assert codes == ["005930", "000660"]
+        assert concept == "analysis"
+
+
+class TestChatStorageDedup:
+    """중복 챗 저장 생략 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_chat_posted_once(self):
+        """같은 사용자/질문/응답은 한 번만 백엔드에 전송"""
+        from src.services import chat_storage_service
+        from src.services.chat_storage_service import ChatStorageService
+
+        chat_storage_service._recent_saves.clear()
+        service = ChatStorageService()
+        service.client = Mock()
+        service.client.post = AsyncMock(return_value=Mock(status_code=202, json=Mock(return_value={})))
+
+        for _ in range(2):
+            assert await service.save_chat(userId="user-1", question="005930 주가", answer="상승")
+
+        service.client.post.assert_awaited_once()
+
+
+class TestChatStorageBatch:
+    """배치 챗 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_logged_and_skipped(self):
+        """나눠 보낸 청크 중 실패한 청크는 경고 로그를 남기고 나머지 저장 수만 합산"""
+        from src.services.chat_storage_service import ChatStorageService
+
+        service = ChatStorageService()
+        service._save_batch_chunk = AsyncMock(side_effect=[100, RuntimeError("backend down")])
+        chats = [{"userId": "user-1", "question": f"q{i}", "answer": "a"} for i in range(150)]
+
+        with patch("src.services.chat_storage_service.logger") as mock_logger:
+            saved = await service.save_chat_batch(chats)
+
+        assert saved == 100
+        assert any("RuntimeError" in call.args[0] for call in mock_logger.warning.call_args_list)
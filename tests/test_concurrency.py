@@ -92,31 +92,87 @@ class TestRateLimiter:
 
     @patch("src.utils.concurrency.get_redis_client")
     def test_rate_limiter_allow(self, mock_redis):
-        """레이트 리미터 허용 테스트"""
+        """레이트 리미터 허용 테스트 (토큰 남음)"""
         mock_client = Mock()
-        mock_client.zcard = Mock(return_value=5)  # 현재 요청 수
-        mock_client.zremrangebyscore = Mock(return_value=0)
-        mock_client.zadd = Mock(return_value=1)
+        mock_script = Mock(return_value=[1, 4])  # 허용, 남은 토큰 4
+        mock_client.register_script = Mock(return_value=mock_script)
         mock_redis.return_value = mock_client
 
         limiter = RateLimiter("test_limiter", max_requests=10, window=60)
-        result = limiter.is_allowed("user_1")
+        result = limiter.check("user_1")
 
         assert result is True
+        assert mock_script.call_args.kwargs["keys"] == ["ratelimit:test_limiter:user_1"]
 
     @patch("src.utils.concurrency.get_redis_client")
     def test_rate_limiter_block(self, mock_redis):
-        """레이트 리미터 차단 테스트"""
+        """레이트 리미터 차단 테스트 (토큰 소진)"""
         mock_client = Mock()
-        mock_client.zcard = Mock(return_value=10)  # 제한 초과
-        mock_client.zremrangebyscore = Mock(return_value=0)
+        mock_client.register_script = Mock(return_value=Mock(return_value=[0, 0]))
         mock_redis.return_value = mock_client
 
         limiter = RateLimiter("test_limiter", max_requests=10, window=60)
-        result = limiter.is_allowed("user_1")
+        allowed, remaining = limiter.is_allowed("user_1")
 
-        assert result is False
+        assert allowed is False
+        assert remaining == 0
+
+    @patch("src.utils.concurrency.get_redis_client")
+    def test_rate_limiter_registers_script_once(self, mock_redis):
+        """토큰 버킷 스크립트는 한 번만 등록"""
+        mock_client = Mock()
+        mock_client.register_script = Mock(return_value=Mock(return_value=[1, 9]))
+        mock_redis.return_value = mock_client
+
+        limiter = RateLimiter("test_limiter", max_requests=10, window=60)
+        limiter.check("user_1")
+        limiter.check("user_2")
+
+        assert mock_client.register_script.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("src.utils.concurrency.get_async_redis_client")
+    @patch("src.utils.concurrency.get_redis_client")
+    async def test_rate_limiter_async_check(self, mock_redis, mock_async_redis):
+        """비동기 확인은 비동기 클라이언트에 등록한 스크립트를 await"""
+        from unittest.mock import AsyncMock
+
+        mock_redis.return_value = Mock()
+        mock_script = AsyncMock(return_value=[0, 0])
+        mock_async_client = Mock()
+        mock_async_client.register_script = Mock(return_value=mock_script)
+        mock_async_redis.return_value = mock_async_client
+
+        limiter = RateLimiter("test_limiter", max_requests=10, window=60)
+
+        assert await limiter.acheck("user_1") is False
+        mock_script.assert_awaited_once()
+        assert mock_script.call_args.kwargs["keys"] == ["ratelimit:test_limiter:user_1"]
+        mock_redis.return_value.register_script.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    @patch("src.utils.concurrency.get_async_redis_client")
+    @patch("src.utils.concurrency.get_redis_client")
+    async def test_rate_limiter_async_resolves_client_off_loop(self, mock_redis, mock_async_redis):
+        """비동기 경로의 첫 호출은 동기 클라이언트 연결을 이벤트 루프 스레드 밖에서 수행"""
+        import threading
+        from unittest.mock import AsyncMock
+
+        loop_thread = threading.get_ident()
+        resolved_in = []
+        mock_redis.side_effect = lambda: resolved_in.append(threading.get_ident()) or Mock()
+        mock_async_client = Mock()
+        mock_async_client.register_script = Mock(return_value=AsyncMock(return_value=[1, 9]))
+        mock_async_redis.return_value = mock_async_client
+
+        limiter = RateLimiter("test_limiter", max_requests=10, window=60)
+        assert await limiter.acheck("user_1") is True
+        assert await limiter.acheck("user_2") is True
 
+        assert len(resolved_in) == 1
+        assert resolved_in[0] != loop_thread
+        mock_async_client.register_script.assert_called_once()
 
 class TestRedisTransaction:
     """RedisTransaction 테스트"""
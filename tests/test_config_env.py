@@ -33,3 +33,20 @@ class TestEnvConfig:
         missing = EnvConfig.validate()
         # 최소 하나의 Provider API 키가 없으면 missing 리스트에 포함
         assert isinstance(missing, list)
+
+    def test_chunk_size_env_falls_back_on_bad_value(self, monkeypatch):
+        """형식이 잘못된 청킹 구간 값은 import 실패 대신 기본값 사용"""
+        from src.config.env import _int_tuple_env
+
+        monkeypatch.setenv("CHUNK_SIZE_THRESHOLDS", "1000,abc")
+        assert _int_tuple_env("CHUNK_SIZE_THRESHOLDS", "1000,5000") == (1000, 5000)
+
+    def test_validate_config_reports_chunk_size_errors(self, monkeypatch):
+        """청킹 구간 개수/순서 오류는 누락 변수와 별도로 보고"""
+        monkeypatch.setattr(EnvConfig, "CHUNK_SIZE_THRESHOLDS", (5000, 1000))
+        monkeypatch.setattr(EnvConfig, "CHUNK_SIZE_TIERS", (500, 2000))
+
+        errors = EnvConfig.validate_config()
+
+        assert len(errors) == 2
+        assert not any("CHUNK_SIZE" in item for item in EnvConfig.validate())
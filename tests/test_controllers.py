@@ -2,6 +2,8 @@
 Controller 테스트
 """
 
+import asyncio
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, Mock
@@ -16,6 +18,7 @@ class TestChatController:
         """TestClient Fixture"""
         return TestClient(app)
 
+    @patch("src.controllers.chat_controller._router", None)
     @patch("src.controllers.chat_controller.ModelRouterService")
     def test_stream_chat_endpoint(self, mock_router_class, client):
         """스트리밍 채팅 엔드포인트 테스트"""
@@ -38,6 +41,7 @@ class TestChatController:
         assert response.status_code == 200
         assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
+    @patch("src.controllers.chat_controller._router", None)
     @patch("src.controllers.chat_controller.ModelRouterService")
     def test_chat_endpoint(self, mock_router_class, client):
         """일반 채팅 엔드포인트 테스트"""
@@ -70,6 +74,138 @@ class TestChatController:
         assert "models" in data
         assert "available_providers" in data
 
+    def test_unexpected_error_reports_type_only(self, client):
+        """예상치 못한 예외는 메시지 대신 예외 타입만 응답"""
+        with patch(
+            "src.controllers.chat_controller._get_models_body",
+            side_effect=ValueError("redis://secret@host"),
+        ):
+            response = client.get("/api/models")
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to get models: ValueError"
+
+    def test_sse_frame_keeps_utf8(self):
+        """SSE 프레임이 한글을 이스케이프 없이 UTF-8 바이트로 인코딩"""
+        from src.controllers.chat_controller import _sse_frame
+
+        frame = _sse_frame({"content": "삼성전자", "done": False})
+
+        assert frame == 'data: {"content":"삼성전자","done":false}\n\n'.encode("utf-8")
+
+    def test_done_frame_constant(self):
+        """미리 직렬화된 완료 프레임 형식"""
+        from src.controllers.chat_controller import _DONE_FRAME
+
+        assert _DONE_FRAME == b'data: {"content":"","done":true}\n\n'
+
+    def test_structured_frame_matches_sse_frame(self):
+        """미리 직렬화된 data로 만든 프레임이 _sse_frame 결과와 동일"""
+        from src.controllers.chat_controller import _sse_frame, _structured_frame
+
+        data = {"answer": "삼성전자", "confidence": 0.9}
+        frame = _structured_frame(orjson.dumps(data))
+
+        assert frame == _sse_frame({"content": "", "done": False, "structured": True, "data": data})
+
+    def test_error_frame_truncates_message(self):
+        """에러 프레임에 예외 타입과 잘라낸 메시지를 별도 필드로 포함"""
+        from src.controllers.chat_controller import _ERROR_MESSAGE_MAX_LEN, _error_frame
+        from src.exceptions import ProviderError
+
+        frame = _error_frame(ProviderError("x" * 1000), "x" * 1000)
+        payload = orjson.loads(frame[len(b"data: "):])
+
+        assert payload["done"] is True
+        assert payload["error"] is True
+        assert payload["error_type"] == "ProviderError"
+        assert len(payload["message"]) == _ERROR_MESSAGE_MAX_LEN
+
+    @pytest.mark.asyncio
+    async def test_buffered_chunks_flushes_on_timeout(self):
+        """업스트림이 멈춰도 타임아웃이 지나면 버퍼 전송"""
+        from src.controllers.chat_controller import _buffered_chunks
+
+        async def source():
+            yield "a"
+            await asyncio.sleep(0.2)
+            yield "b"
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        received = []
+        async for content in _buffered_chunks(source(), buffer_size=10, buffer_timeout=0.05):
+            received.append((content, loop.time() - start))
+
+        assert [c for c, _ in received] == ["a", "b"]
+        assert received[0][1] < 0.15  # "b"를 기다리지 않고 먼저 전송
+
+    @pytest.mark.asyncio
+    async def test_buffered_chunks_applies_backpressure(self):
+        """소비 측이 느리면 생산자는 큐 상한만큼만 앞서 읽음"""
+        from src.controllers.chat_controller import _STREAM_QUEUE_MAXSIZE, _buffered_chunks
+
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for _ in range(_STREAM_QUEUE_MAXSIZE * 4):
+                produced += 1
+                yield "x" * 10
+
+        stream = _buffered_chunks(source(), buffer_size=10)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)  # 생산자가 진행할 시간
+
+        assert produced <= _STREAM_QUEUE_MAXSIZE + 2
+        await stream.aclose()
+
+    def test_chat_history_cache_key_is_unambiguous(self, client):
+        """':'가 들어간 파라미터가 다른 요청의 히스토리 캐시 키를 만들지 않음"""
+        with patch("src.utils.cache.cache") as mock_cache:
+            mock_cache.get = Mock(return_value=[{"id": "chat_1"}])
+            client.get("/api/chat/history", params={"userId": "u", "concept": "3:4", "stockCode": "5"})
+            client.get("/api/chat/history", params={"userId": "u", "concept": "3", "stockCode": "4:5"})
+
+        first_key, second_key = (c.args[0] for c in mock_cache.get.call_args_list)
+        assert first_key != second_key
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_falls_back_to_client_ip(self):
+        """userId가 없으면 클라이언트 IP 버킷으로 Rate limit 적용"""
+        from fastapi import HTTPException
+        from src.controllers.chat_controller import _enforce_rate_limit
+
+        limiter = Mock()
+        limiter.acheck = AsyncMock(return_value=False)
+        http_request = Mock()
+        http_request.client.host = "10.0.0.1"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _enforce_rate_limit(limiter, None, http_request)
+
+        assert exc_info.value.status_code == 429
+        limiter.acheck.assert_awaited_once_with("ip:10.0.0.1")
+
+    @pytest.mark.asyncio
+    async def test_schedule_chat_storage_runs_in_background(self):
+        """챗 저장이 백그라운드 작업으로 실행되고 종료 시 대기됨"""
+        from src.controllers import chat_controller
+
+        mock_queue = Mock()
+        mock_queue.enqueue_chat = AsyncMock(return_value=True)
+
+        with patch.object(chat_controller, "get_chat_storage_queue", return_value=mock_queue):
+            chat_controller._schedule_chat_storage("user-1", "질문", "응답", None)
+            assert len(chat_controller._background_tasks) == 1
+
+            await chat_controller.drain_background_tasks()
+
+        mock_queue.enqueue_chat.assert_awaited_once_with(
+            userId="user-1", question="질문", answer="응답", messages=None
+        )
+        assert not chat_controller._background_tasks
+
 
 class TestSearchController:
     """SearchController 테스트"""
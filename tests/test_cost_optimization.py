@@ -3,7 +3,9 @@ Cost Optimization 테스트
 비용 최적화 설정 및 로직 테스트
 """
 
+import numpy as np
 import pytest
+from unittest.mock import patch
 from src.config.cost_optimization import CostOptimizationConfig
 
 
@@ -56,3 +58,31 @@ class TestCostOptimizationConfig:
 
         # 배치 처리 시 50% 절감
         assert batch_cost == non_batch_cost / 2
+
+    def test_estimate_cost_unknown_model(self):
+        """가격표에 없는 모델은 기본 가격 적용 테스트"""
+        with patch.object(
+            CostOptimizationConfig, "get_embedding_model", return_value="unknown-model"
+        ):
+            assert CostOptimizationConfig.estimate_cost(1_000_000, use_batch=True) == 0.02
+            assert CostOptimizationConfig.estimate_cost(1_000_000, use_batch=False) == 0.02
+
+    def test_get_optimal_chunk_size_boundaries(self):
+        """구간 경계값 청크 크기 테스트"""
+        assert CostOptimizationConfig.get_optimal_chunk_size(999) == 500
+        assert CostOptimizationConfig.get_optimal_chunk_size(1000) == 2000
+        assert CostOptimizationConfig.get_optimal_chunk_size(4999) == 2000
+        assert CostOptimizationConfig.get_optimal_chunk_size(5000) == 4000
+
+    def test_batch_versions_match_scalar(self):
+        """배치(벡터) 버전이 스칼라 버전과 동일한 결과 반환"""
+        lengths = np.array([0, 999, 1000, 4999, 5000, 10000])
+        sizes = CostOptimizationConfig.get_optimal_chunk_size_batch(lengths)
+        assert sizes.tolist() == [
+            CostOptimizationConfig.get_optimal_chunk_size(int(n)) for n in lengths
+        ]
+
+        tokens = np.array([0, 1_000, 1_000_000])
+        costs = CostOptimizationConfig.estimate_cost_batch(tokens, use_batch=True)
+        expected = [CostOptimizationConfig.estimate_cost(int(t)) for t in tokens]
+        assert np.allclose(costs, expected)
@@ -0,0 +1,21 @@
+"""
+DTO 테스트
+"""
+
+import pytest
+from pydantic import ValidationError
+from src.dto import ChatRequest
+
+
+class TestChatRequest:
+    """ChatRequest 스키마 테스트"""
+
+    def test_exports_structured_fields(self):
+        """패키지에서 노출되는 ChatRequest가 구조화 응답 필드를 포함"""
+        fields = ChatRequest.model_fields
+        assert {"response_type", "stock_code", "news_text"} <= set(fields)
+
+    def test_rejects_unknown_response_type(self):
+        """정의되지 않은 response_type은 검증 실패"""
+        with pytest.raises(ValidationError):
+            ChatRequest(query="삼성전자", response_type="unknown")
@@ -26,6 +26,7 @@ class TestIntegration:
         assert data["status"] == "ok"
         assert data["service"] == "ai-service"
 
+    @patch("src.controllers.chat_controller._router", None)
     @patch("src.controllers.chat_controller.ModelRouterService")
     def test_chat_flow(self, mock_router_class, client):
         """전체 채팅 플로우 테스트"""
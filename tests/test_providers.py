@@ -84,3 +84,34 @@ class TestBaseProvider:
         """Provider 건강 상태 확인 테스트"""
         health = await mock_provider.health_check()
         assert isinstance(health, bool)
+
+
+class TestOllamaClient:
+    """OllamaClient NDJSON 파싱 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_iter_ndjson_handles_split_chunks(self):
+        """줄/UTF-8 경계에서 잘린 청크와 잘못된 줄, 마지막 개행 누락 처리"""
+        from src.models.ollama_client import _iter_ndjson
+
+        async def chunks():
+            yield '{"message":{"content":"삼'.encode("utf-8")[:-1]
+            yield '삼'.encode("utf-8")[-1:] + b'"}}\n\nnot-json\n{"done":'
+            yield b"true}"
+
+        parsed = [data async for data in _iter_ndjson(chunks())]
+
+        assert parsed == [{"message": {"content": "삼"}}, {"done": True}]
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_client_usable(self):
+        """close() 이후와 공유 클라이언트 종료 이후에도 요청 가능"""
+        from src.models.ollama_client import OllamaClient, close_client
+
+        client = OllamaClient(host="http://localhost:11434")
+        await client.close()
+        assert client.client is not None
+
+        await close_client()
+        assert not client.client.is_closed
+        await close_client()
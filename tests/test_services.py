@@ -7,8 +7,9 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from src.services.llm_service import LLMService
 from src.services.slm_service import SLMService
 from src.services.model_router import ModelRouterService
-from src.services.embedding_service import EmbeddingService
+from src.services.embedding_service import EmbeddingService, pack_batches
 from src.services.vector_search_service import VectorSearchService
+from src.utils.cache import SimpleCache
 
 
 class TestLLMService:
@@ -34,18 +35,38 @@ class TestLLMService:
     @pytest.mark.asyncio
     async def test_chat(self, mock_provider):
         """LLM 일반 채팅 테스트"""
+        # 모델별 provider 조회도 mock으로 (실제 Ollama provider 호출 방지)
         with patch(
-            "src.services.llm_service.ProviderFactory.get_default_provider",
+            "src.services.llm_service.ProviderFactory.get_provider",
             return_value=mock_provider,
         ):
-            service = LLMService()
+            service = LLMService(provider=mock_provider)
             response = await service.chat(
                 model="test-model",
                 messages=[{"role": "user", "content": "test"}],
             )
 
-            assert response is not None
-            assert isinstance(response, str)
+            assert response == "Test response"
+            mock_provider.chat.assert_awaited_once()
+
+    def test_provider_for_model_resolved_once(self, mock_provider):
+        """다른 provider는 한 번만 조회하고 이후에는 재사용"""
+        from src.models.llm_provider import LLMProvider
+
+        other = Mock()
+        with patch(
+            "src.services.llm_service.ProviderFactory.get_default_provider",
+            return_value=mock_provider,
+        ), patch(
+            "src.services.llm_service.ProviderFactory.get_provider",
+            return_value=other,
+        ) as mock_get_provider:
+            service = LLMService()
+            first = service._get_provider_for_model(LLMProvider.ANTHROPIC)
+            second = service._get_provider_for_model(LLMProvider.ANTHROPIC)
+
+        assert first is other and second is other
+        mock_get_provider.assert_called_once_with("claude")
 
 
 class TestSLMService:
@@ -100,6 +121,110 @@ class TestModelRouterService:
 
             assert response is not None
 
+    @pytest.mark.asyncio
+    async def test_classify_query_normalizes_cache_key(self):
+        """공백·대소문자만 다른 쿼리는 같은 분류 캐시 항목을 사용"""
+        from src.utils.cache import SimpleCache
+
+        router = ModelRouterService()
+        router.classification_cache = SimpleCache()
+        router.classifier = Mock()
+        router.classifier.classify = Mock(return_value={"complexity": "simple"})
+
+        await router._classify_query("PER이 뭐야?")
+        await router._classify_query("  per이   뭐야? ")
+
+        router.classifier.classify.assert_called_once_with("PER이 뭐야?")
+
+    @pytest.mark.asyncio
+    async def test_classify_served_from_local_cache(self):
+        """프로세스 내 캐시 히트 시 스레드/Redis 경로를 거치지 않음"""
+        router = ModelRouterService()
+        router._classify_query = AsyncMock(return_value={"complexity": "simple"})
+
+        first = await router._classify("PER이 뭐야?")
+        second = await router._classify("per이 뭐야?")
+
+        assert first == second == {"complexity": "simple"}
+        router._classify_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_classify_coalesces_concurrent_duplicates(self):
+        """동일 쿼리가 동시에 들어오면 분류는 한 번만 실행"""
+        import asyncio
+
+        async def slow_classify(query, cache_key=None):
+            await asyncio.sleep(0.05)
+            return {"complexity": "simple"}
+
+        router = ModelRouterService()
+        router._classify_query = AsyncMock(side_effect=slow_classify)
+
+        results = await asyncio.gather(*(router._classify("PER이 뭐야?") for _ in range(5)))
+
+        assert results == [{"complexity": "simple"}] * 5
+        router._classify_query.assert_awaited_once()
+        assert not router._inflight_classify
+
+    @pytest.mark.asyncio
+    async def test_classify_leader_cancel_does_not_cancel_waiters(self):
+        """첫 요청이 취소되어도 같은 쿼리를 기다리던 요청은 분류 결과를 받음"""
+        import asyncio
+
+        async def slow_classify(query, cache_key=None):
+            await asyncio.sleep(0.05)
+            return {"complexity": "simple"}
+
+        router = ModelRouterService()
+        router._classify_query = AsyncMock(side_effect=slow_classify)
+
+        leader = asyncio.create_task(router._classify("PER이 뭐야?"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(router._classify("PER이 뭐야?"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == {"complexity": "simple"}
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        router._classify_query.assert_awaited_once()
+        assert not router._inflight_classify
+
+    @pytest.mark.asyncio
+    async def test_find_mini_model_single_list_models_call(self):
+        """동시에 캐시 미스가 나도 list_models는 한 번만 호출"""
+        import asyncio
+
+        async def slow_list_models():
+            await asyncio.sleep(0.05)
+            return ["gpt-4o", "gpt-4o-mini"]
+
+        provider = Mock()
+        provider.list_models = AsyncMock(side_effect=slow_list_models)
+        provider.find_lightweight_model = Mock(return_value="gpt-4o-mini")
+
+        router = ModelRouterService()
+        with patch("src.config.env.EnvConfig.OPENAI_API_KEY", "sk-test"), patch(
+            "src.providers.ProviderFactory.get_provider", return_value=provider
+        ):
+            results = await asyncio.gather(
+                *(router._find_mini_model() for _ in range(5))
+            )
+
+        assert results == ["gpt-4o-mini"] * 5
+        provider.list_models.assert_awaited_once()
+
+    def test_lightweight_table_prefers_keyword_priority(self):
+        """provider별 경량 모델 테이블이 키워드 우선순위대로 구성"""
+        from src.models.llm_provider import LLMProvider
+        from src.services.model_router import _lightweight_by_provider
+
+        table = _lightweight_by_provider()
+
+        assert table[LLMProvider.OPENAI][1] == "gpt-4o-mini"
+        assert table[LLMProvider.ANTHROPIC][1] == "claude-3-haiku-20240307"
+        assert table[LLMProvider.OPENAI][0] < table[LLMProvider.ANTHROPIC][0]
+
 
 class TestEmbeddingService:
     """EmbeddingService 테스트"""
@@ -134,6 +259,58 @@ class TestEmbeddingService:
         assert len(embeddings) == 3
         assert all(len(emb) == 1536 for emb in embeddings)
 
+    @patch("src.services.embedding_service.AsyncOpenAI")
+    @patch("src.services.embedding_service.OpenAI")
+    @pytest.mark.asyncio
+    async def test_create_embeddings_batch_async_keeps_order(self, mock_openai, mock_async_openai):
+        """비동기 배치 임베딩이 동시 요청 후에도 입력 순서를 유지"""
+        async def create(model, input):
+            return Mock(data=[Mock(embedding=[float(text[-1])]) for text in input])
+
+        mock_async_client = Mock()
+        mock_async_client.embeddings.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value = mock_async_client
+
+        service = EmbeddingService()
+        service.cache = SimpleCache()
+        service.batch_size = 1
+        embeddings = await service.create_embeddings_batch_async(["text1", "text2", "text3"])
+
+        assert embeddings == [[1.0], [2.0], [3.0]]
+        assert mock_async_client.embeddings.create.await_count == 3
+
+    @patch("src.services.embedding_service.AsyncOpenAI")
+    @patch("src.services.embedding_service.OpenAI")
+    @pytest.mark.asyncio
+    async def test_create_embeddings_batch_async_dedups_and_caches(self, mock_openai, mock_async_openai):
+        """중복 텍스트는 한 번만 요청하고, 캐시된 텍스트는 다시 요청하지 않음"""
+        async def create(model, input):
+            return Mock(data=[Mock(embedding=[float(text[-1])]) for text in input])
+
+        mock_async_client = Mock()
+        mock_async_client.embeddings.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value = mock_async_client
+
+        service = EmbeddingService()
+        service.cache = SimpleCache()
+
+        first = await service.create_embeddings_batch_async(["text1", "text2", "text1"])
+        second = await service.create_embeddings_batch_async(["text2", "text1"])
+
+        assert first == [[1.0], [2.0], [1.0]]
+        assert second == [[2.0], [1.0]]
+        assert mock_async_client.embeddings.create.await_count == 1
+        assert mock_async_client.embeddings.create.await_args.kwargs["input"] == ["text1", "text2"]
+
+    def test_pack_batches_by_token_budget(self):
+        """토큰 예산/개수 한도 기준 배치 구성 테스트"""
+        texts = ["a", "b", "c", "d", "e"]
+        token_counts = [100, 100, 250, 10, 10]
+
+        batches = list(pack_batches(texts, token_counts, max_tokens=300, max_items=2))
+
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
 
 class TestVectorSearchService:
     """VectorSearchService 테스트"""
@@ -209,6 +386,36 @@ class TestIndexingService:
         assert len(chunks) > 0
         assert all(isinstance(chunk, str) for chunk in chunks)
 
+    @patch("src.services.indexing_service.EmbeddingService")
+    @patch("src.services.indexing_service.VectorSearchService")
+    def test_adaptive_chunk_no_double_period(self, mock_vector, mock_embedding):
+        """마침표로 끝나는 텍스트도 청크 끝에 마침표가 중복되지 않음"""
+        from src.services.indexing_service import IndexingService
+
+        service = IndexingService()
+
+        assert service._adaptive_chunk("문장 1. 문장 2.") == ["문장 1. 문장 2."]
+        assert service._adaptive_chunk("문장 1. 문장 2. ") == ["문장 1. 문장 2."]
+
+    @patch("src.services.indexing_service.EmbeddingService")
+    @patch("src.services.indexing_service.VectorSearchService")
+    @pytest.mark.asyncio
+    async def test_batch_index_news_skips_failures(self, mock_vector, mock_embedding):
+        """배치 인덱싱은 동시에 실행되고 실패한 뉴스만 결과에서 제외"""
+        from src.services.indexing_service import IndexingService
+
+        service = IndexingService()
+
+        async def index_news(news_data):
+            if news_data["id"] == "news_2":
+                raise RuntimeError("boom")
+            return [f"{news_data['id']}_chunk_0"]
+
+        with patch.object(service, "index_news", side_effect=index_news):
+            results = await service.batch_index_news([{"id": "news_1"}, {"id": "news_2"}, {"id": "news_3"}])
+
+        assert results == {"news_1": ["news_1_chunk_0"], "news_3": ["news_3_chunk_0"]}
+
     @patch("src.services.indexing_service.EmbeddingService")
     @patch("src.services.indexing_service.VectorSearchService")
     @pytest.mark.asyncio
@@ -218,10 +425,10 @@ class TestIndexingService:
 
         # Mock 설정
         mock_embedding_service = Mock()
-        mock_embedding_service.create_embeddings_batch = Mock(
+        mock_embedding_service.create_embeddings_batch_async = AsyncMock(
             return_value=[[0.1] * 1536, [0.2] * 1536]
         )
-        mock_embedding_service.create_embedding = Mock(return_value=[0.1] * 1536)
+        mock_embedding_service.create_embedding_async = AsyncMock(return_value=[0.1] * 1536)
 
         mock_vector_service = Mock()
         mock_vector_service.upsert = Mock()
@@ -247,4 +454,4 @@ class TestIndexingService:
             vector_ids = await service.index_news(news_data)
 
             # 배치 임베딩이 호출되었는지 확인 (청크가 2개 이상일 때)
-            assert mock_embedding_service.create_embeddings_batch.called
+            mock_embedding_service.create_embeddings_batch_async.assert_awaited_once()
@@ -0,0 +1,150 @@
+"""
+Cache 유틸리티 테스트
+"""
+
+import pickle
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.utils.cache import LocalLRUCache, RedisCache, hash_key
+
+
+class TestLocalLRUCache:
+    """LocalLRUCache 테스트"""
+
+    def test_set_and_get(self):
+        """저장 후 조회"""
+        cache = LocalLRUCache(maxsize=10, ttl=60)
+        cache.set("key", [0.1, 0.2])
+        assert cache.get("key") == [0.1, 0.2]
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = LocalLRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.size() == 2
+
+    def test_expires_after_ttl(self):
+        """TTL 경과 후 만료 (요청 TTL이 더 짧으면 그 값 적용)"""
+        cache = LocalLRUCache(maxsize=10, ttl=300)
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            cache.set("short", "v", ttl=10)
+            cache.set("long", "v", ttl=3600)
+
+        with patch("src.utils.cache.time.time", return_value=1011.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == "v"
+
+        with patch("src.utils.cache.time.time", return_value=1301.0):
+            assert cache.get("long") is None
+
+    def test_concurrent_access_from_threads(self):
+        """여러 스레드에서 동시에 조회/저장/제거해도 예외 없이 크기 제한 유지"""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = LocalLRUCache(maxsize=50, ttl=60)
+
+        def hammer(worker: int) -> None:
+            for i in range(20000):
+                key = f"k{(worker * 7 + i) % 200}"
+                cache.set(key, i, ttl=0 if i % 3 == 0 else None)  # 일부는 즉시 만료
+                cache.get(key)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # 스레드 전환을 자주 일으켜 경합 유발
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(hammer, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert cache.size() <= 50
+
+
+class TestHashKey:
+    """hash_key 테스트"""
+
+    def test_hash_key_is_deterministic(self):
+        """동일 입력은 동일 키, 다른 입력은 다른 키"""
+        assert hash_key("삼성전자 주가") == hash_key("삼성전자 주가")
+        assert hash_key("삼성전자 주가") != hash_key("애플 주가")
+
+
+class TestRedisCacheL1:
+    """RedisCache L1 (프로세스 내 캐시) 테스트"""
+
+    def test_hit_served_without_redis_round_trip(self):
+        """L1 사용 시 저장 직후 조회는 L1에서 새 리스트로 응답하고 Redis GET을 호출하지 않음"""
+        redis_cache = RedisCache(local=True)
+        redis_cache._client = Mock()
+        embedding = [0.1, -0.123456789012345]  # float32로 표현 불가능한 값도 그대로 보존
+        redis_cache.set("embedding:abc", embedding, ttl=3600)
+
+        first = redis_cache.get("embedding:abc")
+        first.append(1.0)  # 반환값을 수정해도 캐시에 영향 없음
+
+        assert redis_cache.get("embedding:abc") == embedding
+        redis_cache._client.get.assert_not_called()
+        redis_cache._client.setex.assert_called_once()
+
+    def test_l1_disabled_by_default(self):
+        """기본 인스턴스는 L1 없이 매번 Redis에서 조회"""
+        redis_cache = RedisCache()
+        redis_cache._client = Mock()
+        redis_cache._client.get = Mock(return_value=pickle.dumps({"page": 1}))
+        redis_cache.set("chat_history:u1", {"page": 1}, ttl=300)
+
+        assert redis_cache.get("chat_history:u1") == {"page": 1}
+        redis_cache._client.get.assert_called_once_with("chat_history:u1")
+
+    @pytest.mark.asyncio
+    async def test_async_get_fills_l1_with_remaining_ttl(self):
+        """L1 미스 시 GET과 TTL을 한 번에 조회하고, 남은 TTL까지만 L1에 보관"""
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=[pickle.dumps({"complexity": "simple"}), 20])
+        redis_cache = RedisCache(local=True)
+        redis_cache._client = Mock()
+        redis_cache._async_client = Mock()
+        redis_cache._async_client.pipeline = Mock(return_value=pipe)
+
+        assert await redis_cache.aget("v2:cls:abc") == {"complexity": "simple"}
+        assert await redis_cache.aget("v2:cls:abc") == {"complexity": "simple"}
+        pipe.execute.assert_awaited_once()
+        redis_cache._client.get.assert_not_called()
+        expires_at, _ = redis_cache._local._data["v2:cls:abc"]
+        assert expires_at <= time.time() + 20
+
+    def test_get_many_checks_l1_then_one_pipeline(self):
+        """일괄 조회는 L1 히트를 제외한 키만 한 번의 파이프라인으로 조회하고 L1을 채움"""
+        pipe = Mock()
+        pipe.execute = Mock(return_value=[pickle.dumps([0.2]), 600, None, -2])
+        redis_cache = RedisCache(local=True)
+        redis_cache._client = Mock()
+        redis_cache._client.pipeline = Mock(return_value=pipe)
+        redis_cache.set("embedding:a", [0.1], ttl=3600)
+
+        assert redis_cache.get_many(["embedding:a", "embedding:b", "embedding:c"]) == [[0.1], [0.2], None]
+        pipe.execute.assert_called_once()
+        assert [c.args[0] for c in pipe.get.call_args_list] == ["embedding:b", "embedding:c"]
+        assert redis_cache.get("embedding:b") == [0.2]
+        redis_cache._client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_get_many_uses_mget_without_l1(self):
+        """L1 미사용 시 비동기 일괄 조회는 MGET 한 번으로 처리"""
+        redis_cache = RedisCache()
+        redis_cache._client = Mock()
+        redis_cache._async_client = Mock()
+        redis_cache._async_client.mget = AsyncMock(return_value=[None, pickle.dumps({"page": 1})])
+
+        assert await redis_cache.aget_many(["k1", "k2"]) == [None, {"page": 1}]
+        redis_cache._async_client.mget.assert_awaited_once_with(["k1", "k2"])
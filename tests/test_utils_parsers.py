@@ -3,11 +3,14 @@ Parsers 테스트
 """
 
 import pytest
+from unittest.mock import patch
 from src.utils.parsers import (
     parse_news_for_indexing,
     parse_stock_for_indexing,
     parse_learning_for_indexing,
     chunk_text,
+    chunk_text_by_tokens,
+    count_tokens,
 )
 
 
@@ -69,3 +72,85 @@ class TestParsers:
         chunks = chunk_text("short text", chunk_size=100, overlap=10)
         assert len(chunks) == 1
         assert chunks[0] == "short text"
+
+    def test_chunk_text_by_tokens(self):
+        """토큰 경계 기준 청킹 테스트 (문자 단위 토크나이저로 대체)"""
+
+        class CharTokenizer:
+            def encode(self, text):
+                return [ord(c) for c in text]
+
+            def decode(self, tokens):
+                return "".join(chr(t) for t in tokens)
+
+        text = "".join(chr(ord("a") + i % 26) for i in range(250))
+        with patch("src.utils.parsers._TOKENIZER", CharTokenizer()):
+            chunks = chunk_text_by_tokens(text, max_tokens=100, overlap=0.2)
+
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert chunks[0] == text[:100]
+        assert chunks[1][:20] == chunks[0][-20:]  # 20% 오버랩
+        assert chunks[-1].endswith(text[-10:])
+
+    def test_chunk_text_by_tokens_without_tokenizer(self):
+        """토크나이저 미설치 시 문자 수 근사 청킹"""
+        with patch("src.utils.parsers._TOKENIZER", None):
+            chunks = chunk_text_by_tokens("short text", max_tokens=100)
+        assert chunks == ["short text"]
+
+    def test_chunk_text_by_tokens_fallback_fits_token_count(self):
+        """토크나이저 미설치 시 청크 길이가 count_tokens 기준 max_tokens 이하"""
+        text = "삼성전자 주가 전망 " * 100
+        with patch("src.utils.parsers._TOKENIZER", None):
+            chunks = chunk_text_by_tokens(text, max_tokens=100)
+            assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+
+    def test_chunk_text_by_tokens_keeps_trimmed_boundary_chars(self):
+        """경계에서 잘라낸 토큰은 다음 청크에 포함 (오버랩 0이어도 문자 손실 없음)"""
+
+        class ByteTokenizer:
+            def encode(self, text):
+                return list(text.encode("utf-8"))
+
+            def decode(self, tokens):
+                try:
+                    return bytes(tokens).decode("utf-8")
+                except UnicodeDecodeError:
+                    return None  # rs-bpe처럼 잘린 UTF-8 시퀀스는 None
+
+        text = "삼성전자주가전망" * 5
+        with patch("src.utils.parsers._TOKENIZER", ByteTokenizer()):
+            chunks = chunk_text_by_tokens(text, max_tokens=7, overlap=0.0)
+
+        assert "".join(chunks) == text
+        assert all(len(chunk.encode("utf-8")) <= 7 for chunk in chunks)
+
+    def test_chunk_text_by_tokens_real_tokenizer_korean_boundary(self):
+        """실제 rs-bpe 토크나이저: 한글 멀티바이트 문자가 잘리는 경계에서도 깨진 문자 없이 분할"""
+        from rs_bpe.bpe import openai as rs_bpe_openai  # requirements.txt 고정 버전 (설치 필수)
+
+        tokenizer = rs_bpe_openai.cl100k_base()
+        text = "삼성전자 주가 전망과 반도체 업황 분석 " * 20
+        tokens = tokenizer.encode(text)
+        # 토큰 경계가 한글 UTF-8 시퀀스 중간에 걸리면 decode가 None 반환 (_decode_tokens가 경계 조정)
+        assert any(tokenizer.decode(tokens[:end]) is None for end in range(1, 20))
+
+        with patch("src.utils.parsers._TOKENIZER", tokenizer):
+            assert count_tokens(text) == len(tokens)
+            chunks = chunk_text_by_tokens(text, max_tokens=7, overlap=0.0)
+
+        assert chunks
+        assert all(chunk in text for chunk in chunks)  # 대체 문자(U+FFFD) 없이 원문 그대로
+        assert all(tokenizer.count(chunk) <= 7 for chunk in chunks)
+
+    def test_count_tokens_uses_tokenizer(self):
+        """토크나이저 설치 시 실제 토큰 수 사용"""
+        tokenizer = type("Tokenizer", (), {"count": lambda self, text: 7})()
+        with patch("src.utils.parsers._TOKENIZER", tokenizer):
+            assert count_tokens("삼성전자 주가") == 7
+
+    def test_count_tokens_without_tokenizer(self):
+        """토크나이저 미설치 시 1문자 = 1토큰으로 보수적 계산 (한글 과소 추정 방지)"""
+        with patch("src.utils.parsers._TOKENIZER", None):
+            assert count_tokens("삼성전자 주가") == 7
+            assert count_tokens("") == 1